@@ -152,12 +152,12 @@ hiddenimports = [
     'services.camera_calibration', 'services.camera_utils', 'services.cleanup',
     'services.color_balance', 'services.web_output', 'services.rtsp_output',
     'services.discord_alerts', 'services.headless_runner', 'services.weather',
-    'services.ml_service', 'services.ascom_safety',
+    'services.ml_service', 'services.ascom_safety', 'services.img_backend',
     'ui', 'ui.main_window', 'ui.theme', 'ui.components', 'ui.panels',
     'ui.controllers', 'ui.system_tray_qt',
     
     # --- ML modules ---
-    'ml', 'ml.roof_classifier', 'ml.sky_classifier',
+    'ml', 'ml.roof_classifier', 'ml.sky_classifier', 'ml.ort_session',
     'onnxruntime',
 ] + fluent_hiddenimports + requests_hiddenimports + jaraco_hiddenimports + pystray_hiddenimports + platformdirs_hiddenimports + onnx_hiddenimports
 
@@ -5,7 +5,11 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import os
-from PIL import Image, ImageTk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import numpy as np
+from PIL import Image, ImageTk, ImageEnhance
 from config import Config
 from watcher import FileWatcher
 from zwo_camera import ZWOCamera
@@ -96,13 +100,23 @@ class AllSkyOverlayApp:
         self.overlay_frames = []
         self.last_processed_image = None
         
+        # Single writer for processed frames; at most 2 queued so a slow disk
+        # applies backpressure to the capture thread instead of piling up threads
+        self._disk_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='disk-writer')
+        self._disk_slots = threading.BoundedSemaphore(2)
+        
+        # Latest-wins slot for preview updates; stale frames are dropped
+        self._pending_preview_img = None
+        self._preview_scheduled = False
+        
         self.create_gui()
         self.load_config()
         
         # Start log polling
         self.poll_logs()
         
-        # Start status updates
+        # Start status updates (fragments refresh on change, counters on a slow timer)
+        self._bind_status_traces()
         self.update_status_header()
     
     def create_status_header(self):
@@ -331,6 +345,10 @@ class AllSkyOverlayApp:
         self.mini_log_text = scrolledtext.ScrolledText(right_frame, height=2, wrap=tk.WORD, font=('TkDefaultFont', 8))
         self.mini_log_text.pack(fill='both', expand=True)
         self.mini_log_text.config(state='disabled')
+        
+        # Last 10 log lines for the mini log (rewritten only when changed)
+        self._mini_lines = deque(maxlen=10)
+        self._last_mini_text = ''
     
     def create_overlays_tab(self):
         """Create Overlays tab"""
@@ -569,6 +587,7 @@ class AllSkyOverlayApp:
             
             self.start_watch_button.config(state='disabled')
             self.stop_watch_button.config(state='normal')
+            self._update_mode_label()
             app_logger.info("Started directory watching")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start watcher: {e}")
@@ -582,6 +601,7 @@ class AllSkyOverlayApp:
         
         self.start_watch_button.config(state='normal')
         self.stop_watch_button.config(state='disabled')
+        self._update_mode_label()
         app_logger.info("Stopped directory watching")
     
     def start_camera_capture(self):
@@ -631,6 +651,7 @@ class AllSkyOverlayApp:
             self.start_capture_button.config(state='disabled')
             self.stop_capture_button.config(state='normal')
             self.camera_status_var.set("Capturing...")
+            self._update_mode_label()
             app_logger.info("Started camera capture")
         else:
             messagebox.showerror("Error", "Failed to start capture")
@@ -643,15 +664,18 @@ class AllSkyOverlayApp:
         self.start_capture_button.config(state='normal')
         self.stop_capture_button.config(state='disabled')
         self.camera_status_var.set("Stopped")
+        self._update_mode_label()
         app_logger.info("Stopped camera capture")
     
     def on_camera_frame(self, img, metadata):
         """Called when a new frame is captured from camera"""
-        # Update mini preview and histogram immediately
-        self.root.after(0, lambda: self.update_mini_preview(img))
-        self.root.after(0, lambda: self.update_histogram(img))
+        # Update mini preview and histogram with the newest frame only
+        self._pending_preview_img = img
+        if not self._preview_scheduled:
+            self._preview_scheduled = True
+            self.root.after_idle(self._flush_preview)
         
-        # Process in background thread
+        # Process and write on the disk-writer thread
         def process():
             try:
                 success, output_path, error = process_image(img, self.config, metadata)
@@ -664,8 +688,25 @@ class AllSkyOverlayApp:
                     app_logger.error(f"Failed to process camera frame: {error}")
             except Exception as e:
                 app_logger.error(f"Error processing camera frame: {e}")
+            finally:
+                self._disk_slots.release()
         
-        threading.Thread(target=process, daemon=True).start()
+        self._disk_slots.acquire()
+        try:
+            self._disk_pool.submit(process)
+        except RuntimeError as e:
+            # Pool already shut down (window closing) - give the slot back
+            self._disk_slots.release()
+            app_logger.warning(f"Dropped camera frame: {e}")
+    
+    def _flush_preview(self):
+        """Render the most recent pending frame into the mini preview and histogram"""
+        img = self._pending_preview_img
+        self._pending_preview_img = None
+        self._preview_scheduled = False
+        if img is not None:
+            self.update_mini_preview(img)
+            self.update_histogram(img)
     
     def on_image_processed(self, image_path):
         """Called when watch mode processes an image"""
@@ -809,7 +850,6 @@ class AllSkyOverlayApp:
             # Apply brightness if auto brightness enabled (same as mini preview)
             if hasattr(self, 'auto_brightness_var') and self.auto_brightness_var.get():
                 if hasattr(self, 'brightness_var'):
-                    from PIL import ImageEnhance
                     brightness = self.brightness_var.get()
                     if brightness != 1.0:
                         enhancer = ImageEnhance.Brightness(img)
@@ -850,23 +890,21 @@ class AllSkyOverlayApp:
         if messages:
             # Update main logs tab
             self.log_text.config(state='normal')
-            for msg in messages:
-                self.log_text.insert('end', f"{msg}\n")
+            self.log_text.insert('end', '\n'.join(messages) + '\n')
             self.log_text.see('end')
             self.log_text.config(state='disabled')
             
             # Update mini log in camera tab (last 10 lines)
             if hasattr(self, 'mini_log_text'):
-                self.mini_log_text.config(state='normal')
-                for msg in messages:
-                    self.mini_log_text.insert(tk.END, msg + '\n')
-                # Keep only last 10 lines
-                lines = self.mini_log_text.get('1.0', tk.END).split('\n')
-                if len(lines) > 10:
+                self._mini_lines.extend(messages)
+                text = '\n'.join(self._mini_lines)
+                if text != self._last_mini_text:
+                    self.mini_log_text.config(state='normal')
                     self.mini_log_text.delete('1.0', tk.END)
-                    self.mini_log_text.insert('1.0', '\n'.join(lines[-11:]))
-                self.mini_log_text.see(tk.END)
-                self.mini_log_text.config(state='disabled')
+                    self.mini_log_text.insert('1.0', text)
+                    self.mini_log_text.see(tk.END)
+                    self.mini_log_text.config(state='disabled')
+                    self._last_mini_text = text
         
         # Schedule next poll
         self.root.after(1000, self.poll_logs)
@@ -877,7 +915,6 @@ class AllSkyOverlayApp:
             return
         
         try:
-            import numpy as np
             # Convert to numpy array
             img_array = np.array(img)
             
@@ -886,16 +923,23 @@ class AllSkyOverlayApp:
             width = 500
             height = 100
             
+            # Lay channels out as contiguous planes (3, H*W) once so each
+            # histogram pass walks linear memory instead of striding over HWC
+            if img_array.ndim == 3 and img_array.shape[2] >= 3:
+                planes = np.ascontiguousarray(img_array[:, :, :3].reshape(-1, 3).T)
+            else:
+                # Grayscale
+                gray = img_array if img_array.ndim == 2 else img_array[:, :, 0]
+                planes = (gray.ravel(),) * 3
+            
             # Calculate histograms for R, G, B
             colors = ['red', 'green', 'blue']
             for i, color in enumerate(colors):
-                if len(img_array.shape) == 3 and img_array.shape[2] >= 3:
-                    channel = img_array[:, :, i]
+                channel = planes[i]
+                if channel.dtype == np.uint8:
+                    hist = np.bincount(channel, minlength=256)
                 else:
-                    # Grayscale
-                    channel = img_array if len(img_array.shape) == 2 else img_array[:, :, 0]
-                
-                hist, bins = np.histogram(channel, bins=256, range=(0, 256))
+                    hist, bins = np.histogram(channel, bins=256, range=(0, 256))
                 # Normalize
                 hist = hist / hist.max() if hist.max() > 0 else hist
                 
@@ -917,21 +961,23 @@ class AllSkyOverlayApp:
             return
         
         try:
-            from PIL import ImageTk, ImageEnhance
-            # Store original for brightness adjustment
-            self.last_captured_image = img.copy()
+            # Keep original for brightness adjustment; nothing mutates it in place
+            self.last_captured_image = img
+            
+            # Resize to fit mini preview (200x200 for header). resize() returns a
+            # new image, unlike thumbnail(), so the shared frame is left untouched
+            width, height = img.size
+            scale = min(200 / width, 200 / height, 1.0)
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            img_adjusted = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
             
             # Apply brightness adjustment if auto brightness enabled
-            img_adjusted = img.copy()
             if self.auto_brightness_var.get():
                 brightness = self.brightness_var.get()
                 if brightness != 1.0:
                     enhancer = ImageEnhance.Brightness(img_adjusted)
                     img_adjusted = enhancer.enhance(brightness)
             
-            # Resize to fit mini preview (200x200 for header)
-            img_adjusted.thumbnail((200, 200), Image.Resampling.LANCZOS)
-            
             # Convert to PhotoImage
             photo = ImageTk.PhotoImage(img_adjusted)
             self.mini_preview_label.config(image=photo, text='')
@@ -963,51 +1009,97 @@ class AllSkyOverlayApp:
         if hasattr(self, 'last_captured_image') and self.last_captured_image is not None:
             self.update_mini_preview(self.last_captured_image)
     
+    def _bind_status_traces(self):
+        """Refresh status header fragments when their source variables change"""
+        self._camera_name_cached = 'N/A'
+        self._watch_basename_cached = ''
+        self._cache_camera_name()
+        self._cache_watch_basename()
+        
+        for var in (self.capture_mode_var, self.watch_dir_var, self.camera_list_var,
+                    self.exposure_var, self.gain_var):
+            var.trace_add('write', lambda *args: self._update_mode_label())
+        
+        # Tcl fires the newest trace first - add the caches last so they
+        # refresh before _update_mode_label reads them
+        self.camera_list_var.trace_add('write', lambda *args: self._cache_camera_name())
+        self.watch_dir_var.trace_add('write', lambda *args: self._cache_watch_basename())
+        for var in (self.output_dir_var, self.output_format_var, self.resize_percent_var):
+            var.trace_add('write', lambda *args: self._update_settings_label())
+        for var in (self.cleanup_enabled_var, self.cleanup_size_var):
+            var.trace_add('write', lambda *args: self._update_cleanup_label())
+    
+    def _cache_camera_name(self):
+        """Parse the display name out of the '<index>: <name>' combo selection"""
+        selection = self.camera_list_var.get()
+        self._camera_name_cached = selection.split(':', 1)[1].strip() if ':' in selection else 'N/A'
+    
+    def _cache_watch_basename(self):
+        """Cache the watch directory basename shown in the status header"""
+        self._watch_basename_cached = os.path.basename(self.watch_dir_var.get())
+    
+    def _update_mode_label(self):
+        """Update mode and capture info in the status header"""
+        try:
+            mode = self.capture_mode_var.get()
+            if self.watcher or (self.zwo_camera and self.zwo_camera.is_capturing):
+                status = "Running"
+                if mode == 'watch':
+                    self.mode_status_var.set(f"Mode: Directory Watch - {status}")
+                    self.capture_info_var.set(f"Watching: {self._watch_basename_cached or 'N/A'}")
+                else:
+                    self.mode_status_var.set(f"Mode: ZWO Camera - {status}")
+                    exp = self.exposure_var.get()
+                    gain = self.gain_var.get()
+                    self.capture_info_var.set(f"Camera: {self._camera_name_cached} | Exp: {exp}s | Gain: {gain}")
+            else:
+                self.mode_status_var.set(f"Mode: {mode.title()} - Idle")
+                self.capture_info_var.set("Not capturing")
+        except tk.TclError:
+            # Entry is mid-edit and holds a non-numeric value
+            pass
+    
+    def _update_settings_label(self):
+        """Update output settings info in the status header"""
+        try:
+            output_dir = self.output_dir_var.get()
+            if output_dir:
+                format_str = self.output_format_var.get()
+                resize = self.resize_percent_var.get()
+                self.settings_info_var.set(f"Output: {format_str} @ {resize}% → {os.path.basename(output_dir)}")
+            else:
+                self.settings_info_var.set("Output: Not configured")
+        except tk.TclError:
+            pass
+    
+    def _update_cleanup_label(self):
+        """Update cleanup info in the status header"""
+        try:
+            if self.cleanup_enabled_var.get():
+                size = self.cleanup_size_var.get()
+                self.cleanup_info_var.set(f"Cleanup: Enabled ({size} GB limit)")
+            else:
+                self.cleanup_info_var.set("Cleanup: Disabled")
+        except tk.TclError:
+            pass
+    
     def update_status_header(self):
         """Update the status header with current information"""
-        # Mode and status
-        mode = self.capture_mode_var.get()
-        if self.watcher or (self.zwo_camera and self.zwo_camera.is_capturing):
-            status = "Running"
-            if mode == 'watch':
-                self.mode_status_var.set(f"Mode: Directory Watch - {status}")
-                self.capture_info_var.set(f"Watching: {os.path.basename(self.watch_dir_var.get()) if self.watch_dir_var.get() else 'N/A'}")
-            else:
-                self.mode_status_var.set(f"Mode: ZWO Camera - {status}")
-                camera_name = self.camera_combo.get().split(':')[1].strip() if ':' in self.camera_combo.get() else 'N/A'
-                exp = self.exposure_var.get()
-                gain = self.gain_var.get()
-                self.capture_info_var.set(f"Camera: {camera_name} | Exp: {exp}s | Gain: {gain}")
-        else:
-            self.mode_status_var.set(f"Mode: {mode.title()} - Idle")
-            self.capture_info_var.set("Not capturing")
+        # Mode, settings and cleanup are also refreshed by variable traces;
+        # the slow timer catches running state changes made by worker threads
+        self._update_mode_label()
+        self._update_settings_label()
+        self._update_cleanup_label()
         
         # Session info
-        from datetime import datetime
         session = datetime.now().strftime('%Y-%m-%d')
         self.session_info_var.set(f"Session: {session}")
         
-        # Stats
+        # Stats (image_count is incremented from worker threads)
         self.stats_var.set(f"Images Processed: {self.image_count}")
         
-        # Settings info
-        output_dir = self.output_dir_var.get()
-        if output_dir:
-            format_str = self.output_format_var.get()
-            resize = self.resize_percent_var.get()
-            self.settings_info_var.set(f"Output: {format_str} @ {resize}% → {os.path.basename(output_dir)}")
-        else:
-            self.settings_info_var.set("Output: Not configured")
-        
-        # Cleanup info
-        if self.cleanup_enabled_var.get():
-            size = self.cleanup_size_var.get()
-            self.cleanup_info_var.set(f"Cleanup: Enabled ({size} GB limit)")
-        else:
-            self.cleanup_info_var.set("Cleanup: Disabled")
-        
         # Schedule next update
-        self.root.after(1000, self.update_status_header)
+        self.root.after(5000, self.update_status_header)
     
     def on_closing(self):
         """Handle window close event"""
@@ -1016,6 +1108,7 @@ class AllSkyOverlayApp:
         if self.zwo_camera:
             self.zwo_camera.stop_capture()
             self.zwo_camera.disconnect_camera()
+        self._disk_pool.shutdown(wait=False)
         self.root.destroy()
 
 
@@ -19,7 +19,7 @@ from services.rtsp_output import RTSPStreamServer
 
 from .header import StatusHeader, LiveMonitoringHeader
 from .capture_tab import CaptureTab
-from .settings_tab import SettingsTab
+from .settings_tab import SettingsTab, start_ffmpeg_probe
 from .overlay_tab import OverlayTab
 from .preview_tab import PreviewTab
 from .logs_tab import LogsTab
@@ -74,6 +74,9 @@ class ModernOverlayApp:
             # Icon is optional, don't fail if it's missing
             pass
         
+        # Probe for ffmpeg (RTSP support) in the background while the UI builds
+        start_ffmpeg_probe()
+        
         # Load config
         self.config = Config()
         
@@ -859,7 +862,7 @@ Supports:
                 messagebox.showerror("Error", "Failed to download weather icon.")
                 return
             
-            overlays = self.overlay_manager.get_overlays_config()
+            overlays = list(self.overlay_manager.get_overlays_config())  # copy-on-write
             
             # Create text label overlay "Weather Conditions:"
             from .overlays.constants import DEFAULT_TEXT_OVERLAY
@@ -888,13 +891,9 @@ Supports:
             overlays.append(text_overlay)
             overlays.append(icon_overlay)
             self.config.set('overlays', overlays)
-            self.overlay_manager.rebuild_overlay_list()
             
-            # Select the icon overlay (last added)
-            new_index = len(overlays) - 1
-            self.overlay_tree.selection_set(str(new_index))
-            self.selected_overlay_index = new_index
-            self.overlay_manager.load_overlay_into_editor(icon_overlay)
+            # Rebuild with the icon overlay (last added) selected and loaded
+            self.overlay_manager.rebuild_overlay_list(select_index=len(overlays) - 1)
             
             messagebox.showinfo("Success", "Weather overlays added!\n\n"
                               "Added:\n"
@@ -52,20 +52,20 @@ class OutputManager:
         # Hide copy button by default
         self.app.output_mode_copy_btn.pack_forget()
         
-        # Hide all mode-specific frames first
-        self.app.file_frame.pack_forget()
-        self.app.webserver_frame.pack_forget()
-        self.app.rtsp_frame.pack_forget()
+        # Hide all mode-specific frames first (webserver/RTSP frames are built lazily)
+        for frame in (self.app.file_frame, self.app.webserver_frame, self.app.rtsp_frame):
+            if frame is not None:
+                frame.pack_forget()
         
         # Show the appropriate frame for selected mode
         if mode == 'file':
             self.app.file_frame.pack(fill='x', pady=(0, SPACING['section_gap']))
             self.app.output_mode_status_var.set("Mode: File (Saving to output directory)")
         elif mode == 'webserver':
-            self.app.webserver_frame.pack(fill='x', pady=(0, SPACING['section_gap']))
+            self.app.settings_tab.ensure_webserver_frame().pack(fill='x', pady=(0, SPACING['section_gap']))
             self._start_web_server()
         elif mode == 'rtsp':
-            self.app.rtsp_frame.pack(fill='x', pady=(0, SPACING['section_gap']))
+            self.app.settings_tab.ensure_rtsp_frame().pack(fill='x', pady=(0, SPACING['section_gap']))
             self._start_rtsp_server()
     
     def _start_web_server(self):
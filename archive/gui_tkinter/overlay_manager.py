@@ -2,50 +2,240 @@
 Overlay management module
 Handles all overlay-related operations
 """
+import re
+import uuid
 import tkinter as tk
+from functools import lru_cache
 import ttkbootstrap as ttk
 from tkinter import messagebox
 from services.logger import app_logger
 from .theme import SPACING
+from .overlays.constants import (TOKENS_MAP, LOCALE_FORMATS, DATETIME_FORMATS,
+                                 DEFAULT_TEXT_OVERLAY, DEFAULT_IMAGE_OVERLAY)
+
+
+# Case-insensitive match for the {DATETIME} token (avoids upper-casing the text)
+_DATETIME_TOKEN_RE = re.compile(r'\{datetime\}', re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _resolve_datetime_format(mode, locale=None):
+    """Resolve strftime format for a datetime mode and optional locale preset"""
+    if locale is None:
+        return DATETIME_FORMATS.get(mode, '%Y-%m-%d %H:%M:%S')
+    
+    # Use locale-specific formats
+    locale_data = LOCALE_FORMATS.get(locale, {'date': '%Y-%m-%d', 'time': '%H:%M:%S', 'datetime': '%Y-%m-%d %H:%M:%S'})
+    if mode == 'date':
+        return locale_data['date']
+    elif mode == 'time':
+        return locale_data['time']
+    else:  # full
+        return locale_data['datetime']
 
 
 class OverlayManager:
     """Manages overlay configuration and editing"""
     
+    # Delay before overlay edits are written to disk; bursts of edits coalesce
+    CONFIG_FLUSH_DELAY_MS = 500
+    # Delay before the overlay preview re-renders after an editor change
+    PREVIEW_DEBOUNCE_MS = 30
+    
+    # Overlay field -> editor variable on the app. Writes are traced so apply
+    # only reads back (Tcl round-trip) the fields edited since the last load
+    EDITOR_FIELD_VARS = {
+        'name': 'overlay_name_var',
+        'anchor': 'anchor_var',
+        'offset_x': 'offset_x_var',
+        'offset_y': 'offset_y_var',
+        'image_path': 'overlay_image_path_var',
+        'width': 'overlay_image_width_var',
+        'height': 'overlay_image_height_var',
+        'maintain_aspect': 'overlay_image_maintain_aspect_var',
+        'opacity': 'overlay_image_opacity_var',
+        'color': 'color_var',
+        'font_size': 'font_size_var',
+        'font_style': 'font_style_var',
+        'datetime_mode': 'datetime_mode_var',
+        'datetime_format': 'datetime_custom_var',
+        'datetime_locale': 'datetime_locale_var',
+        'background_enabled': 'background_enabled_var',
+        'background_color': 'bg_color_var',
+    }
+    
     def __init__(self, app):
         self.app = app
+        self._config_dirty = False
+        self._flush_job = None
+        self._preview_job = None
+        self._dt_section_packed = False  # datetime_section_frame starts unpacked
+        self._loading = False  # True while load_overlay_into_editor populates fields
+        self._row_cache = {}  # iid -> (overlay dict, (name, type, summary)) last rendered
+        self._dirty_fields = set()  # Overlay fields edited since the last load/apply
+        self._last_loaded = None  # Overlay dict currently shown in the editor
+        
+        # UI capabilities - the widgets are built before the manager and never change
+        self._has_overlays_tab = hasattr(app, 'overlays_tab')
+        self._has_preview_canvas = hasattr(app, 'overlay_preview_canvas')
+        self._has_image_editor = hasattr(app, 'overlay_image_path_var')
+        self._has_overlay_text = hasattr(app, 'overlay_text')
+        self._has_locale = hasattr(app, 'datetime_locale_var')
+        self._has_dt_custom = hasattr(app, 'datetime_custom_frame')
+        self._has_dt_section = hasattr(app, 'datetime_section_frame')
+        self._has_token_picker = hasattr(app, 'token_display_var')
+        
+        # Text-overlay apply specialized once for the editor layout
+        self._apply_text_impl = (self._apply_text_with_locale if self._has_locale
+                                 else self._apply_text_without_locale)
+        
+        self._bind_dirty_traces()
+    
+    def _bind_dirty_traces(self):
+        """Record which overlay fields the user edits"""
+        for field, attr in self.EDITOR_FIELD_VARS.items():
+            var = getattr(self.app, attr, None)
+            if var is not None:
+                var.trace_add('write', lambda *args, f=field: self._mark_dirty(f))
+    
+    def _mark_dirty(self, field):
+        """Trace callback: flag a field as edited (ignored while loading)"""
+        if not self._loading:
+            self._dirty_fields.add(field)
+    
+    def _editor_value(self, field, current_overlay, default=None):
+        """Read a field from the editor if edited, else reuse the stored value"""
+        if field in self._dirty_fields or field not in current_overlay:
+            var = getattr(self.app, self.EDITOR_FIELD_VARS[field], None)
+            return var.get() if var is not None else default
+        return current_overlay[field]
+    
+    def _set_overlays(self, overlays):
+        """Store overlays in memory and schedule a single deferred config write"""
+        self.app.config.set('overlays', overlays)
+        self._config_dirty = True
+        if self._flush_job is not None:
+            self.app.root.after_cancel(self._flush_job)
+        self._flush_job = self.app.root.after(self.CONFIG_FLUSH_DELAY_MS, self.flush_config)
+    
+    def flush_config(self):
+        """Write pending overlay changes to disk (no-op when nothing changed)"""
+        if self._flush_job is not None:
+            try:
+                self.app.root.after_cancel(self._flush_job)
+            except Exception:
+                pass
+            self._flush_job = None
+        
+        if self._config_dirty:
+            self._config_dirty = False
+            if not self.app.config.save_async():
+                app_logger.error("Failed to save overlay changes")
     
     def get_overlays_config(self):
-        """Get current overlays configuration"""
+        """Get current overlays configuration
+        
+        Returns the stored list without copying. Treat it as read-only: writers
+        take a copy and replace it via _set_overlays, so a reference handed to
+        the processing thread is never mutated underneath it.
+        """
         return self.app.config.get('overlays', [])
     
-    def rebuild_overlay_list(self):
-        """Rebuild the overlay list UI (Treeview)"""
-        # Clear existing tree items
-        for item in self.app.overlay_tree.get_children():
-            self.app.overlay_tree.delete(item)
+    def _ensure_overlay_ids(self, overlays):
+        """Give every overlay a unique stable 'id', used as its Treeview iid"""
+        seen = set()
+        result = []
+        for overlay in overlays:
+            overlay_id = overlay.get('id')
+            if not overlay_id or overlay_id in seen:
+                overlay = dict(overlay, id=uuid.uuid4().hex)
+            seen.add(overlay['id'])
+            result.append(overlay)
         
-        # Get overlays
-        overlays = self.get_overlays_config()
+        if any(new is not old for new, old in zip(result, overlays)):
+            self.app.config.set('overlays', result)
+        return result
+    
+    def _render_row(self, overlay):
+        """Insert or update a single overlay row in the Treeview (appends new rows)"""
+        iid = overlay['id']
+        cached = self._row_cache.get(iid)
         
-        # Populate tree
-        for i, overlay in enumerate(overlays):
-            name = overlay.get('name', overlay.get('text', 'Overlay')[:20])
-            overlay_type = overlay.get('type', 'text').capitalize()
-            summary = overlay.get('anchor', 'Bottom-Left')
-            
-            self.app.overlay_tree.insert('', 'end', iid=str(i),
+        # Overlay dicts are replaced rather than mutated (copy-on-write), so an
+        # identical object means the row already shows its content
+        if cached is not None and cached[0] is overlay:
+            return
+        
+        name = overlay.get('name', overlay.get('text', 'Overlay')[:20])
+        overlay_type = overlay.get('type', 'text').capitalize()
+        summary = overlay.get('anchor', 'Bottom-Left')
+        row = (name, overlay_type, summary)
+        
+        if cached is not None:
+            if cached[1] != row:
+                self.app.overlay_tree.item(iid, text=name, values=(overlay_type, summary))
+        else:
+            self.app.overlay_tree.insert('', 'end', iid=iid,
                                          text=name,
                                          values=(overlay_type, summary))
+        self._row_cache[iid] = (overlay, row)
+    
+    def rebuild_overlay_list(self, select_index=0):
+        """Rebuild the overlay list UI (Treeview)
+        
+        Only used for bulk changes (load, clear, presets); edits, adds, duplicates
+        and deletes patch single rows keyed by the overlay's stable id. select_index
+        picks the row to select and load afterwards (clamped to the list length).
+        """
+        tree = self.app.overlay_tree
+        
+        # Detach the tree while it is refilled so Tk lays it out once, not per insert
+        repack = self._detach_widget(tree)
+        try:
+            # Clear existing tree items
+            tree.delete(*tree.get_children())
+            self._row_cache.clear()
+            
+            # Get overlays (configs from older versions may lack ids)
+            overlays = self._ensure_overlay_ids(self.get_overlays_config())
+            
+            # Populate tree
+            for overlay in overlays:
+                self._render_row(overlay)
+        finally:
+            repack()
         
-        # Select first if available
+        self._select_overlay(overlays, select_index)
+    
+    @staticmethod
+    def _detach_widget(widget):
+        """pack_forget a packed widget; returns a callable that re-packs it in place"""
+        if widget.winfo_manager() != 'pack':
+            return lambda: None
+        
+        pack_info = widget.pack_info()
+        siblings = widget.master.pack_slaves()
+        index = siblings.index(widget)
+        if index + 1 < len(siblings):
+            # Keep packing order (e.g. tree before its scrollbar)
+            pack_info.pop('in', None)
+            pack_info['before'] = siblings[index + 1]
+        widget.pack_forget()
+        return lambda: widget.pack(**pack_info)
+    
+    def _select_overlay(self, overlays, index):
+        """Select and load the overlay at index (clamped), or clear the preview"""
         if overlays:
-            self.app.overlay_tree.selection_set('0')
-            self.app.selected_overlay_index = 0
-            self.load_overlay_into_editor(overlays[0])
+            index = min(max(index, 0), len(overlays) - 1)
+            self.app.overlay_tree.selection_set(overlays[index]['id'])
+            if self._is_loaded(index, overlays[index]):
+                return  # Editor already shows this overlay
+            self.app.selected_overlay_index = index
+            self.load_overlay_into_editor(overlays[index])
         else:
+            self._last_loaded = None
             # No overlays - clear preview
-            if hasattr(self.app, 'overlay_preview_canvas'):
+            if self._has_preview_canvas:
                 self.app.overlay_preview_canvas.delete('all')
     
     def on_overlay_tree_select(self, event=None):
@@ -54,101 +244,119 @@ class OverlayManager:
         if not selection:
             return
         
-        # Get selected index
+        # Get selected index (row order matches the overlays list)
         item_id = selection[0]
-        self.app.selected_overlay_index = int(item_id)
+        index = self.app.overlay_tree.index(item_id)
         
-        # Load overlay
+        # Load overlay (skip re-selection of the overlay already in the editor)
         overlays = self.get_overlays_config()
-        if 0 <= self.app.selected_overlay_index < len(overlays):
-            self.load_overlay_into_editor(overlays[self.app.selected_overlay_index])
+        if 0 <= index < len(overlays):
+            if self._is_loaded(index, overlays[index]):
+                return
+            self.app.selected_overlay_index = index
+            self.load_overlay_into_editor(overlays[index])
+        else:
+            self.app.selected_overlay_index = index
+    
+    def _is_loaded(self, index, overlay):
+        """True if overlay (by identity) at index is already loaded in the editor"""
+        return self.app.selected_overlay_index == index and overlay is self._last_loaded
     
     def load_overlay_into_editor(self, overlay):
         """Load overlay data into editor"""
-        overlay_type = overlay.get('type', 'text')
-        
-        # Switch editor UI based on type
-        if hasattr(self.app, 'overlays_tab'):
-            self.app.overlays_tab.switch_editor(overlay_type)
-        
-        # Load common fields
-        self.app.overlay_name_var.set(overlay.get('name', overlay.get('text', '')[:30]))
-        self.app.anchor_var.set(overlay.get('anchor', 'Bottom-Left'))
-        self.app.offset_x_var.set(overlay.get('offset_x', 10))
-        self.app.offset_y_var.set(overlay.get('offset_y', 10))
-        
-        if overlay_type == 'image':
-            # Load image-specific fields
-            if hasattr(self.app, 'overlay_image_path_var'):
-                self.app.overlay_image_path_var.set(overlay.get('image_path', ''))
-            if hasattr(self.app, 'overlay_image_width_var'):
-                self.app.overlay_image_width_var.set(overlay.get('width', 200))
-            if hasattr(self.app, 'overlay_image_height_var'):
-                self.app.overlay_image_height_var.set(overlay.get('height', 200))
-            if hasattr(self.app, 'overlay_image_maintain_aspect_var'):
-                self.app.overlay_image_maintain_aspect_var.set(overlay.get('maintain_aspect', True))
-            if hasattr(self.app, 'overlay_image_opacity_var'):
-                self.app.overlay_image_opacity_var.set(overlay.get('opacity', 100))
-        else:
-            # Load text-specific fields
-            self.app.overlay_text.delete('1.0', 'end')
-            self.app.overlay_text.insert('1.0', overlay.get('text', ''))
+        # Variable traces route to on_overlay_edit; suppress them while the
+        # fields are populated and render a single preview afterwards
+        self._loading = True
+        try:
+            overlay_type = overlay.get('type', 'text')
+            
+            # Switch editor UI based on type
+            if self._has_overlays_tab:
+                self.app.overlays_tab.switch_editor(overlay_type)
             
-            # Datetime format (default to 'full')
-            self.app.datetime_mode_var.set(overlay.get('datetime_mode', 'full'))
-            self.app.datetime_custom_var.set(overlay.get('datetime_format', '%Y-%m-%d %H:%M:%S'))
-            if hasattr(self.app, 'datetime_locale_var'):
-                self.app.datetime_locale_var.set(overlay.get('datetime_locale', 'ISO (YYYY-MM-DD)'))
+            # Load common fields
+            self.app.overlay_name_var.set(overlay.get('name', overlay.get('text', '')[:30]))
+            self.app.anchor_var.set(overlay.get('anchor', 'Bottom-Left'))
+            self.app.offset_x_var.set(overlay.get('offset_x', 10))
+            self.app.offset_y_var.set(overlay.get('offset_y', 10))
+            
+            if overlay_type == 'image':
+                # Load image-specific fields
+                if self._has_image_editor:
+                    self.app.overlay_image_path_var.set(overlay.get('image_path', ''))
+                    self.app.overlay_image_width_var.set(overlay.get('width', 200))
+                    self.app.overlay_image_height_var.set(overlay.get('height', 200))
+                    self.app.overlay_image_maintain_aspect_var.set(overlay.get('maintain_aspect', True))
+                    self.app.overlay_image_opacity_var.set(overlay.get('opacity', 100))
+            else:
+                # Load text-specific fields
+                self.app.overlay_text.delete('1.0', 'end')
+                self.app.overlay_text.insert('1.0', overlay.get('text', ''))
             
-            # Font appearance
-            self.app.font_size_var.set(overlay.get('font_size', 24))
-            self.app.color_var.set(overlay.get('color', 'white'))
-            self.app.font_style_var.set(overlay.get('font_style', 'normal'))
+                # Datetime format (default to 'full')
+                self.app.datetime_mode_var.set(overlay.get('datetime_mode', 'full'))
+                self.app.datetime_custom_var.set(overlay.get('datetime_format', '%Y-%m-%d %H:%M:%S'))
+                if self._has_locale:
+                    self.app.datetime_locale_var.set(overlay.get('datetime_locale', 'ISO (YYYY-MM-DD)'))
             
-            # Background
-            self.app.background_enabled_var.set(overlay.get('background_enabled', False))
-            self.app.bg_color_var.set(overlay.get('background_color', 'black'))
-            self.on_background_toggle()  # Update UI state
+                # Font appearance
+                self.app.font_size_var.set(overlay.get('font_size', 24))
+                self.app.color_var.set(overlay.get('color', 'white'))
+                self.app.font_style_var.set(overlay.get('font_style', 'normal'))
             
-            # Check if datetime section should be visible
-            text_content = overlay.get('text', '')
-            self.update_datetime_visibility('{DATETIME}' in text_content.upper())
+                # Background
+                self.app.background_enabled_var.set(overlay.get('background_enabled', False))
+                self.app.bg_color_var.set(overlay.get('background_color', 'black'))
+                self.on_background_toggle()  # Update UI state
+            
+                # Check if datetime section should be visible
+                text_content = overlay.get('text', '')
+                self.update_datetime_visibility(bool(_DATETIME_TOKEN_RE.search(text_content)))
+        finally:
+            self._loading = False
+            self._dirty_fields.clear()
+        self._last_loaded = overlay
         
         # Update preview with loaded overlay (delayed to allow UI to update)
         # Increased delay to ensure Text widget is fully updated
-        self.app.root.after(100, lambda: self.app.image_processor.update_overlay_preview())
+        if self._preview_job is not None:
+            self.app.root.after_cancel(self._preview_job)
+        self._preview_job = self.app.root.after(100, self._do_preview)
     
     def add_new_overlay(self, overlay_type='text'):
         """Add new overlay with specified type"""
-        from .overlays.constants import DEFAULT_TEXT_OVERLAY, DEFAULT_IMAGE_OVERLAY
-        
-        overlays = self.get_overlays_config()
+        overlays = list(self.get_overlays_config())  # copy-on-write
         
         if overlay_type == 'image':
             new_overlay = DEFAULT_IMAGE_OVERLAY.copy()
+            new_overlay['id'] = uuid.uuid4().hex
             new_overlay['name'] = f'Image {len([o for o in overlays if o.get("type") == "image"]) + 1}'
         else:
             new_overlay = DEFAULT_TEXT_OVERLAY.copy()
+            new_overlay['id'] = uuid.uuid4().hex
             new_overlay['name'] = f'Overlay {len(overlays) + 1}'
         
         overlays.append(new_overlay)
-        self.app.config.set('overlays', overlays)
-        self.rebuild_overlay_list()
+        self._set_overlays(overlays)
         
-        # Select the new overlay
-        new_index = len(overlays) - 1
-        self.app.overlay_tree.selection_set(str(new_index))
-        self.app.selected_overlay_index = new_index
+        # Append only the new row and select it
+        self._render_row(new_overlay)
+        self.app.overlay_tree.selection_set(new_overlay['id'])
+        self.app.selected_overlay_index = len(overlays) - 1
     
     def duplicate_overlay(self):
         """Duplicate selected overlay"""
         if self.app.selected_overlay_index is not None:
-            overlays = self.get_overlays_config()
+            overlays = list(self.get_overlays_config())  # copy-on-write
             if 0 <= self.app.selected_overlay_index < len(overlays):
-                overlay_copy = overlays[self.app.selected_overlay_index].copy()
+                overlay_copy = dict(overlays[self.app.selected_overlay_index], id=uuid.uuid4().hex)
                 overlays.append(overlay_copy)
-                self.app.config.set('overlays', overlays)
-                self.rebuild_overlay_list()
+                self._set_overlays(overlays)
+                
+                # Append only the copied row and select it
+                self._render_row(overlay_copy)
+                self.app.overlay_tree.selection_set(overlay_copy['id'])
+                self.app.selected_overlay_index = len(overlays) - 1
     
     def delete_overlay(self):
         """Delete selected overlay"""
@@ -156,20 +364,27 @@ class OverlayManager:
             return
         
         if messagebox.askyesno("Confirm", "Delete this overlay?"):
-            overlays = self.get_overlays_config()
+            overlays = list(self.get_overlays_config())  # copy-on-write
             if 0 <= self.app.selected_overlay_index < len(overlays):
-                overlays.pop(self.app.selected_overlay_index)
-                self.app.config.set('overlays', overlays)
+                deleted_index = self.app.selected_overlay_index
+                deleted = overlays.pop(deleted_index)
+                self._set_overlays(overlays)
                 self.app.selected_overlay_index = None
-                self.rebuild_overlay_list()
+                
+                # Stable iids: remove just this row, other rows keep their ids
+                self.app.overlay_tree.delete(deleted['id'])
+                self._row_cache.pop(deleted['id'], None)
+                
+                # Keep selection at the same position rather than jumping to the top
+                self._select_overlay(overlays, deleted_index)
     
     def clear_all_overlays(self):
         """Clear all overlays"""
         if messagebox.askyesno("Confirm", "Delete ALL overlays?"):
-            self.app.config.set('overlays', [])
+            self._set_overlays([])
             self.app.selected_overlay_index = None
             self.rebuild_overlay_list()
-            if hasattr(self.app, 'overlay_preview_canvas'):
+            if self._has_preview_canvas:
                 self.app.overlay_preview_canvas.delete('all')
     
     def apply_overlay_changes(self):
@@ -177,66 +392,93 @@ class OverlayManager:
         if self.app.selected_overlay_index is None:
             return
         
-        overlays = self.get_overlays_config()
+        overlays = list(self.get_overlays_config())  # copy-on-write
         if 0 <= self.app.selected_overlay_index < len(overlays):
             current_overlay = overlays[self.app.selected_overlay_index]
             overlay_type = current_overlay.get('type', 'text')
             
             # Save common fields
             overlay_data = {
+                'id': current_overlay['id'],
                 'type': overlay_type,
-                'name': self.app.overlay_name_var.get(),
-                'anchor': self.app.anchor_var.get(),
-                'offset_x': self.app.offset_x_var.get(),
-                'offset_y': self.app.offset_y_var.get()
+                'name': self._editor_value('name', current_overlay),
+                'anchor': self._editor_value('anchor', current_overlay),
+                'offset_x': self._editor_value('offset_x', current_overlay),
+                'offset_y': self._editor_value('offset_y', current_overlay)
             }
             
             if overlay_type == 'image':
                 # Save image-specific fields
                 overlay_data.update({
-                    'image_path': self.app.overlay_image_path_var.get() if hasattr(self.app, 'overlay_image_path_var') else '',
-                    'width': self.app.overlay_image_width_var.get() if hasattr(self.app, 'overlay_image_width_var') else 200,
-                    'height': self.app.overlay_image_height_var.get() if hasattr(self.app, 'overlay_image_height_var') else 200,
-                    'maintain_aspect': self.app.overlay_image_maintain_aspect_var.get() if hasattr(self.app, 'overlay_image_maintain_aspect_var') else True,
-                    'opacity': self.app.overlay_image_opacity_var.get() if hasattr(self.app, 'overlay_image_opacity_var') else 100
+                    'image_path': self._editor_value('image_path', current_overlay, ''),
+                    'width': self._editor_value('width', current_overlay, 200),
+                    'height': self._editor_value('height', current_overlay, 200),
+                    'maintain_aspect': self._editor_value('maintain_aspect', current_overlay, True),
+                    'opacity': self._editor_value('opacity', current_overlay, 100)
                 })
             else:
-                # Get datetime format based on mode and locale
-                mode = self.app.datetime_mode_var.get()
-                if mode == 'custom':
-                    datetime_format = self.app.datetime_custom_var.get()
-                elif hasattr(self.app, 'datetime_locale_var'):
-                    # Use locale-specific formats
-                    from .overlays.constants import LOCALE_FORMATS
-                    locale = self.app.datetime_locale_var.get()
-                    locale_data = LOCALE_FORMATS.get(locale, {'date': '%Y-%m-%d', 'time': '%H:%M:%S', 'datetime': '%Y-%m-%d %H:%M:%S'})
-                    if mode == 'date':
-                        datetime_format = locale_data['date']
-                    elif mode == 'time':
-                        datetime_format = locale_data['time']
-                    else:  # full
-                        datetime_format = locale_data['datetime']
-                else:
-                    from .overlays.constants import DATETIME_FORMATS
-                    datetime_format = DATETIME_FORMATS.get(mode, '%Y-%m-%d %H:%M:%S')
-                
                 # Save text-specific fields
-                overlay_data.update({
-                    'text': self.app.overlay_text.get('1.0', 'end-1c'),
-                    'color': self.app.color_var.get(),
-                    'font_size': self.app.font_size_var.get(),
-                    'font_style': self.app.font_style_var.get(),
-                    'datetime_mode': mode,
-                    'datetime_format': datetime_format,
-                    'datetime_locale': self.app.datetime_locale_var.get() if hasattr(self.app, 'datetime_locale_var') else 'ISO (YYYY-MM-DD)',
-                    'background_enabled': self.app.background_enabled_var.get(),
-                    'background_color': self.app.bg_color_var.get()
-                })
+                self._apply_text_impl(current_overlay, overlay_data)
+            self._dirty_fields.clear()
+            
+            # Nothing changed - skip the config write and row refresh
+            if overlay_data == current_overlay:
+                return
             
             overlays[self.app.selected_overlay_index] = overlay_data
-            self.app.config.set('overlays', overlays)
-            self.rebuild_overlay_list()
-            app_logger.info("Overlay changes applied")
+            self._set_overlays(overlays)
+            self._render_row(overlay_data)
+            self._last_loaded = overlay_data  # Editor already shows the applied values
+            app_logger.debug("Overlay changes applied")
+    
+    def _datetime_inputs_unchanged(self, current_overlay):
+        """True if the stored datetime_format is still valid for the editor state"""
+        return ('datetime_format' in current_overlay and
+                not self._dirty_fields & {'datetime_mode', 'datetime_format', 'datetime_locale'})
+    
+    def _apply_text_with_locale(self, current_overlay, overlay_data):
+        """Collect text overlay fields (editor has a locale preset selector)"""
+        mode = self._editor_value('datetime_mode', current_overlay)
+        locale = self._editor_value('datetime_locale', current_overlay, 'ISO (YYYY-MM-DD)')
+        
+        # Get datetime format based on mode and locale (only if any input changed)
+        if self._datetime_inputs_unchanged(current_overlay):
+            datetime_format = current_overlay['datetime_format']
+        elif mode == 'custom':
+            datetime_format = self.app.datetime_custom_var.get()
+        else:
+            datetime_format = _resolve_datetime_format(mode, locale)
+        
+        self._update_text_fields(current_overlay, overlay_data, mode, datetime_format, locale)
+    
+    def _apply_text_without_locale(self, current_overlay, overlay_data):
+        """Collect text overlay fields (editor without a locale selector)"""
+        mode = self._editor_value('datetime_mode', current_overlay)
+        locale = current_overlay.get('datetime_locale', 'ISO (YYYY-MM-DD)')
+        
+        # Get datetime format based on mode (only if any input changed)
+        if self._datetime_inputs_unchanged(current_overlay):
+            datetime_format = current_overlay['datetime_format']
+        elif mode == 'custom':
+            datetime_format = self.app.datetime_custom_var.get()
+        else:
+            datetime_format = _resolve_datetime_format(mode)
+        
+        self._update_text_fields(current_overlay, overlay_data, mode, datetime_format, locale)
+    
+    def _update_text_fields(self, current_overlay, overlay_data, mode, datetime_format, locale):
+        """Fill the text-specific fields shared by both apply variants"""
+        overlay_data.update({
+            'text': self.app.overlay_text.get('1.0', 'end-1c'),
+            'color': self._editor_value('color', current_overlay),
+            'font_size': self._editor_value('font_size', current_overlay),
+            'font_style': self._editor_value('font_style', current_overlay),
+            'datetime_mode': mode,
+            'datetime_format': datetime_format,
+            'datetime_locale': locale,
+            'background_enabled': self._editor_value('background_enabled', current_overlay),
+            'background_color': self._editor_value('background_color', current_overlay)
+        })
     
     def reset_overlay_editor(self):
         """Reset editor to selected overlay's saved state"""
@@ -247,20 +489,30 @@ class OverlayManager:
     
     def on_overlay_edit(self):
         """Handle overlay editor changes"""
-        # Update preview with current editor values
-        self.app.image_processor.update_overlay_preview()
+        if self._loading:
+            return
+        
+        # Update preview with current editor values (coalesced per burst of edits)
+        if self._preview_job is not None:
+            self.app.root.after_cancel(self._preview_job)
+        self._preview_job = self.app.root.after(self.PREVIEW_DEBOUNCE_MS, self._do_preview)
         
         # Check if datetime section should be visible
-        if hasattr(self.app, 'overlay_text'):
+        if self._has_overlay_text:
             text_content = self.app.overlay_text.get('1.0', 'end-1c')
-            self.update_datetime_visibility('{DATETIME}' in text_content.upper())
+            self.update_datetime_visibility(bool(_DATETIME_TOKEN_RE.search(text_content)))
+    
+    def _do_preview(self):
+        """Run the debounced overlay preview render"""
+        self._preview_job = None
+        self.app.image_processor.update_overlay_preview()
     
     def on_datetime_mode_change(self):
         """Handle datetime format mode change"""
         mode = self.app.datetime_mode_var.get()
         
         # Show/hide custom format input based on mode
-        if hasattr(self.app, 'datetime_custom_frame'):
+        if self._has_dt_custom:
             if mode == 'custom':
                 # Show custom format input
                 self.app.datetime_custom_frame.pack(fill='x', pady=(0, SPACING['element_gap']),
@@ -283,23 +535,17 @@ class OverlayManager:
     
     def update_datetime_visibility(self, show):
         """Show/hide datetime format controls based on token presence"""
-        from .theme import SPACING
-        
-        if not hasattr(self.app, 'datetime_section_frame'):
+        if not self._has_dt_section:
             return
         
-        if show:
-            try:
-                self.app.datetime_section_frame.pack_info()
-            except:
-                self.app.datetime_section_frame.pack(fill='x', 
-                                                     pady=(SPACING['section_gap'], 0),
-                                                     before=self.app.appearance_section_frame)
-        else:
-            try:
-                self.app.datetime_section_frame.pack_forget()
-            except:
-                pass
+        if show and not self._dt_section_packed:
+            self.app.datetime_section_frame.pack(fill='x', 
+                                                 pady=(SPACING['section_gap'], 0),
+                                                 before=self.app.appearance_section_frame)
+            self._dt_section_packed = True
+        elif not show and self._dt_section_packed:
+            self.app.datetime_section_frame.pack_forget()
+            self._dt_section_packed = False
     
     def update_datetime_preview(self):
         """Update the datetime format preview (triggers overlay preview update)"""
@@ -310,10 +556,8 @@ class OverlayManager:
     def insert_token(self):
         """Insert selected token into overlay text"""
         try:
-            from .overlays.constants import TOKENS
-            
             # Get selected token from combobox display text
-            if not hasattr(self.app, 'token_display_var'):
+            if not self._has_token_picker:
                 app_logger.warning("Token display variable not found")
                 return
             
@@ -323,13 +567,9 @@ class OverlayManager:
                 return
             
             # Find matching token value
-            token_value = None
-            for label, value in TOKENS:
-                if label == selected_label:
-                    token_value = value
-                    break
+            token_value = TOKENS_MAP.get(selected_label)
             
-            if token_value and hasattr(self.app, 'overlay_text'):
+            if token_value and self._has_overlay_text:
                 # Insert at cursor position in text widget
                 self.app.overlay_text.insert('insert', token_value)
                 self.app.overlay_text.focus_set()
@@ -46,6 +46,9 @@ TOKENS = [
     ("City", "{WEATHER_CITY}"),
 ]
 
+# Label -> token lookup (headers map to None)
+TOKENS_MAP = dict(TOKENS)
+
 # Position presets
 POSITION_PRESETS = [
     'Top-Left',
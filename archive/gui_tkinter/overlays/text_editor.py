@@ -7,7 +7,7 @@ from tkinter import colorchooser
 from datetime import datetime
 from ..theme import COLORS, FONTS, SPACING
 from .. import theme
-from .constants import TOKENS, POSITION_PRESETS, DATETIME_FORMATS
+from .constants import TOKENS, TOKENS_MAP, POSITION_PRESETS, DATETIME_FORMATS
 
 
 class TextOverlayEditor:
@@ -115,14 +115,9 @@ class TextOverlayEditor:
         """Handle token selection - prevent selecting headers"""
         selected_label = self.app.token_display_var.get()
         
-        # Find the selected item in TOKENS
-        for label, token in TOKENS:
-            if label == selected_label:
-                if token is None:  # Header selected
-                    # Clear selection and show message
-                    self.app.token_display_var.set('')
-                    return
-                break
+        # Header labels map to None and are not selectable
+        if selected_label in TOKENS_MAP and TOKENS_MAP[selected_label] is None:
+            self.app.token_display_var.set('')
     
     def create_datetime_section(self):
         """Create DateTime format configuration"""
@@ -2,12 +2,72 @@
 Settings tab component - output, processing, and cleanup settings
 Modern dark theme with consistent styling matching Capture tab
 """
+import shutil
+import subprocess
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import ttkbootstrap as ttk
-from ttkbootstrap.tooltip import ToolTip
 from .theme import (COLORS, FONTS, SPACING, LAYOUT, configure_dark_input_styles, 
                    create_card, create_secondary_button, create_primary_button,
-                   create_gradient_scrollable_frame, ToggleButtonGroup, ToggleSwitch)
+                   create_gradient_scrollable_frame, ToggleButtonGroup, ToggleSwitch,
+                   LazyToolTip)
+
+
+# Output mode toggle options; RTSP is offered only when ffmpeg may be available
+_OUTPUT_MODES = (
+    ('file', '💾 Save to File'),
+    ('webserver', '🌐 Web Server'),
+)
+_RTSP_MODE = ('rtsp', '📡 RTSP Stream')
+
+# Suppress the console window flash when probing ffmpeg on Windows
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+@lru_cache(maxsize=1)
+def probe_ffmpeg():
+    """Check (once per process) whether a working ffmpeg is on PATH"""
+    # Pure PATH scan first - no process spawn when ffmpeg isn't installed
+    if shutil.which('ffmpeg') is None:
+        return False
+    
+    # Found on PATH - confirm it actually runs
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-version'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=3,
+            check=False,
+            creationflags=_NO_WINDOW
+        )
+        return result.returncode == 0
+    except:
+        return False
+
+
+def _ensure_var(app, name, var_type, value=None):
+    """Return app.<name>, creating it as var_type(value=value) if it doesn't exist yet"""
+    var = app.__dict__.get(name)
+    if var is None:
+        var = var_type(value=value)
+        setattr(app, name, var)
+    return var
+
+
+_ffmpeg_future = None  # Background probe_ffmpeg() result
+
+
+def start_ffmpeg_probe():
+    """Start the ffmpeg probe on a worker thread (no-op if already started)"""
+    global _ffmpeg_future
+    if _ffmpeg_future is None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ffmpeg-probe')
+        _ffmpeg_future = executor.submit(probe_ffmpeg)
+        executor.shutdown(wait=False)
+    return _ffmpeg_future
 
 
 class SettingsTab:
@@ -21,21 +81,42 @@ class SettingsTab:
         # Configure dark theme styles for inputs (if not already done)
         configure_dark_input_styles()
         
+        # Options shared by every column-0 settings label
+        self._label_opts = dict(style='CardLabel.TLabel',
+                                width=LAYOUT['label_width'], anchor='w')
+        
         self.create_ui()
     
+    def _row_label(self, grid, row, text, pady=None):
+        """Add a standard settings label in column 0 of a grid row"""
+        ttk.Label(grid, text=text, **self._label_opts).grid(
+            row=row, column=0, sticky='w',
+            pady=(0, SPACING['row_gap']) if pady is None else pady)
+    
+    def _add_input_row(self, grid, row, label_text, var, kind='entry', pady=None, **opts):
+        """Add a label + dark entry/spinbox row to a settings grid; returns the input"""
+        if pady is None:
+            pady = (0, SPACING['row_gap'])
+        self._row_label(grid, row, label_text, pady)
+        if kind == 'spin':
+            widget = ttk.Spinbox(grid, textvariable=var, font=FONTS['body'],
+                                 style='Dark.TSpinbox', **opts)
+        else:
+            widget = ttk.Entry(grid, textvariable=var, font=FONTS['body'],
+                               style='Dark.TEntry', **opts)
+        widget.grid(row=row, column=1, sticky='w', pady=pady)
+        return widget
+    
     
     def create_ui(self):
         """Create the settings tab UI with full-width layout"""
         # Create scrollable frame with gradient background for content
         scroll_container, scrollable_content = create_gradient_scrollable_frame(self.tab)
-        scroll_container.pack(fill='both', expand=True)
         
         # Content frame with padding - transparent to show gradient
         # Note: Cards will have their own solid backgrounds for readability
+        # Built unmapped and packed once at the end so Tk lays it out in one pass
         container = tk.Frame(scrollable_content)
-        container.pack(fill='both', expand=True,
-                      padx=SPACING['card_margin_x'],
-                      pady=SPACING['card_margin_y'])
         
         # Output Mode Card - NEW: Select File/Webserver/RTSP streaming
         output_mode_card_frame = create_card(container, title="Output Mode")
@@ -61,73 +142,76 @@ class SettingsTab:
         btn_container = tk.Frame(container, bg=COLORS['bg_primary'])
         btn_container.pack(fill='x', pady=(SPACING['element_gap'], 0))
         
-        from .theme import create_primary_button
         apply_btn = create_primary_button(
             btn_container, "✓ Apply All Settings",
             self.app.apply_settings
         )
         apply_btn.pack(side='right')
+        
+        # Map the finished content
+        container.pack(fill='both', expand=True,
+                      padx=SPACING['card_margin_x'],
+                      pady=SPACING['card_margin_y'])
+        scroll_container.pack(fill='both', expand=True)
     
     
     def create_output_mode_selector(self, parent):
         """Create output mode selector (File/Webserver/RTSP)"""
+        bg_card = COLORS['bg_card']
+        text_muted = COLORS['text_muted']
+        font_body = FONTS['body']
+        font_small = FONTS['small']
+        row_gap = SPACING['row_gap']
+        element_gap = SPACING['element_gap']
+        section_gap = SPACING['section_gap']
+        label_width = LAYOUT['label_width']
+        
         # Mode selector buttons
-        btn_frame = tk.Frame(parent, bg=COLORS['bg_card'])
-        btn_frame.pack(fill='x', pady=(0, SPACING['section_gap']))
+        btn_frame = tk.Frame(parent, bg=bg_card)
+        btn_frame.pack(fill='x', pady=(0, section_gap))
         
         # Initialize output mode var if not exists
-        if not hasattr(self.app, 'output_mode_var'):
-            self.app.output_mode_var = tk.StringVar(value='file')
+        _ensure_var(self.app, 'output_mode_var', tk.StringVar, 'file')
         
-        # Check if ffmpeg is available for RTSP
+        # Check if ffmpeg is available for RTSP (None while the probe is running)
         ffmpeg_available = self._check_ffmpeg_available()
         
         # Build options list (exclude RTSP if ffmpeg not available)
-        options = [
-            ('file', '💾 Save to File'),
-            ('webserver', '🌐 Web Server'),
-        ]
-        if ffmpeg_available:
-            options.append(('rtsp', '📡 RTSP Stream'))
+        options = _OUTPUT_MODES if ffmpeg_available is False else _OUTPUT_MODES + (_RTSP_MODE,)
         
         # Create styled toggle button group
         toggle_group = ToggleButtonGroup(
             btn_frame,
             options=options,
             variable=self.app.output_mode_var,
-            command=lambda: self.app.on_output_mode_change(),
-            bg=COLORS['bg_card']
+            command=self.app.on_output_mode_change,
+            bg=bg_card
         )
         toggle_group.pack(side='left')
         
         # RTSP warning if not available
-        if not ffmpeg_available:
-            rtsp_hint = tk.Label(
-                btn_frame,
-                text="(RTSP requires ffmpeg)",
-                font=FONTS['tiny'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_muted']
-            )
-            rtsp_hint.pack(side='left', padx=(SPACING['element_gap'], 0))
+        if ffmpeg_available is False:
+            self._show_rtsp_hint(btn_frame)
+        elif ffmpeg_available is None:
+            # Probe still running - keep RTSP offered and re-check shortly
+            self.tab.after(200, self._recheck_ffmpeg, toggle_group, btn_frame)
         
         # Status display (shows URLs when servers running) with copy button
-        status_frame = tk.Frame(parent, bg=COLORS['bg_card'])
-        status_frame.pack(fill='x', pady=(0, SPACING['element_gap']))
+        status_frame = tk.Frame(parent, bg=bg_card)
+        status_frame.pack(fill='x', pady=(0, element_gap))
         
         self.app.output_mode_status_var = tk.StringVar(value="Mode: File (default)")
         status_label = tk.Label(
             status_frame,
             textvariable=self.app.output_mode_status_var,
-            font=FONTS['small'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_muted'],
+            font=font_small,
+            bg=bg_card,
+            fg=text_muted,
             anchor='w'
         )
         status_label.pack(side='left', fill='x', expand=True)
         
         # Copy button (hidden in file mode)
-        from .theme import create_secondary_button
         self.app.output_mode_copy_btn = create_secondary_button(
             status_frame,
             "📋 Copy URL",
@@ -137,343 +221,207 @@ class SettingsTab:
         self.app.output_mode_copy_btn.pack_forget()  # Hidden by default
         
         # File mode settings (shown by default)
-        self.app.file_frame = tk.Frame(parent, bg=COLORS['bg_card'])
+        self.app.file_frame = tk.Frame(parent, bg=bg_card)
         
-        file_grid = tk.Frame(self.app.file_frame, bg=COLORS['bg_card'])
+        file_grid = tk.Frame(self.app.file_frame, bg=bg_card)
         file_grid.pack(fill='x')
         file_grid.columnconfigure(1, weight=1)
         
         row = 0
         
         # Output Directory
-        tk.Label(file_grid, text="Output Directory:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(file_grid, row, "Output Directory:")
         
-        if not hasattr(self.app, 'output_dir_var'):
-            self.app.output_dir_var = tk.StringVar()
+        _ensure_var(self.app, 'output_dir_var', tk.StringVar)
         output_entry = ttk.Entry(file_grid, textvariable=self.app.output_dir_var,
-                                font=FONTS['body'], style='Dark.TEntry')
+                                font=font_body, style='Dark.TEntry')
         output_entry.grid(row=row, column=1, sticky='ew', 
-                         pady=(0, SPACING['row_gap']), padx=(0, SPACING['element_gap']))
+                         pady=(0, row_gap), padx=(0, element_gap))
         
         browse_btn = create_secondary_button(file_grid, "Browse...", self.app.browse_output_dir)
-        browse_btn.grid(row=row, column=2, pady=(0, SPACING['row_gap']))
+        browse_btn.grid(row=row, column=2, pady=(0, row_gap))
         
         row += 1
         
         # Filename Pattern
-        tk.Label(file_grid, text="Filename Pattern:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['element_gap']))
+        self._row_label(file_grid, row, "Filename Pattern:", pady=(0, element_gap))
         
-        if not hasattr(self.app, 'filename_pattern_var'):
-            self.app.filename_pattern_var = tk.StringVar(value="{session}_{filename}")
+        _ensure_var(self.app, 'filename_pattern_var', tk.StringVar, "{session}_{filename}")
         pattern_entry = ttk.Entry(file_grid, textvariable=self.app.filename_pattern_var,
-                                 font=FONTS['body'], style='Dark.TEntry')
+                                 font=font_body, style='Dark.TEntry')
         pattern_entry.grid(row=row, column=1, columnspan=2, sticky='ew',
-                          pady=(0, SPACING['element_gap']))
+                          pady=(0, element_gap))
         
         row += 1
         
         # Tokens helper text
-        tk.Label(file_grid, text="", width=LAYOUT['label_width']).grid(row=row, column=0)
-        tk.Label(file_grid, text="Tokens: {filename}, {session}, {timestamp}",
-                font=FONTS['tiny'], bg=COLORS['bg_card'],
-                fg=COLORS['text_muted']).grid(
-            row=row, column=1, sticky='w', pady=(0, SPACING['row_gap']), columnspan=2)
+        tk.Label(file_grid, text="", width=label_width).grid(row=row, column=0)
+        ttk.Label(file_grid, text="Tokens: {filename}, {session}, {timestamp}",
+                  style='MutedLabel.TLabel').grid(
+            row=row, column=1, sticky='w', pady=(0, row_gap), columnspan=2)
         
         row += 1
         
         # Output Format
-        tk.Label(file_grid, text="Output Format:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(file_grid, row, "Output Format:")
         
-        if not hasattr(self.app, 'output_format_var'):
-            self.app.output_format_var = tk.StringVar(value="png")
-        format_frame = tk.Frame(file_grid, bg=COLORS['bg_card'])
+        _ensure_var(self.app, 'output_format_var', tk.StringVar, "png")
+        format_frame = tk.Frame(file_grid, bg=bg_card)
         format_frame.grid(row=row, column=1, sticky='w', 
-                         pady=(0, SPACING['row_gap']), columnspan=2)
+                         pady=(0, row_gap), columnspan=2)
         
         # Use custom styled toggle button group
         format_toggle = ToggleButtonGroup(
             format_frame,
             options=[('png', 'PNG (Lossless)'), ('jpg', 'JPG')],
             variable=self.app.output_format_var,
-            bg=COLORS['bg_card']
+            bg=bg_card
         )
         format_toggle.pack(side='left')
         
         row += 1
         
         # JPG Quality
-        tk.Label(file_grid, text="JPG Quality:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w')
+        self._row_label(file_grid, row, "JPG Quality:", pady=0)
         
-        if not hasattr(self.app, 'jpg_quality_var'):
-            self.app.jpg_quality_var = tk.IntVar(value=95)
-        quality_frame = tk.Frame(file_grid, bg=COLORS['bg_card'])
+        _ensure_var(self.app, 'jpg_quality_var', tk.IntVar, 95)
+        quality_frame = tk.Frame(file_grid, bg=bg_card)
         quality_frame.grid(row=row, column=1, sticky='ew', columnspan=2)
         
         ttk.Scale(quality_frame, from_=1, to=100, variable=self.app.jpg_quality_var,
                  orient='horizontal', bootstyle="primary").pack(
-            side='left', fill='x', expand=True, padx=(0, SPACING['row_gap']))
+            side='left', fill='x', expand=True, padx=(0, row_gap))
+        
+        ttk.Label(quality_frame, textvariable=self.app.jpg_quality_var,
+                  style='BodyBoldLabel.TLabel', width=3).pack(side='left')
+        
+        # Webserver/RTSP settings are built on first switch to that mode
+        # (ensure_*_frame); their variables exist up front for load/apply
+        _ensure_var(self.app, 'webserver_path_var', tk.StringVar, '/latest')
+        _ensure_var(self.app, 'webserver_advanced_var', tk.BooleanVar, False)
+        _ensure_var(self.app, 'webserver_host_var', tk.StringVar, '127.0.0.1')
+        _ensure_var(self.app, 'webserver_port_var', tk.IntVar, 8080)
+        _ensure_var(self.app, 'rtsp_host_var', tk.StringVar, '127.0.0.1')
+        _ensure_var(self.app, 'rtsp_port_var', tk.IntVar, 8554)
+        _ensure_var(self.app, 'rtsp_stream_name_var', tk.StringVar, 'asiwatchdog')
+        _ensure_var(self.app, 'rtsp_fps_var', tk.DoubleVar, 1.0)
+        self._output_mode_parent = parent
+        self.app.webserver_frame = None
+        self.app.rtsp_frame = None
+    
+    def ensure_webserver_frame(self):
+        """Build the Web Server settings frame on first use (hidden until packed)"""
+        if self.app.webserver_frame is not None:
+            return self.app.webserver_frame
         
-        tk.Label(quality_frame, textvariable=self.app.jpg_quality_var,
-                font=FONTS['body_bold'], bg=COLORS['bg_card'],
-                fg=COLORS['text_primary'], width=3).pack(side='left')
+        bg_card = COLORS['bg_card']
+        font_body = FONTS['body']
+        font_small = FONTS['small']
+        row_gap = SPACING['row_gap']
+        element_gap = SPACING['element_gap']
         
-        # Webserver settings (hidden by default)
-        self.app.webserver_frame = tk.Frame(parent, bg=COLORS['bg_card'])
+        self.app.webserver_frame = tk.Frame(self._output_mode_parent, bg=bg_card)
         
-        grid = tk.Frame(self.app.webserver_frame, bg=COLORS['bg_card'])
+        grid = tk.Frame(self.app.webserver_frame, bg=bg_card)
         grid.pack(fill='x')
         grid.columnconfigure(1, weight=1)
         
         row = 0
         
         # Image Path (always visible)
-        tk.Label(grid, text="Image Path:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        if not hasattr(self.app, 'webserver_path_var'):
-            self.app.webserver_path_var = tk.StringVar(value='/latest')
-        path_entry = ttk.Entry(grid, textvariable=self.app.webserver_path_var,
-                              font=FONTS['body'], style='Dark.TEntry', width=20)
-        path_entry.grid(row=row, column=1, sticky='w', pady=(0, SPACING['row_gap']))
+        self._add_input_row(grid, row, "Image Path:", self.app.webserver_path_var, width=20)
         
         row += 1
         
         # Advanced Settings toggle - using custom styled toggle
-        if not hasattr(self.app, 'webserver_advanced_var'):
-            self.app.webserver_advanced_var = tk.BooleanVar(value=False)
-        
         advanced_toggle = ToggleSwitch(
             grid,
             text="⚙️ Show Advanced Settings (IP & Port)",
             variable=self.app.webserver_advanced_var,
             command=self._toggle_webserver_advanced,
-            bg=COLORS['bg_card']
+            bg=bg_card
         )
-        advanced_toggle.grid(row=row, column=0, columnspan=2, sticky='w', pady=(SPACING['element_gap'], SPACING['row_gap']))
+        advanced_toggle.grid(row=row, column=0, columnspan=2, sticky='w', pady=(element_gap, row_gap))
         
         row += 1
         
         # Advanced settings frame (hidden by default)
-        self.webserver_advanced_frame = tk.Frame(grid, bg=COLORS['bg_card'])
+        self.webserver_advanced_frame = tk.Frame(grid, bg=bg_card)
         self.webserver_advanced_frame.grid(row=row, column=0, columnspan=2, sticky='ew')
         self.webserver_advanced_frame.grid_remove()  # Hidden by default
         
         # Create advanced settings content
-        adv_grid = tk.Frame(self.webserver_advanced_frame, bg=COLORS['bg_card'])
+        adv_grid = tk.Frame(self.webserver_advanced_frame, bg=bg_card)
         adv_grid.pack(fill='x')
         adv_grid.columnconfigure(1, weight=1)
         
         # Warning label
-        warning_frame = tk.Frame(adv_grid, bg=COLORS['bg_card'])
-        warning_frame.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, SPACING['row_gap']))
+        warning_frame = tk.Frame(adv_grid, bg=bg_card)
+        warning_frame.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, row_gap))
         
         tk.Label(warning_frame, text="⚠️",
-                font=FONTS['body'], bg=COLORS['bg_card'], fg=COLORS['status_connecting']).pack(side='left')
+                font=font_body, bg=bg_card, fg=COLORS['status_connecting']).pack(side='left')
         tk.Label(warning_frame, 
                 text=" Changing IP/Port may cause conflicts. Use 0.0.0.0 for all interfaces.",
-                font=FONTS['small'], bg=COLORS['bg_card'], fg=COLORS['status_connecting']).pack(side='left')
+                font=font_small, bg=bg_card, fg=COLORS['status_connecting']).pack(side='left')
         
         # Host setting
-        tk.Label(adv_grid, text="Bind IP:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=1, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        if not hasattr(self.app, 'webserver_host_var'):
-            self.app.webserver_host_var = tk.StringVar(value='127.0.0.1')
+        self._row_label(adv_grid, 1, "Bind IP:")
         
-        host_frame = tk.Frame(adv_grid, bg=COLORS['bg_card'])
-        host_frame.grid(row=1, column=1, sticky='w', pady=(0, SPACING['row_gap']))
+        host_frame = tk.Frame(adv_grid, bg=bg_card)
+        host_frame.grid(row=1, column=1, sticky='w', pady=(0, row_gap))
         
         host_entry = ttk.Entry(host_frame, textvariable=self.app.webserver_host_var,
-                              font=FONTS['body'], style='Dark.TEntry', width=15)
+                              font=font_body, style='Dark.TEntry', width=15)
         host_entry.pack(side='left')
         host_entry.bind('<FocusOut>', self._on_webserver_advanced_change)
         
-        tk.Label(host_frame, text="(127.0.0.1 = local only)",
-                font=FONTS['tiny'], bg=COLORS['bg_card'], fg=COLORS['text_muted']).pack(side='left', padx=(5, 0))
+        ttk.Label(host_frame, text="(127.0.0.1 = local only)",
+                  style='MutedLabel.TLabel').pack(side='left', padx=(5, 0))
         
         # Port setting
-        tk.Label(adv_grid, text="Port:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=2, column=0, sticky='w')
-        
-        if not hasattr(self.app, 'webserver_port_var'):
-            self.app.webserver_port_var = tk.IntVar(value=8080)
+        self._row_label(adv_grid, 2, "Port:", pady=0)
         
-        port_frame = tk.Frame(adv_grid, bg=COLORS['bg_card'])
+        port_frame = tk.Frame(adv_grid, bg=bg_card)
         port_frame.grid(row=2, column=1, sticky='w')
         
         port_spin = ttk.Spinbox(port_frame, from_=1024, to=65535,
                                textvariable=self.app.webserver_port_var,
-                               font=FONTS['body'], style='Dark.TSpinbox', width=8)
+                               font=font_body, style='Dark.TSpinbox', width=8)
         port_spin.pack(side='left')
         port_spin.bind('<FocusOut>', self._on_webserver_advanced_change)
         
-        tk.Label(port_frame, text="(1024-65535)",
-                font=FONTS['tiny'], bg=COLORS['bg_card'], fg=COLORS['text_muted']).pack(side='left', padx=(5, 0))
-        
-        # RTSP settings (hidden by default)
-        self.app.rtsp_frame = tk.Frame(parent, bg=COLORS['bg_card'])
-        
-        grid2 = tk.Frame(self.app.rtsp_frame, bg=COLORS['bg_card'])
-        grid2.pack(fill='x')
-        grid2.columnconfigure(1, weight=1)
+        ttk.Label(port_frame, text="(1024-65535)",
+                  style='MutedLabel.TLabel').pack(side='left', padx=(5, 0))
         
-        row = 0
-        tk.Label(grid2, text="Host:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        if not hasattr(self.app, 'rtsp_host_var'):
-            self.app.rtsp_host_var = tk.StringVar(value='127.0.0.1')
-        host_entry = ttk.Entry(grid2, textvariable=self.app.rtsp_host_var,
-                              font=FONTS['body'], style='Dark.TEntry', width=20)
-        host_entry.grid(row=row, column=1, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        row += 1
-        tk.Label(grid2, text="Port:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        if not hasattr(self.app, 'rtsp_port_var'):
-            self.app.rtsp_port_var = tk.IntVar(value=8554)
-        port_spin = ttk.Spinbox(grid2, from_=1024, to=65535,
-                               textvariable=self.app.rtsp_port_var,
-                               font=FONTS['body'], style='Dark.TSpinbox', width=10)
-        port_spin.grid(row=row, column=1, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        row += 1
-        tk.Label(grid2, text="Stream Name:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        if not hasattr(self.app, 'rtsp_stream_name_var'):
-            self.app.rtsp_stream_name_var = tk.StringVar(value='asiwatchdog')
-        stream_entry = ttk.Entry(grid2, textvariable=self.app.rtsp_stream_name_var,
-                                font=FONTS['body'], style='Dark.TEntry', width=20)
-        stream_entry.grid(row=row, column=1, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        row += 1
-        tk.Label(grid2, text="FPS:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w')
-        
-        if not hasattr(self.app, 'rtsp_fps_var'):
-            self.app.rtsp_fps_var = tk.DoubleVar(value=1.0)
-        fps_spin = ttk.Spinbox(grid2, from_=0.1, to=30.0, increment=0.5,
-                              textvariable=self.app.rtsp_fps_var,
-                              font=FONTS['body'], style='Dark.TSpinbox', width=10)
-        fps_spin.grid(row=row, column=1, sticky='w')
+        return self.app.webserver_frame
     
-    
-    def create_output_settings(self, parent):
-        """Create output settings with grid layout"""
-        # Grid container
-        grid = tk.Frame(parent, bg=COLORS['bg_card'])
-        grid.pack(fill='x')
-        grid.columnconfigure(1, weight=1)  # Make input column expandable
+    def ensure_rtsp_frame(self):
+        """Build the RTSP settings frame on first use (hidden until packed)"""
+        if self.app.rtsp_frame is not None:
+            return self.app.rtsp_frame
         
-        row = 0
+        bg_card = COLORS['bg_card']
+        row_gap = SPACING['row_gap']
         
-        # Output Directory
-        tk.Label(grid, text="Output Directory:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        self.app.output_dir_var = tk.StringVar()
-        output_entry = ttk.Entry(grid, textvariable=self.app.output_dir_var,
-                                font=FONTS['body'], style='Dark.TEntry')
-        output_entry.grid(row=row, column=1, sticky='ew', 
-                         pady=(0, SPACING['row_gap']), padx=(0, SPACING['element_gap']))
+        self.app.rtsp_frame = tk.Frame(self._output_mode_parent, bg=bg_card)
         
-        browse_btn = create_secondary_button(grid, "Browse...", self.app.browse_output_dir)
-        browse_btn.grid(row=row, column=2, pady=(0, SPACING['row_gap']))
-        
-        row += 1
-        
-        # Filename Pattern
-        tk.Label(grid, text="Filename Pattern:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['element_gap']))
-        
-        self.app.filename_pattern_var = tk.StringVar(value="{session}_{filename}")
-        pattern_entry = ttk.Entry(grid, textvariable=self.app.filename_pattern_var,
-                                 font=FONTS['body'], style='Dark.TEntry')
-        pattern_entry.grid(row=row, column=1, columnspan=2, sticky='ew',
-                          pady=(0, SPACING['element_gap']))
-        
-        row += 1
-        
-        # Tokens helper text
-        tk.Label(grid, text="", width=LAYOUT['label_width']).grid(row=row, column=0)
-        tk.Label(grid, text="Tokens: {filename}, {session}, {timestamp}",
-                font=FONTS['tiny'], bg=COLORS['bg_card'],
-                fg=COLORS['text_muted']).grid(
-            row=row, column=1, sticky='w', pady=(0, SPACING['row_gap']), columnspan=2)
-        
-        row += 1
-        
-        # Output Format
-        tk.Label(grid, text="Output Format:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
-        
-        self.app.output_format_var = tk.StringVar(value="png")
-        format_frame = tk.Frame(grid, bg=COLORS['bg_card'])
-        format_frame.grid(row=row, column=1, sticky='w', 
-                         pady=(0, SPACING['row_gap']), columnspan=2)
+        grid2 = tk.Frame(self.app.rtsp_frame, bg=bg_card)
+        grid2.pack(fill='x')
+        grid2.columnconfigure(1, weight=1)
         
-        # Use custom styled toggle button group
-        format_toggle = ToggleButtonGroup(
-            format_frame,
-            options=[('png', 'PNG (Lossless)'), ('jpg', 'JPG')],
-            variable=self.app.output_format_var,
-            bg=COLORS['bg_card']
+        rtsp_rows = (
+            ("Host:", self.app.rtsp_host_var, 'entry', {'width': 20}),
+            ("Port:", self.app.rtsp_port_var, 'spin', {'from_': 1024, 'to': 65535, 'width': 10}),
+            ("Stream Name:", self.app.rtsp_stream_name_var, 'entry', {'width': 20}),
+            ("FPS:", self.app.rtsp_fps_var, 'spin', {'from_': 0.1, 'to': 30.0, 'increment': 0.5, 'width': 10}),
         )
-        format_toggle.pack(side='left')
+        last_row = len(rtsp_rows) - 1
+        for row, (label_text, var, kind, opts) in enumerate(rtsp_rows):
+            self._add_input_row(grid2, row, label_text, var, kind,
+                                pady=0 if row == last_row else (0, row_gap), **opts)
         
-        row += 1
-        
-        # JPG Quality
-        tk.Label(grid, text="JPG Quality:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w')
-        
-        self.app.jpg_quality_var = tk.IntVar(value=95)
-        quality_frame = tk.Frame(grid, bg=COLORS['bg_card'])
-        quality_frame.grid(row=row, column=1, sticky='ew', columnspan=2)
-        
-        ttk.Scale(quality_frame, from_=1, to=100, variable=self.app.jpg_quality_var,
-                 orient='horizontal', bootstyle="primary").pack(
-            side='left', fill='x', expand=True, padx=(0, SPACING['row_gap']))
-        
-        tk.Label(quality_frame, textvariable=self.app.jpg_quality_var,
-                font=FONTS['body_bold'], bg=COLORS['bg_card'],
-                fg=COLORS['text_primary'], width=3).pack(side='left')
+        return self.app.rtsp_frame
     
     
     def create_weather_settings(self, parent):
@@ -511,8 +459,7 @@ class SettingsTab:
         tk.Label(api_row, text="(OpenWeatherMap)", font=FONTS['tiny'],
                 bg=COLORS['bg_card'], fg=COLORS['text_muted']).pack(side='right', padx=(5, 0))
         
-        if not hasattr(self.app, 'weather_api_key_var'):
-            self.app.weather_api_key_var = tk.StringVar()
+        _ensure_var(self.app, 'weather_api_key_var', tk.StringVar)
         api_entry = ttk.Entry(api_row, textvariable=self.app.weather_api_key_var,
                              font=FONTS['body'], style='Dark.TEntry', show='*')
         api_entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
@@ -534,8 +481,7 @@ class SettingsTab:
                 bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
                 width=12, anchor='w').pack(side='left')
         
-        if not hasattr(self.app, 'weather_location_var'):
-            self.app.weather_location_var = tk.StringVar()
+        _ensure_var(self.app, 'weather_location_var', tk.StringVar)
         location_entry = ttk.Entry(loc_row, textvariable=self.app.weather_location_var,
                                    font=FONTS['body'], style='Dark.TEntry', width=18)
         location_entry.pack(side='left', padx=(0, 10))
@@ -548,8 +494,7 @@ class SettingsTab:
         tk.Label(loc_row, text="Lat:", font=FONTS['small'],
                 bg=COLORS['bg_card'], fg=COLORS['text_muted']).pack(side='left')
         
-        if not hasattr(self.app, 'weather_lat_var'):
-            self.app.weather_lat_var = tk.StringVar()
+        _ensure_var(self.app, 'weather_lat_var', tk.StringVar)
         lat_entry = ttk.Entry(loc_row, textvariable=self.app.weather_lat_var,
                               font=FONTS['body'], style='Dark.TEntry', width=10)
         lat_entry.pack(side='left', padx=(2, 8))
@@ -558,8 +503,7 @@ class SettingsTab:
         tk.Label(loc_row, text="Lon:", font=FONTS['small'],
                 bg=COLORS['bg_card'], fg=COLORS['text_muted']).pack(side='left')
         
-        if not hasattr(self.app, 'weather_lon_var'):
-            self.app.weather_lon_var = tk.StringVar()
+        _ensure_var(self.app, 'weather_lon_var', tk.StringVar)
         lon_entry = ttk.Entry(loc_row, textvariable=self.app.weather_lon_var,
                               font=FONTS['body'], style='Dark.TEntry', width=10)
         lon_entry.pack(side='left', padx=(2, 0))
@@ -581,8 +525,7 @@ class SettingsTab:
                 bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
                 width=12, anchor='w').pack(side='left')
         
-        if not hasattr(self.app, 'weather_units_var'):
-            self.app.weather_units_var = tk.StringVar(value='metric')
+        _ensure_var(self.app, 'weather_units_var', tk.StringVar, 'metric')
         
         # Units toggle using custom styled toggle button group
         units_toggle = ToggleButtonGroup(
@@ -599,8 +542,7 @@ class SettingsTab:
         test_btn.pack(side='left', padx=(0, 10))
         
         # Status (flexible width)
-        if not hasattr(self.app, 'weather_status_var'):
-            self.app.weather_status_var = tk.StringVar(value="Not configured")
+        _ensure_var(self.app, 'weather_status_var', tk.StringVar, "Not configured")
         tk.Label(control_row, textvariable=self.app.weather_status_var,
                 font=FONTS['small'], bg=COLORS['bg_card'],
                 fg=COLORS['text_muted'], anchor='w').pack(side='left', fill='x', expand=True)
@@ -628,34 +570,40 @@ class SettingsTab:
     
     def create_processing_settings(self, parent):
         """Create image processing settings with grid layout"""
+        bg_card = COLORS['bg_card']
+        text_muted = COLORS['text_muted']
+        text_primary = COLORS['text_primary']
+        text_disabled = COLORS['text_disabled']
+        font_bold = FONTS['body_bold']
+        font_body = FONTS['body']
+        row_gap = SPACING['row_gap']
+        element_gap = SPACING['element_gap']
+        section_gap = SPACING['section_gap']
+        
         # Grid container
-        grid = tk.Frame(parent, bg=COLORS['bg_card'])
+        grid = tk.Frame(parent, bg=bg_card)
         grid.pack(fill='x')
         grid.columnconfigure(1, weight=1)  # Make input column expandable
         
         row = 0
         
         # Resize
-        tk.Label(grid, text="Resize:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Resize:")
         
         self.app.resize_percent_var = tk.IntVar(value=100)
-        resize_frame = tk.Frame(grid, bg=COLORS['bg_card'])
+        resize_frame = tk.Frame(grid, bg=bg_card)
         resize_frame.grid(row=row, column=1, sticky='ew', 
-                         pady=(0, SPACING['row_gap']), columnspan=2)
+                         pady=(0, row_gap), columnspan=2)
         
         ttk.Scale(resize_frame, from_=10, to=100, variable=self.app.resize_percent_var,
                  orient='horizontal', bootstyle="primary").pack(
-            side='left', fill='x', expand=True, padx=(0, SPACING['row_gap']))
+            side='left', fill='x', expand=True, padx=(0, row_gap))
         
-        tk.Label(resize_frame, textvariable=self.app.resize_percent_var,
-                font=FONTS['body_bold'], bg=COLORS['bg_card'],
-                fg=COLORS['text_primary'], width=3).pack(side='left', padx=(0, 2))
+        ttk.Label(resize_frame, textvariable=self.app.resize_percent_var,
+                  style='BodyBoldLabel.TLabel', width=3).pack(side='left', padx=(0, 2))
         
-        tk.Label(resize_frame, text="%", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_muted']).pack(side='left')
+        tk.Label(resize_frame, text="%", font=font_body,
+                bg=bg_card, fg=text_muted).pack(side='left')
         
         row += 1
         
@@ -666,25 +614,22 @@ class SettingsTab:
                                     command=self.app.on_auto_brightness_toggle,
                                     bootstyle="primary-round-toggle")
         auto_check.grid(row=row, column=0, columnspan=3, sticky='w',
-                       pady=(0, SPACING['row_gap']))
+                       pady=(0, row_gap))
         
-        ToolTip(auto_check,
-               text="Analyze each image's brightness and auto-enhance (dark images boosted more than bright ones)",
-               bootstyle="primary-inverse")
+        LazyToolTip(auto_check,
+                   text="Analyze each image's brightness and auto-enhance (dark images boosted more than bright ones)",
+                   bootstyle="primary-inverse")
         
         row += 1
         
         # Brightness Factor (manual multiplier)
-        tk.Label(grid, text="Brightness Multiplier:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Brightness Multiplier:")
         
         self.app.brightness_var = tk.DoubleVar(value=1.0)
         
-        factor_frame = tk.Frame(grid, bg=COLORS['bg_card'])
+        factor_frame = tk.Frame(grid, bg=bg_card)
         factor_frame.grid(row=row, column=1, sticky='ew', 
-                         pady=(0, SPACING['row_gap']), columnspan=2)
+                         pady=(0, row_gap), columnspan=2)
         
         self.app.brightness_scale = ttk.Scale(
             factor_frame,
@@ -695,14 +640,14 @@ class SettingsTab:
             state='disabled'
         )
         self.app.brightness_scale.pack(side='left', fill='x', expand=True,
-                                       padx=(0, SPACING['row_gap']))
+                                       padx=(0, row_gap))
         
         self.app.brightness_value_label = tk.Label(
             factor_frame,
             text=f"{self.app.brightness_var.get():.2f}",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_disabled'],
+            font=font_bold,
+            bg=bg_card,
+            fg=text_disabled,
             width=6
         )
         self.app.brightness_value_label.pack(side='left')
@@ -723,20 +668,17 @@ class SettingsTab:
         
         self.app.brightness_var.trace_add('write', update_brightness_label)
         
-        ToolTip(self.app.brightness_scale,
-               text="Post-processing brightness adjustment for saved images (1.0 = no change). Does not affect camera exposure.",
-               bootstyle="warning-inverse")
+        LazyToolTip(self.app.brightness_scale,
+                   text="Post-processing brightness adjustment for saved images (1.0 = no change). Does not affect camera exposure.",
+                   bootstyle="warning-inverse")
         
         row += 1
         
         # Saturation Factor
-        tk.Label(grid, text="Saturation:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Saturation:")
         
-        scale_frame = tk.Frame(grid, bg=COLORS['bg_card'])
-        scale_frame.grid(row=row, column=1, sticky='ew', pady=(0, SPACING['row_gap']))
+        scale_frame = tk.Frame(grid, bg=bg_card)
+        scale_frame.grid(row=row, column=1, sticky='ew', pady=(0, row_gap))
         
         self.app.saturation_var = tk.DoubleVar(value=1.0)
         self.app.saturation_scale = ttk.Scale(
@@ -747,14 +689,14 @@ class SettingsTab:
             bootstyle="success"
         )
         self.app.saturation_scale.pack(side='left', fill='x', expand=True,
-                                       padx=(0, SPACING['element_gap']))
+                                       padx=(0, element_gap))
         
         self.app.saturation_value_label = tk.Label(
             scale_frame,
             text=f"{self.app.saturation_var.get():.2f}",
-            font=FONTS['body'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_primary'],
+            font=font_body,
+            bg=bg_card,
+            fg=text_primary,
             width=6
         )
         self.app.saturation_value_label.pack(side='left')
@@ -775,16 +717,16 @@ class SettingsTab:
         
         self.app.saturation_var.trace_add('write', update_saturation_label)
         
-        ToolTip(self.app.saturation_scale,
-               text="Color saturation adjustment (0.0 = grayscale, 1.0 = neutral, 2.0 = very saturated)",
-               bootstyle="success-inverse")
+        LazyToolTip(self.app.saturation_scale,
+                   text="Color saturation adjustment (0.0 = grayscale, 1.0 = neutral, 2.0 = very saturated)",
+                   bootstyle="success-inverse")
         
         row += 1
         
         # === Auto Stretch Section ===
         # Separator
         ttk.Separator(grid, orient='horizontal').grid(
-            row=row, column=0, columnspan=3, sticky='ew', pady=SPACING['section_gap'])
+            row=row, column=0, columnspan=3, sticky='ew', pady=section_gap)
         row += 1
         
         # Auto Stretch Toggle
@@ -794,24 +736,21 @@ class SettingsTab:
                                        command=self._on_auto_stretch_toggle,
                                        bootstyle="info-round-toggle")
         stretch_check.grid(row=row, column=0, columnspan=3, sticky='w',
-                          pady=(0, SPACING['row_gap']))
+                          pady=(0, row_gap))
         
-        ToolTip(stretch_check,
-               text="Apply Midtone Transfer Function stretch to enhance image contrast. "
-                    "Best for fixed-exposure captures - brings out detail without changing camera settings.",
-               bootstyle="info-inverse")
+        LazyToolTip(stretch_check,
+                   text="Apply Midtone Transfer Function stretch to enhance image contrast. "
+                        "Best for fixed-exposure captures - brings out detail without changing camera settings.",
+                   bootstyle="info-inverse")
         
         row += 1
         
         # Target Median (how bright the midtones should be)
-        tk.Label(grid, text="Target Brightness:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Target Brightness:")
         
-        stretch_frame = tk.Frame(grid, bg=COLORS['bg_card'])
+        stretch_frame = tk.Frame(grid, bg=bg_card)
         stretch_frame.grid(row=row, column=1, sticky='ew', 
-                          pady=(0, SPACING['row_gap']), columnspan=2)
+                          pady=(0, row_gap), columnspan=2)
         
         self.app.stretch_median_var = tk.DoubleVar(value=0.25)
         self.app.stretch_median_scale = ttk.Scale(
@@ -823,14 +762,14 @@ class SettingsTab:
             state='disabled'
         )
         self.app.stretch_median_scale.pack(side='left', fill='x', expand=True,
-                                           padx=(0, SPACING['row_gap']))
+                                           padx=(0, row_gap))
         
         self.app.stretch_median_label = tk.Label(
             stretch_frame,
             text=f"{int(self.app.stretch_median_var.get()*100)}%",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_disabled'],
+            font=font_bold,
+            bg=bg_card,
+            fg=text_disabled,
             width=6
         )
         self.app.stretch_median_label.pack(side='left')
@@ -850,9 +789,9 @@ class SettingsTab:
         
         self.app.stretch_median_var.trace_add('write', update_stretch_median)
         
-        ToolTip(self.app.stretch_median_scale,
-               text="Target brightness for midtones (10-50%). Lower = darker sky, higher = brighter details",
-               bootstyle="info-inverse")
+        LazyToolTip(self.app.stretch_median_scale,
+                   text="Target brightness for midtones (10-50%). Lower = darker sky, higher = brighter details",
+                   bootstyle="info-inverse")
         
         row += 1
         
@@ -863,13 +802,13 @@ class SettingsTab:
                                       bootstyle="info-square-toggle",
                                       state='disabled')
         linked_check.grid(row=row, column=0, columnspan=3, sticky='w',
-                         pady=(0, SPACING['row_gap']))
+                         pady=(0, row_gap))
         self.app.stretch_linked_check = linked_check
         
-        ToolTip(linked_check,
-               text="When enabled, applies same stretch to all color channels (preserves color). "
-                    "When disabled, stretches each channel independently (may shift colors).",
-               bootstyle="info-inverse")
+        LazyToolTip(linked_check,
+                   text="When enabled, applies same stretch to all color channels (preserves color). "
+                        "When disabled, stretches each channel independently (may shift colors).",
+                   bootstyle="info-inverse")
         
         row += 1
         
@@ -880,25 +819,22 @@ class SettingsTab:
                                                bootstyle="info-square-toggle",
                                                state='disabled')
         preserve_blacks_check.grid(row=row, column=0, columnspan=3, sticky='w',
-                                  pady=(0, SPACING['row_gap']))
+                                  pady=(0, row_gap))
         self.app.stretch_preserve_blacks_check = preserve_blacks_check
         
-        ToolTip(preserve_blacks_check,
-               text="Keep true blacks dark instead of lifting them to grey. "
-                    "Prevents the washed-out look while still stretching midtones.",
-               bootstyle="info-inverse")
+        LazyToolTip(preserve_blacks_check,
+                   text="Keep true blacks dark instead of lifting them to grey. "
+                        "Prevents the washed-out look while still stretching midtones.",
+                   bootstyle="info-inverse")
         
         row += 1
         
         # Shadow Aggressiveness slider
-        tk.Label(grid, text="Shadow Clip:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Shadow Clip:")
         
-        shadow_frame = tk.Frame(grid, bg=COLORS['bg_card'])
+        shadow_frame = tk.Frame(grid, bg=bg_card)
         shadow_frame.grid(row=row, column=1, sticky='ew', 
-                         pady=(0, SPACING['row_gap']), columnspan=2)
+                         pady=(0, row_gap), columnspan=2)
         
         self.app.stretch_shadow_var = tk.DoubleVar(value=2.8)
         self.app.stretch_shadow_scale = ttk.Scale(
@@ -910,14 +846,14 @@ class SettingsTab:
             state='disabled'
         )
         self.app.stretch_shadow_scale.pack(side='left', fill='x', expand=True,
-                                           padx=(0, SPACING['row_gap']))
+                                           padx=(0, row_gap))
         
         self.app.stretch_shadow_label = tk.Label(
             shadow_frame,
             text="Std",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_disabled'],
+            font=font_bold,
+            bg=bg_card,
+            fg=text_disabled,
             width=8
         )
         self.app.stretch_shadow_label.pack(side='left')
@@ -942,21 +878,18 @@ class SettingsTab:
         
         self.app.stretch_shadow_var.trace_add('write', update_shadow_label)
         
-        ToolTip(self.app.stretch_shadow_scale,
-               text="How aggressively to clip shadows. Gentle = darker blacks preserved, Aggressive = more lifted.",
-               bootstyle="info-inverse")
+        LazyToolTip(self.app.stretch_shadow_scale,
+                   text="How aggressively to clip shadows. Gentle = darker blacks preserved, Aggressive = more lifted.",
+                   bootstyle="info-inverse")
         
         row += 1
         
         # Saturation Boost slider
-        tk.Label(grid, text="Saturation Boost:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Saturation Boost:")
         
-        sat_boost_frame = tk.Frame(grid, bg=COLORS['bg_card'])
+        sat_boost_frame = tk.Frame(grid, bg=bg_card)
         sat_boost_frame.grid(row=row, column=1, sticky='ew', 
-                            pady=(0, SPACING['row_gap']), columnspan=2)
+                            pady=(0, row_gap), columnspan=2)
         
         self.app.stretch_saturation_var = tk.DoubleVar(value=1.5)
         self.app.stretch_saturation_scale = ttk.Scale(
@@ -968,14 +901,14 @@ class SettingsTab:
             state='disabled'
         )
         self.app.stretch_saturation_scale.pack(side='left', fill='x', expand=True,
-                                               padx=(0, SPACING['row_gap']))
+                                               padx=(0, row_gap))
         
         self.app.stretch_saturation_label = tk.Label(
             sat_boost_frame,
             text="1.5x",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_disabled'],
+            font=font_bold,
+            bg=bg_card,
+            fg=text_disabled,
             width=6
         )
         self.app.stretch_saturation_label.pack(side='left')
@@ -994,10 +927,10 @@ class SettingsTab:
         
         self.app.stretch_saturation_var.trace_add('write', update_saturation_label)
         
-        ToolTip(self.app.stretch_saturation_scale,
-               text="Boost color saturation after stretch (1.0 = no boost, 2.0 = double). "
-                    "Helps restore color vibrancy that stretching can reduce.",
-               bootstyle="info-inverse")
+        LazyToolTip(self.app.stretch_saturation_scale,
+                   text="Boost color saturation after stretch (1.0 = no boost, 2.0 = double). "
+                        "Helps restore color vibrancy that stretching can reduce.",
+                   bootstyle="info-inverse")
         
         row += 1
         
@@ -1013,8 +946,12 @@ class SettingsTab:
     
     def create_cleanup_settings(self, parent):
         """Create cleanup settings with grid layout"""
+        bg_card = COLORS['bg_card']
+        font_body = FONTS['body']
+        row_gap = SPACING['row_gap']
+        
         # Grid container
-        grid = tk.Frame(parent, bg=COLORS['bg_card'])
+        grid = tk.Frame(parent, bg=bg_card)
         grid.pack(fill='x')
         grid.columnconfigure(1, weight=1)  # Make input column expandable
         
@@ -1027,61 +964,54 @@ class SettingsTab:
                                        command=self._on_cleanup_toggle,
                                        bootstyle="warning-round-toggle")
         cleanup_check.grid(row=row, column=0, columnspan=3, sticky='w',
-                          pady=(0, SPACING['row_gap']))
+                          pady=(0, row_gap))
         
         row += 1
         
         # Max Size
-        tk.Label(grid, text="Max Size (GB):", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w', pady=(0, SPACING['row_gap']))
+        self._row_label(grid, row, "Max Size (GB):")
         
         self.app.cleanup_max_size_var = tk.DoubleVar(value=10.0)
         self.app.cleanup_size_spinbox = ttk.Spinbox(
             grid,
             from_=1.0, to=1000.0, increment=1.0,
             textvariable=self.app.cleanup_max_size_var,
-            width=12, font=FONTS['body'],
+            width=12, font=font_body,
             style='Dark.TSpinbox',
             state='disabled'
         )
         self.app.cleanup_size_spinbox.grid(row=row, column=1, sticky='w',
-                                          pady=(0, SPACING['row_gap']))
+                                          pady=(0, row_gap))
         
         row += 1
         
         # Strategy
-        tk.Label(grid, text="Strategy:", font=FONTS['body'],
-                bg=COLORS['bg_card'], fg=COLORS['text_secondary'],
-                width=LAYOUT['label_width'], anchor='w').grid(
-            row=row, column=0, sticky='w')
+        self._row_label(grid, row, "Strategy:", pady=0)
         
         self.app.cleanup_strategy_var = tk.StringVar(value="oldest")
         self.app.cleanup_strategy_combo = ttk.Combobox(
             grid,
             textvariable=self.app.cleanup_strategy_var,
-            width=40, font=FONTS['body'],
+            width=40, font=font_body,
             style='Dark.TCombobox',
             state='disabled',
             values=['oldest - Delete oldest files in watch directory']
         )
         self.app.cleanup_strategy_combo.grid(row=row, column=1, sticky='ew', columnspan=2)
         
-        ToolTip(self.app.cleanup_strategy_combo,
-               text="Only 'oldest' strategy supported - deletes files by modification time (never deletes folders)",
-               bootstyle="warning-inverse")
+        LazyToolTip(self.app.cleanup_strategy_combo,
+                   text="Only 'oldest' strategy supported - deletes files by modification time (never deletes folders)",
+                   bootstyle="warning-inverse")
     
     def _on_cleanup_toggle(self):
         """Handle cleanup enable/disable toggle"""
         enabled = self.app.cleanup_enabled_var.get()
         
-        if enabled:
-            self.app.cleanup_size_spinbox.config(state='normal')
-            self.app.cleanup_strategy_combo.config(state='readonly')
-        else:
-            self.app.cleanup_size_spinbox.config(state='disabled')
-            self.app.cleanup_strategy_combo.config(state='disabled')
+        # Resolve both target states up front, then apply them together
+        size_state, strategy_state = ('normal', 'readonly') if enabled else ('disabled', 'disabled')
+        for widget, state in ((self.app.cleanup_size_spinbox, size_state),
+                              (self.app.cleanup_strategy_combo, strategy_state)):
+            widget.configure(state=state)
     
     def _on_auto_stretch_toggle(self):
         """Handle auto-stretch enable/disable toggle"""
@@ -1139,15 +1069,30 @@ class SettingsTab:
         pass
     
     def _check_ffmpeg_available(self):
-        """Check if ffmpeg is available in PATH"""
-        import subprocess
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                timeout=3,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            return result.returncode == 0
-        except:
-            return False
\ No newline at end of file
+        """Check if ffmpeg is available in PATH
+        
+        Returns True/False once the background probe has finished, None while
+        it is still running.
+        """
+        future = start_ffmpeg_probe()
+        return future.result() if future.done() else None
+    
+    def _recheck_ffmpeg(self, toggle_group, btn_frame):
+        """Poll the ffmpeg probe; drop the RTSP option once it reports missing"""
+        ffmpeg_available = self._check_ffmpeg_available()
+        if ffmpeg_available is None:
+            self.tab.after(200, self._recheck_ffmpeg, toggle_group, btn_frame)
+        elif not ffmpeg_available:
+            rtsp_btn = toggle_group.buttons.pop('rtsp', None)
+            if rtsp_btn is not None:
+                rtsp_btn.destroy()
+            self._show_rtsp_hint(btn_frame)
+    
+    def _show_rtsp_hint(self, btn_frame):
+        """Show the 'RTSP requires ffmpeg' hint next to the mode buttons"""
+        rtsp_hint = ttk.Label(
+            btn_frame,
+            text="(RTSP requires ffmpeg)",
+            style='MutedLabel.TLabel'
+        )
+        rtsp_hint.pack(side='left', padx=(SPACING['element_gap'], 0))
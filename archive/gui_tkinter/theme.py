@@ -5,6 +5,7 @@ Uses Iris accent color and Sand gray scale with glass effects
 """
 import tkinter as tk
 import ttkbootstrap as ttk
+from ttkbootstrap.tooltip import ToolTip
 
 # ===== COLOR PALETTE (PFRAstro Style Guide) =====
 # Based on Radix Colors: Iris accent, Sand gray scale
@@ -189,11 +190,22 @@ class GradientFrame(tk.Canvas):
         self.tag_lower('gradient')
 
 
-def configure_dark_input_styles():
+_STYLES_CONFIGURED = False  # configure_dark_input_styles() already ran
+
+
+def configure_dark_input_styles(force=False):
     """
     Configure ttk styles for dark theme inputs
     Uses PFRAstro color palette with Sand gray scale
+    
+    Runs once per process; later calls (e.g. from each tab) return early
+    unless force=True (needed after switching the ttk theme).
     """
+    global _STYLES_CONFIGURED
+    if _STYLES_CONFIGURED and not force:
+        return
+    _STYLES_CONFIGURED = True
+    
     style = ttk.Style()
     
     # Dark Entry style
@@ -255,6 +267,22 @@ def configure_dark_input_styles():
              foreground=[('disabled', COLORS['text_disabled'])],
              bordercolor=[('focus', COLORS['accent_6'])])
     
+    # Card label styles (shared instead of per-widget font/bg/fg options)
+    style.configure('CardLabel.TLabel',
+                   font=FONTS['body'],
+                   background=COLORS['bg_card'],
+                   foreground=COLORS['text_secondary'])
+    
+    style.configure('MutedLabel.TLabel',
+                   font=FONTS['tiny'],
+                   background=COLORS['bg_card'],
+                   foreground=COLORS['text_muted'])
+    
+    style.configure('BodyBoldLabel.TLabel',
+                   font=FONTS['body_bold'],
+                   background=COLORS['bg_card'],
+                   foreground=COLORS['text_primary'])
+    
     # Status Badge styles
     style.configure('Status.TLabel',
                    font=FONTS['status'],
@@ -902,3 +930,34 @@ class ToggleSwitch(tk.Frame):
             fill=COLORS['text_primary'],
             outline=COLORS['text_primary']
         )
+
+
+class LazyToolTip:
+    """
+    Tooltip that creates its ttkbootstrap ToolTip on first hover.
+    
+    Settings tabs attach many tooltips that are never shown; this keeps
+    construction to a single <Enter> binding per widget.
+    """
+    def __init__(self, widget, text, bootstyle=None, **kwargs):
+        """
+        Attach a lazily created tooltip.
+        
+        Args:
+            widget: Widget the tooltip belongs to
+            text: Tooltip text
+            bootstyle: ttkbootstrap style for the tooltip
+            **kwargs: Extra ToolTip options
+        """
+        self.widget = widget
+        self.tooltip = None
+        self._options = dict(kwargs, text=text, bootstyle=bootstyle)
+        widget.bind('<Enter>', self._on_enter, add='+')
+    
+    def _on_enter(self, event=None):
+        """Create the real tooltip on first hover and show it for this event"""
+        if self.tooltip is not None:
+            return
+        self.tooltip = ToolTip(self.widget, **self._options)
+        # ToolTip's own <Enter> binding wasn't active for this event
+        self.tooltip.enter(event)
@@ -31,6 +31,11 @@ import shutil
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -148,26 +153,27 @@ def create_camera_profiles(cameras):
     return profiles
 
 
-def update_config(profiles):
+def load_config(config_path):
+    """Load config.json once (orjson when available, stdlib json otherwise)"""
+    if not os.path.exists(config_path):
+        print("ℹ No existing config, will create new one")
+        return {}
+    
+    try:
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson else json.loads(data)
+        print(f"✓ Loaded existing config from: {config_path}")
+        return config
+    except Exception as e:
+        print(f"⚠ Error loading config: {e}")
+        return {}
+
+
+def update_config(profiles, config, config_path):
     """Update config.json with new camera profiles"""
     print("\n=== Updating Config ===")
     
-    config_dir = get_app_data_dir()
-    config_path = os.path.join(config_dir, 'config.json')
-    
-    # Load existing config
-    config = {}
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            print(f"✓ Loaded existing config from: {config_path}")
-        except Exception as e:
-            print(f"⚠ Error loading config: {e}")
-            config = {}
-    else:
-        print("ℹ No existing config, will create new one")
-    
     # Add/update camera profiles
     if 'camera_profiles' not in config:
         config['camera_profiles'] = {}
@@ -178,8 +184,12 @@ def update_config(profiles):
     
     # Save updated config
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        if orjson:
+            with open(config_path, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(config, f, indent=2)
         print(f"\n✓ Config saved to: {config_path}")
         return True
     except Exception as e:
@@ -211,15 +221,8 @@ def main():
     # Get SDK path from config or use default
     config_dir = get_app_data_dir()
     config_path = os.path.join(config_dir, 'config.json')
-    sdk_path = 'ASICamera2.dll'  # Default
-    
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                sdk_path = config.get('zwo_sdk_path', sdk_path)
-        except:
-            pass
+    config = load_config(config_path)
+    sdk_path = config.get('zwo_sdk_path', 'ASICamera2.dll')
     
     # Detect cameras
     cameras = detect_cameras(sdk_path)
@@ -236,7 +239,7 @@ def main():
     profiles = create_camera_profiles(cameras)
     
     # Update config
-    if not update_config(profiles):
+    if not update_config(profiles, config, config_path):
         print("\n✗ Failed to update config!")
         if backup_path:
             print(f"\nYou can restore from backup: {backup_path}")
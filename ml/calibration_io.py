@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Shared loading helpers for calibration_*.json files.
+
+Usage:
+    from ml.calibration_io import read_calibration, load_all
+    
+    calibrations = load_all(cal_files, my_loader)
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def find_calibration_files(directory, recursive: bool = True) -> list:
+    """
+    Find all calibration_*.json files in directory.
+    
+    os.scandir reuses the directory entry type info, so only matching
+    names are turned into Path objects (much cheaper than pathlib globbing).
+    """
+    matches = []
+    pending = [str(directory)]
+    
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif name.startswith('calibration_') and name.endswith('.json'):
+                        matches.append(Path(entry.path))
+        except OSError as e:
+            print(f"Warning: Could not scan {current}: {e}")
+    
+    return matches
+
+
+def read_calibration(path: Path) -> dict:
+    """Parse one calibration JSON file (orjson when available); raises on failure."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def load_all(paths, load, max_workers: int = 16) -> list:
+    """
+    Apply load to every path concurrently, dropping None results.
+    
+    File reads release the GIL, so a thread pool overlaps I/O with parsing.
+    Results keep the order of paths.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = list(executor.map(load, paths))
+    return [data for data in loaded if data is not None]
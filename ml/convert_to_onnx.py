@@ -14,8 +14,16 @@ Usage:
     # Or convert specific model:
     python ml/convert_to_onnx.py --model roof
     python ml/convert_to_onnx.py --model sky
+    
+    # Also emit INT8-quantized (*_int8.onnx) / half-precision (*_fp16.onnx) variants:
+    python ml/convert_to_onnx.py --int8 --fp16
 """
 import argparse
+import contextlib
+import copy
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -98,10 +106,12 @@ class RoofClassifierCNN(nn.Module):
 class SkyClassifierCNN(nn.Module):
     """CNN architecture for sky classification."""
     
-    def __init__(self, image_size: int = 256, metadata_features: int = 6):
+    def __init__(self, image_size: int = 256, metadata_features: int = 6,
+                 global_pool: bool = False):
         super().__init__()
         
         self.image_size = image_size
+        self.global_pool = global_pool
         
         self.conv1 = nn.Conv2d(1, 32, 3, padding=1)
         self.bn1 = nn.BatchNorm2d(32)
@@ -117,7 +127,12 @@ class SkyClassifierCNN(nn.Module):
         self.pool = nn.MaxPool2d(2, 2)
         self.dropout = nn.Dropout(0.3)
         
-        conv_output_size = (image_size // 32) ** 2 * 256
+        # Global average pooling shrinks fc_image from 256*(size/32)^2 inputs to 256
+        if global_pool:
+            self.gap = nn.AdaptiveAvgPool2d(1)
+            conv_output_size = 256
+        else:
+            conv_output_size = (image_size // 32) ** 2 * 256
         
         self.fc_image = nn.Linear(conv_output_size, 256)
         self.fc_meta = nn.Linear(metadata_features, 32)
@@ -134,6 +149,8 @@ class SkyClassifierCNN(nn.Module):
         x = self.pool(F.relu(self.bn3(self.conv3(x))))
         x = self.pool(F.relu(self.bn4(self.conv4(x))))
         x = self.pool(F.relu(self.bn5(self.conv5(x))))
+        if self.global_pool:
+            x = self.gap(x)
         
         x = x.view(x.size(0), -1)
         x = self.dropout(F.relu(self.fc_image(x)))
@@ -151,7 +168,113 @@ class SkyClassifierCNN(nn.Module):
         return sky_logits, stars_logit, density, moon_logit
 
 
-def convert_roof_classifier(input_path: Path, output_path: Path, image_size: int = 128):
+# Conv/BatchNorm module pairs folded together before export
+ROOF_FUSE_PAIRS = [[f'conv_layers.{i}', f'conv_layers.{i + 1}'] for i in (0, 4, 8, 12, 16)]
+SKY_FUSE_PAIRS = [[f'conv{i}', f'bn{i}'] for i in range(1, 6)]
+
+ROOF_OUTPUT_NAMES = ['output']
+SKY_OUTPUT_NAMES = ['sky_logits', 'stars_logit', 'density', 'moon_logit']
+
+
+def fuse_conv_bn(model, pairs):
+    """
+    Fold each BatchNorm into the preceding Conv (eval mode only).
+    
+    The BN scale/shift is baked into the conv weights and the BN module is
+    replaced with Identity, so the exported graph has one node per layer
+    instead of two.
+    """
+    from torch.ao.quantization import fuse_modules
+    return fuse_modules(model, pairs)
+
+
+def export_onnx(model, dummy_image, dummy_metadata, output_path: Path, output_names):
+    """Export a classifier to ONNX with a dynamic batch axis."""
+    dynamic_axes = {name: {0: 'batch'} for name in ['image', 'metadata', *output_names]}
+    
+    # Trace once up front so the exporter works on a flat TorchScript graph
+    # rather than re-dispatching through the nn.Sequential containers
+    with torch.no_grad():
+        traced = torch.jit.trace(model, (dummy_image, dummy_metadata))
+    
+    torch.onnx.export(
+        traced,
+        (dummy_image, dummy_metadata),
+        str(output_path),
+        input_names=['image', 'metadata'],
+        output_names=output_names,
+        dynamic_axes=dynamic_axes,
+        opset_version=14,
+        do_constant_folding=True,
+    )
+
+
+def update_onnx_weights(model, output_path: Path) -> bool:
+    """
+    Overwrite the initializers of an existing ONNX export with new weights.
+    
+    Retracing the model is the slow part of a conversion; when only the
+    weights changed, the existing graph can be reused. Every initializer must
+    map to a state_dict tensor of the same name and shape, otherwise nothing
+    is written and the caller falls back to a full export.
+    
+    Returns:
+        True if the existing file was updated in place
+    """
+    if not output_path.exists():
+        return False
+    try:
+        import onnx
+        from onnx import numpy_helper
+    except ImportError:
+        return False
+    
+    try:
+        model_proto = onnx.load(str(output_path))
+    except Exception as e:
+        print(f"  (Existing ONNX file unreadable, re-exporting: {e})")
+        return False
+    
+    state = {name: tensor.detach().cpu().numpy() for name, tensor in model.state_dict().items()}
+    initializers = model_proto.graph.initializer
+    
+    replacements = []
+    for init in initializers:
+        weight = state.get(init.name)
+        if weight is None or tuple(init.dims) != weight.shape:
+            return False
+        replacements.append(numpy_helper.from_array(weight, name=init.name))
+    if not replacements:
+        return False
+    
+    for init, replacement in zip(initializers, replacements):
+        init.CopyFrom(replacement)
+    onnx.save(model_proto, str(output_path))
+    return True
+
+
+def export_fp16_variant(model, dummy_image, dummy_metadata, output_path: Path, output_names):
+    """Export a half-precision copy of the model as *_fp16.onnx and check it."""
+    fp16_path = output_path.with_name(f"{output_path.stem}_fp16{output_path.suffix}")
+    fp16_image = dummy_image.half()
+    fp16_metadata = dummy_metadata.half()
+    try:
+        export_onnx(copy.deepcopy(model).half(), fp16_image, fp16_metadata,
+                    fp16_path, output_names)
+    except Exception as e:
+        print(f"  WARNING: FP16 export failed: {e}")
+        return None
+    
+    print(f"✓ Exported FP16 model: {fp16_path.name}")
+    
+    # FP16 loses precision, so compare against the FP32 model more loosely
+    compare_outputs(model, fp16_path, fp16_image, fp16_metadata,
+                    output_names=output_names, tolerance=1e-3)
+    return fp16_path
+
+
+def convert_roof_classifier(input_path: Path, output_path: Path, image_size: int = 128,
+                            int8: bool = False, fp16: bool = False, full_export: bool = False):
     """Convert roof classifier to ONNX."""
     print(f"\n=== Converting Roof Classifier ===")
     print(f"Input:  {input_path}")
@@ -162,28 +285,18 @@ def convert_roof_classifier(input_path: Path, output_path: Path, image_size: int
     model = RoofClassifierCNN(image_size=image_size)
     model.load_state_dict(checkpoint['model_state_dict'])
     model.eval()
+    model = fuse_conv_bn(model, ROOF_FUSE_PAIRS)
     
     # Create dummy inputs
     dummy_image = torch.randn(1, 1, image_size, image_size)
     dummy_metadata = torch.randn(1, 4)
     
-    # Export to ONNX
-    torch.onnx.export(
-        model,
-        (dummy_image, dummy_metadata),
-        str(output_path),
-        input_names=['image', 'metadata'],
-        output_names=['output'],
-        dynamic_axes={
-            'image': {0: 'batch'},
-            'metadata': {0: 'batch'},
-            'output': {0: 'batch'}
-        },
-        opset_version=14,
-        do_constant_folding=True,
-    )
-    
-    print(f"✓ Exported roof classifier to ONNX")
+    # Export to ONNX (or just swap in the new weights if the graph already exists)
+    if not full_export and update_onnx_weights(model, output_path):
+        print(f"✓ Updated weights in existing roof classifier ONNX graph")
+    else:
+        export_onnx(model, dummy_image, dummy_metadata, output_path, ROOF_OUTPUT_NAMES)
+        print(f"✓ Exported roof classifier to ONNX")
     
     # Verify
     verify_onnx_model(output_path)
@@ -191,11 +304,17 @@ def convert_roof_classifier(input_path: Path, output_path: Path, image_size: int
     # Compare outputs
     compare_outputs(
         model, output_path, dummy_image, dummy_metadata,
-        output_names=['output']
+        output_names=ROOF_OUTPUT_NAMES
     )
+    
+    if int8:
+        quantize_onnx_model(output_path)
+    if fp16:
+        export_fp16_variant(model, dummy_image, dummy_metadata, output_path, ROOF_OUTPUT_NAMES)
 
 
-def convert_sky_classifier(input_path: Path, output_path: Path, image_size: int = 256):
+def convert_sky_classifier(input_path: Path, output_path: Path, image_size: int = 256,
+                           int8: bool = False, fp16: bool = False, full_export: bool = False):
     """Convert sky classifier to ONNX."""
     print(f"\n=== Converting Sky Classifier ===")
     print(f"Input:  {input_path}")
@@ -205,59 +324,38 @@ def convert_sky_classifier(input_path: Path, output_path: Path, image_size: int
     checkpoint = torch.load(input_path, map_location='cpu', weights_only=False)
     saved_image_size = checkpoint.get('image_size', image_size)
     metadata_features = checkpoint.get('metadata_features', 6)
+    global_pool = checkpoint.get('global_pool', False)
     
-    model = SkyClassifierCNN(image_size=saved_image_size, metadata_features=metadata_features)
+    model = SkyClassifierCNN(image_size=saved_image_size, metadata_features=metadata_features,
+                             global_pool=global_pool)
     model.load_state_dict(checkpoint['model_state_dict'])
     model.eval()
+    model = fuse_conv_bn(model, SKY_FUSE_PAIRS)
     
     # Create dummy inputs
     dummy_image = torch.randn(1, 1, saved_image_size, saved_image_size)
     dummy_metadata = torch.randn(1, metadata_features)
     
-    # Export to ONNX
-    torch.onnx.export(
-        model,
-        (dummy_image, dummy_metadata),
-        str(output_path),
-        input_names=['image', 'metadata'],
-        output_names=['sky_logits', 'stars_logit', 'density', 'moon_logit'],
-        dynamic_axes={
-            'image': {0: 'batch'},
-            'metadata': {0: 'batch'},
-            'sky_logits': {0: 'batch'},
-            'stars_logit': {0: 'batch'},
-            'density': {0: 'batch'},
-            'moon_logit': {0: 'batch'},
-        },
-        opset_version=14,
-        do_constant_folding=True,
-    )
-    
-    print(f"✓ Exported sky classifier to ONNX")
+    # Export to ONNX (or just swap in the new weights if the graph already exists)
+    if not full_export and update_onnx_weights(model, output_path):
+        print(f"✓ Updated weights in existing sky classifier ONNX graph")
+    else:
+        export_onnx(model, dummy_image, dummy_metadata, output_path, SKY_OUTPUT_NAMES)
+        print(f"✓ Exported sky classifier to ONNX")
     
     # Verify
     verify_onnx_model(output_path)
     
     # Compare outputs
-    with torch.no_grad():
-        pytorch_outputs = model(dummy_image, dummy_metadata)
-    
-    import onnxruntime as ort
-    session = ort.InferenceSession(str(output_path))
-    onnx_outputs = session.run(None, {
-        'image': dummy_image.numpy(),
-        'metadata': dummy_metadata.numpy()
-    })
+    compare_outputs(
+        model, output_path, dummy_image, dummy_metadata,
+        output_names=SKY_OUTPUT_NAMES
+    )
     
-    print("\nOutput comparison (PyTorch vs ONNX):")
-    output_names = ['sky_logits', 'stars_logit', 'density', 'moon_logit']
-    for i, name in enumerate(output_names):
-        pt_out = pytorch_outputs[i].numpy()
-        onnx_out = onnx_outputs[i]
-        max_diff = np.abs(pt_out - onnx_out).max()
-        print(f"  {name}: max_diff = {max_diff:.2e}")
-        if max_diff > 1e-5:
-            print(f"    WARNING: Large difference detected!")
+    if int8:
+        quantize_onnx_model(output_path)
+    if fp16:
+        export_fp16_variant(model, dummy_image, dummy_metadata, output_path, SKY_OUTPUT_NAMES)
 
 
 def verify_onnx_model(model_path: Path):
@@ -273,51 +371,139 @@ def verify_onnx_model(model_path: Path):
         print(f"  WARNING: ONNX validation failed: {e}")
 
 
-def compare_outputs(pytorch_model, onnx_path: Path, image, metadata, output_names):
-    """Compare PyTorch and ONNX outputs."""
+def quantize_onnx_model(model_path: Path) -> Path:
+    """
+    Write an INT8 dynamically-quantized copy of an ONNX model.
+    
+    Weights of the Conv/MatMul layers are stored as per-channel INT8, which
+    roughly quarters model size and lets ONNX Runtime use integer kernels.
+    The FP32 model is left untouched next to the *_int8.onnx variant.
+    
+    Returns:
+        Path of the quantized model, or None if quantization was skipped
+    """
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+    except ImportError:
+        print("  (Skipping INT8 quantization - onnxruntime not installed)")
+        return None
+    
+    int8_path = model_path.with_name(f"{model_path.stem}_int8{model_path.suffix}")
+    try:
+        quantize_dynamic(
+            str(model_path),
+            str(int8_path),
+            weight_type=QuantType.QInt8,
+            per_channel=True,
+        )
+    except Exception as e:
+        print(f"  WARNING: INT8 quantization failed: {e}")
+        return None
+    
+    fp32_mb = model_path.stat().st_size / (1024 * 1024)
+    int8_mb = int8_path.stat().st_size / (1024 * 1024)
+    print(f"✓ Wrote INT8 model: {int8_path.name} ({fp32_mb:.1f} MB -> {int8_mb:.1f} MB)")
+    return int8_path
+
+
+# ONNX Runtime intra-op threads for verification sessions (0 = all cores);
+# parallel conversion workers set this to 1 so they don't oversubscribe the CPU
+_ORT_INTRA_OP_THREADS = 0
+
+
+def create_inference_session(onnx_path: Path):
+    """Create an ONNX Runtime CPU session with full graph optimization (None if unavailable)."""
     try:
         import onnxruntime as ort
     except ImportError:
+        return None
+    
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = _ORT_INTRA_OP_THREADS
+    return ort.InferenceSession(
+        str(onnx_path), sess_options=options, providers=['CPUExecutionProvider']
+    )
+
+
+def compare_outputs(pytorch_model, onnx_path: Path, image, metadata, output_names,
+                    tolerance: float = 1e-5):
+    """Compare PyTorch and ONNX outputs."""
+    session = create_inference_session(onnx_path)
+    if session is None:
         print("  (Skipping output comparison - onnxruntime not installed)")
         return
     
     # PyTorch inference
     with torch.no_grad():
-        pytorch_output = pytorch_model(image, metadata)
+        pytorch_outputs = pytorch_model(image.float(), metadata.float())
+    if not isinstance(pytorch_outputs, (tuple, list)):
+        pytorch_outputs = (pytorch_outputs,)
     
-    # ONNX inference
-    session = ort.InferenceSession(str(onnx_path))
-    onnx_output = session.run(None, {
-        'image': image.numpy(),
-        'metadata': metadata.numpy()
-    })
+    # ONNX inference - bind the input buffers directly instead of going
+    # through the generic run() path, which copies the feed dict
+    binding = session.io_binding()
+    binding.bind_cpu_input('image', image.numpy())
+    binding.bind_cpu_input('metadata', metadata.numpy())
+    for name in output_names:
+        binding.bind_output(name)
+    session.run_with_iobinding(binding)
+    onnx_outputs = binding.copy_outputs_to_cpu()
     
     print("\nOutput comparison (PyTorch vs ONNX):")
     for i, name in enumerate(output_names):
-        pt_out = pytorch_output.numpy() if hasattr(pytorch_output, 'numpy') else pytorch_output
-        onnx_out = onnx_output[i]
+        pt_out = pytorch_outputs[i].numpy()
+        onnx_out = onnx_outputs[i].astype(np.float32)
         max_diff = np.abs(pt_out - onnx_out).max()
         print(f"  {name}: max_diff = {max_diff:.2e}")
-        if max_diff > 1e-5:
+        if max_diff > tolerance:
             print(f"    WARNING: Large difference detected!")
 
 
+def _init_worker(num_threads: int):
+    """Limit PyTorch and ONNX Runtime intra-op threads in a conversion worker process."""
+    global _ORT_INTRA_OP_THREADS
+    torch.set_num_threads(num_threads)
+    _ORT_INTRA_OP_THREADS = 1
+
+
+def _run_buffered(func, input_path: Path, output_path: Path, **options) -> str:
+    """Run one conversion in a worker, returning its log so outputs don't interleave."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            func(input_path, output_path, **options)
+        except Exception as e:
+            print(f"ERROR: Conversion failed: {e}")
+    return log.getvalue()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Convert ML models to ONNX")
     parser.add_argument("--model", choices=['roof', 'sky', 'all'], default='all',
                         help="Which model to convert")
     parser.add_argument("--models-dir", default="ml/models",
                         help="Directory containing model files")
+    parser.add_argument("--int8", action="store_true",
+                        help="Also write INT8-quantized *_int8.onnx variants")
+    parser.add_argument("--fp16", action="store_true",
+                        help="Also write half-precision *_fp16.onnx variants")
+    parser.add_argument("--full-export", action="store_true",
+                        help="Always re-trace the model instead of updating weights in an existing ONNX file")
+    parser.add_argument("--serial", action="store_true",
+                        help="Convert models one after another instead of in parallel processes")
     args = parser.parse_args()
     
     models_dir = Path(args.models_dir)
+    options = dict(int8=args.int8, fp16=args.fp16, full_export=args.full_export)
+    jobs = []
     
     if args.model in ['roof', 'all']:
         roof_pth = models_dir / "roof_classifier_v1.pth"
         roof_onnx = models_dir / "roof_classifier_v1.onnx"
         
         if roof_pth.exists():
-            convert_roof_classifier(roof_pth, roof_onnx)
+            jobs.append((convert_roof_classifier, roof_pth, roof_onnx))
         else:
             print(f"ERROR: Roof model not found: {roof_pth}")
     
@@ -326,10 +512,24 @@ def main():
         sky_onnx = models_dir / "sky_classifier_v1.onnx"
         
         if sky_pth.exists():
-            convert_sky_classifier(sky_pth, sky_onnx)
+            jobs.append((convert_sky_classifier, sky_pth, sky_onnx))
         else:
             print(f"ERROR: Sky model not found: {sky_pth}")
     
+    if len(jobs) > 1 and not args.serial:
+        # Conversions are independent and CPU-bound - run each in its own
+        # process and split the cores between them
+        threads = max(1, (os.cpu_count() or 2) // len(jobs))
+        with ProcessPoolExecutor(max_workers=len(jobs), initializer=_init_worker,
+                                 initargs=(threads,)) as executor:
+            futures = [executor.submit(_run_buffered, func, pth, onnx, **options)
+                       for func, pth, onnx in jobs]
+            for future in futures:
+                print(future.result(), end='')
+    else:
+        for func, pth, onnx in jobs:
+            func(pth, onnx, **options)
+    
     print("\n=== Conversion Complete ===")
     print("\nONNX models can now be used in production builds.")
     print("The ml_service.py will automatically prefer ONNX over PyTorch.")
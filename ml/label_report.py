@@ -8,12 +8,19 @@ missing categories, and suggested targets for balanced training.
 Usage:
     python ml/label_report.py "E:\Pier Camera ML Data"
     python ml/label_report.py  # Uses default path
+    python ml/label_report.py --cache  # Reuse calibration_*.pkl sidecars between runs
 """
 import sys
-import json
+import pickle
 import argparse
 from pathlib import Path
 from collections import defaultdict
+from functools import partial
+
+# Add parent for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.calibration_io import find_calibration_files, read_calibration, load_all
 
 
 # Target samples per category for a well-balanced model
@@ -45,19 +52,57 @@ TARGETS = {
 }
 
 
-def load_calibration_files(data_dir: Path) -> list:
-    """Load all calibration JSON files."""
-    samples = []
-    for cal_file in data_dir.rglob("calibration_*.json"):
+# Only these top-level sections are used by the report
+REPORT_KEYS = ('labels', 'time_context')
+
+
+def _read_cache(cal_file: Path):
+    """Return the pickled sidecar for cal_file if it is at least as new as the JSON."""
+    pkl_file = cal_file.with_suffix('.pkl')
+    try:
+        if pkl_file.stat().st_mtime >= cal_file.stat().st_mtime:
+            return pickle.loads(pkl_file.read_bytes())
+    except Exception:
+        pass
+    return None
+
+
+def _write_cache(cal_file: Path, data: dict):
+    """Write a pickled sidecar next to cal_file (best effort)."""
+    try:
+        cal_file.with_suffix('.pkl').write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+
+def _load_calibration(cal_file: Path, use_cache: bool = False):
+    """Load the report view of one calibration JSON file."""
+    data = _read_cache(cal_file) if use_cache else None
+    if data is None:
         try:
-            with open(cal_file, 'r') as f:
-                data = json.load(f)
-            data['_file'] = cal_file
-            data['_folder'] = cal_file.parent.name
-            samples.append(data)
+            cal = read_calibration(cal_file)
         except Exception as e:
             print(f"Warning: Failed to load {cal_file}: {e}")
-    return samples
+            return None
+        # Keep just the report view so retained samples and sidecars stay small
+        data = {key: cal[key] for key in REPORT_KEYS if key in cal}
+        if use_cache:
+            _write_cache(cal_file, data)
+    data['_file'] = cal_file
+    data['_folder'] = cal_file.parent.name
+    return data
+
+
+def load_calibration_files(data_dir: Path, use_cache: bool = False) -> list:
+    """
+    Load all calibration JSON files.
+    
+    With use_cache, each file's parsed contents are kept in a pickled
+    calibration_*.pkl sidecar. The sidecar is reused until the JSON is
+    modified again (e.g. by the labeling tool).
+    """
+    cal_files = find_calibration_files(data_dir)
+    return load_all(cal_files, partial(_load_calibration, use_cache=use_cache))
 
 
 def analyze_samples(samples: list) -> dict:
@@ -80,44 +125,54 @@ def analyze_samples(samples: list) -> dict:
         'by_folder': defaultdict(lambda: {'total': 0, 'labeled': 0}),
     }
     
+    # Bind the counters once instead of re-indexing stats for every sample
+    roof_counts = stats['roof']
+    sky_counts = stats['sky_condition']
+    period_counts = stats['time_period']
+    density_bins = stats['star_density_bins']
+    combinations = stats['combinations']
+    by_folder = stats['by_folder']
+    
     for sample in samples:
-        folder = sample.get('_folder', 'unknown')
-        stats['by_folder'][folder]['total'] += 1
+        folder_counts = by_folder[sample.get('_folder', 'unknown')]
+        folder_counts['total'] += 1
         
         labels = sample.get('labels', {})
         has_labels = bool(labels.get('labeled_at'))
         
         if has_labels:
             stats['labeled'] += 1
-            stats['by_folder'][folder]['labeled'] += 1
+            folder_counts['labeled'] += 1
+            
+            roof_open = labels.get('roof_open')
+            stars_visible = labels.get('stars_visible')
+            moon_visible = labels.get('moon_visible')
+            roof_str = 'open' if roof_open else 'closed'
             
             # Roof state
-            if labels.get('roof_open'):
-                stats['roof']['open'] += 1
-            else:
-                stats['roof']['closed'] += 1
+            roof_counts[roof_str] += 1
             
             # Sky condition
             sky = labels.get('sky_condition', 'Not set')
-            stats['sky_condition'][sky] += 1
+            sky_counts[sky] += 1
             
             # Stars
-            if labels.get('stars_visible'):
+            if stars_visible:
                 stats['stars_visible'] += 1
                 density = labels.get('star_density', 0)
                 if density == 0:
-                    stats['star_density_bins']['none'] += 1
+                    density_bins['none'] += 1
                 elif density < 0.3:
-                    stats['star_density_bins']['low'] += 1
+                    density_bins['low'] += 1
                 elif density < 0.7:
-                    stats['star_density_bins']['medium'] += 1
+                    density_bins['medium'] += 1
                 else:
-                    stats['star_density_bins']['high'] += 1
+                    density_bins['high'] += 1
             else:
                 stats['stars_not_visible'] += 1
             
             # Moon
-            if labels.get('moon_visible'):
+            if moon_visible:
                 stats['moon_visible'] += 1
             else:
                 stats['moon_not_visible'] += 1
@@ -137,27 +192,34 @@ def analyze_samples(samples: list) -> dict:
             else:
                 period = 'twilight'
             
-            roof_str = 'open' if labels.get('roof_open') else 'closed'
-            combo = f"{period}_{roof_str}"
-            stats['time_period'][combo] += 1
+            period_counts[f"{period}_{roof_str}"] += 1
             
             # Full combination key for rare scenario detection
-            combo_key = f"roof={roof_str}, sky={sky}, stars={labels.get('stars_visible')}, moon={labels.get('moon_visible')}"
-            stats['combinations'][combo_key] += 1
+            combo_key = f"roof={roof_str}, sky={sky}, stars={stars_visible}, moon={moon_visible}"
+            combinations[combo_key] += 1
         else:
             stats['unlabeled'] += 1
     
     return stats
 
 
-def print_bar(count: int, target: int, width: int = 30) -> str:
+# Prebuilt bar strings; each progress bar is sliced from these
+BAR_WIDTH = 30
+_BAR_FILLED = '█' * BAR_WIDTH
+_BAR_EMPTY = '░' * BAR_WIDTH
+
+
+def print_bar(count: int, target: int, width: int = BAR_WIDTH) -> str:
     """Create a progress bar."""
     if target == 0:
         pct = 100
     else:
         pct = min(100, (count / target) * 100)
     filled = int(width * pct / 100)
-    bar = '█' * filled + '░' * (width - filled)
+    if width <= BAR_WIDTH:
+        bar = _BAR_FILLED[:filled] + _BAR_EMPTY[filled:width]
+    else:
+        bar = '█' * filled + '░' * (width - filled)
     status = '✓' if count >= target else ' '
     return f"{bar} {count:4d}/{target:4d} ({pct:5.1f}%) {status}"
 
@@ -281,6 +343,8 @@ def main():
     parser = argparse.ArgumentParser(description="Label distribution report for ML data")
     parser.add_argument("data_dir", nargs="?", default=r"E:\Pier Camera ML Data",
                         help="Directory containing calibration files")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache parsed calibration files in pickle sidecars")
     args = parser.parse_args()
     
     data_dir = Path(args.data_dir)
@@ -289,7 +353,7 @@ def main():
         sys.exit(1)
     
     print(f"Loading calibration files from: {data_dir}")
-    samples = load_calibration_files(data_dir)
+    samples = load_calibration_files(data_dir, use_cache=args.cache)
     
     if not samples:
         print("No calibration files found!")
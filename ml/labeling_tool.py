@@ -59,7 +59,8 @@ except ImportError:
 ML_AVAILABLE = ROOF_ML_AVAILABLE or SKY_ML_AVAILABLE
 
 # Import review tab
-from ml.review_tab import ReviewTab, to_bool
+from ml.review_tab import ReviewTab
+from ml.schema import classify_mode, to_bool
 
 
 def find_sample_sets(data_dir: Path) -> list:
@@ -648,8 +649,8 @@ class LabelingTool(QMainWindow):
         self.last_sky_prediction = None
         self.run_model_prediction()
         
-        # Classified mode
-        mode = self.classify_mode(cal)
+        # Classified mode (stored by backfill_calibration.py when available)
+        mode = cal.get('classified_mode') or classify_mode(cal)
         self.mode_label.setText(mode)
         
         # Load manual labels (or prefill from ML if not yet labeled)
@@ -767,33 +768,6 @@ class LabelingTool(QMainWindow):
                        self.clouds_visible, self.star_density, self.sky_condition]:
             widget.blockSignals(False)
     
-    def classify_mode(self, cal: dict) -> str:
-        """Classify image mode from calibration data."""
-        tc = cal.get('time_context', {})
-        rs = cal.get('roof_state', {})
-        ca = cal.get('corner_analysis', {})
-        
-        # Determine day/night
-        if tc.get('is_daylight'):
-            time_period = 'day'
-        elif tc.get('is_astronomical_night'):
-            time_period = 'night'
-        elif tc.get('period') == 'twilight':
-            return 'twilight'
-        else:
-            hour = tc.get('hour', 12)
-            time_period = 'night' if (hour >= 20 or hour < 6) else 'day'
-        
-        # Determine roof state
-        if rs.get('available') and rs.get('source') == 'nina_api':
-            roof_open = to_bool(rs.get('roof_open', False))
-        else:
-            ratio = ca.get('corner_to_center_ratio', 0.95)
-            roof_open = ratio < 0.95
-        
-        roof_str = 'roof_open' if roof_open else 'roof_closed'
-        return f"{time_period}_{roof_str}"
-    
     def run_model_prediction(self):
         """Run ML models on the current image and display results. Stores results for prefill."""
         sample = self.samples[self.current_index]
@@ -17,13 +17,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QBrush
 
-def to_bool(value) -> bool:
-    """Convert various representations to boolean (handles string 'True'/'False')."""
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return value.lower() in ('true', '1', 'yes')
-    return bool(value)
+from ml.schema import to_bool
 
 class ReviewTab(QWidget):
     """Tab for reviewing ML predictions vs ground truth."""
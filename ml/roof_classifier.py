@@ -170,7 +170,8 @@ class RoofClassifier:
             if not ONNX_AVAILABLE:
                 raise ImportError("ONNX Runtime not installed. Run: pip install onnxruntime")
             
-            self.model = ort.InferenceSession(str(self.model_path))
+            from ml.ort_session import make_ort_session
+            self.model = make_ort_session(self.model_path)
             self.model_type = 'onnx'
             print(f"Loaded ONNX model from: {self.model_path}")
             
@@ -325,7 +326,7 @@ class RoofClassifier:
         ]], dtype=np.float32)
     
     def predict(self, image: np.ndarray,
-                metadata: Optional[dict] = None,
+                metadata: Union[dict, np.ndarray, None] = None,
                 is_astronomical_night: bool = None,
                 hour: int = None) -> RoofPrediction:
         """
@@ -333,26 +334,16 @@ class RoofClassifier:
         
         Args:
             image: Raw image array (grayscale or RGB, any size)
-            metadata: Optional dict with 'corner_to_center_ratio', 'median_lum', etc.
+            metadata: Optional dict with 'corner_to_center_ratio', 'median_lum', etc.,
+                or an already packed (1, 4) float32 array of model inputs
             is_astronomical_night: Override flag (computed from time if None)
             hour: Override hour (current time if None)
             
         Returns:
             RoofPrediction with roof_open, confidence, raw_logit
         """
-        # Preprocess image
         image_input = self.preprocess_image(image)
-        
-        # Get metadata features
-        if metadata is not None:
-            meta_input = np.array([[
-                metadata.get('corner_to_center_ratio', 1.0),
-                metadata.get('median_lum', 0.0),
-                1 if metadata.get('is_astronomical_night') else 0,
-                metadata.get('hour', 12) / 24.0,
-            ]], dtype=np.float32)
-        else:
-            meta_input = self.extract_metadata(image, is_astronomical_night, hour)
+        meta_input = self._metadata_input(image, metadata, is_astronomical_night, hour)
         
         # Run inference
         if self.model_type == 'onnx':
@@ -375,11 +366,26 @@ class RoofClassifier:
         confidence = probability if roof_open else (1 - probability)
         
         return RoofPrediction(
-            roof_open=roof_open,
+            roof_open=bool(roof_open),
             confidence=float(confidence),
             raw_logit=float(logit)
         )
     
+    def _metadata_input(self, image: np.ndarray, metadata: Union[dict, np.ndarray, None],
+                        is_astronomical_night: bool = None, hour: int = None) -> np.ndarray:
+        """Metadata features (1, 4) from a metadata dict, or extracted from the image."""
+        if metadata is None:
+            return self.extract_metadata(image, is_astronomical_night, hour)
+        if isinstance(metadata, np.ndarray):
+            return metadata
+        
+        return np.array([[
+            metadata.get('corner_to_center_ratio', 1.0),
+            metadata.get('median_lum', 0.0),
+            1 if metadata.get('is_astronomical_night') else 0,
+            metadata.get('hour', 12) / 24.0,
+        ]], dtype=np.float32)
+    
     def predict_from_fits(self, fits_path: Union[str, Path],
                           metadata: Optional[dict] = None) -> RoofPrediction:
         """
@@ -6,8 +6,10 @@ Defines the full schema including auto-populated and manual labels.
 Based on actual calibration output from DevModeDataSaver.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Mapping, Optional
 from enum import Enum
 
 
@@ -50,6 +52,23 @@ class Percentiles:
     p99: float = 0.0
 
 
+@dataclass
+class CornerMedians:
+    """Median brightness of each corner ROI."""
+    tl: float = 0.0
+    tr: float = 0.0
+    bl: float = 0.0
+    br: float = 0.0
+
+
+@dataclass
+class RGBCornerBias:
+    """Per-channel median of the corner ROIs."""
+    bias_r: float = 0.0
+    bias_g: float = 0.0
+    bias_b: float = 0.0
+
+
 @dataclass
 class CornerAnalysis:
     """Corner vs center brightness analysis (auto-populated)."""
@@ -58,12 +77,12 @@ class CornerAnalysis:
     corner_med: float = 0.0
     corner_p90: float = 0.0
     corner_stddev: float = 0.0
-    corner_meds: dict = field(default_factory=lambda: {'tl': 0, 'tr': 0, 'bl': 0, 'br': 0})
+    corner_meds: CornerMedians = field(default_factory=CornerMedians)
     center_med: float = 0.0
     center_p90: float = 0.0
     corner_to_center_ratio: float = 1.0  # ~1.0 = roof closed, <0.95 = roof open
     center_minus_corner: float = 0.0
-    rgb_corner_bias: dict = field(default_factory=lambda: {'bias_r': 0, 'bias_g': 0, 'bias_b': 0})
+    rgb_corner_bias: RGBCornerBias = field(default_factory=RGBCornerBias)
 
 
 @dataclass
@@ -73,6 +92,24 @@ class ColorBalance:
     b_g: float = 1.0  # Blue/Green ratio (neutral = 1.0)
 
 
+@dataclass
+class Location:
+    """Observatory location used for sun/moon calculations."""
+    name: str = ""
+    latitude: float = 0.0
+    longitude: float = 0.0
+
+
+@dataclass
+class SunTimes:
+    """Sun event times for the capture date (ISO timestamps)."""
+    dawn: Optional[str] = None
+    sunrise: Optional[str] = None
+    noon: Optional[str] = None
+    sunset: Optional[str] = None
+    dusk: Optional[str] = None
+
+
 @dataclass
 class TimeContext:
     """Sun position and time of day (auto-populated from astral)."""
@@ -82,8 +119,8 @@ class TimeContext:
     detailed_period: str = "unknown"  # dawn, morning, afternoon, evening, dusk, night
     is_daylight: bool = False
     is_astronomical_night: bool = False
-    location: dict = field(default_factory=lambda: {'name': '', 'latitude': 0, 'longitude': 0})
-    sun_times: dict = field(default_factory=dict)  # dawn, sunrise, noon, sunset, dusk
+    location: Location = field(default_factory=Location)
+    sun_times: SunTimes = field(default_factory=SunTimes)
     calculation_method: str = "simple_hour_based"  # or "astral"
 
 
@@ -190,7 +227,7 @@ class SceneLabels:
     output_quality_rating: Optional[int] = None  # 1-5 stars
 
 
-@dataclass  
+@dataclass
 class RecipeUsed:
     """Recipe parameters that produced good results (for supervised learning)."""
     recipe_name: Optional[str] = None  # e.g., "night_stars", "day_overcast"
@@ -296,6 +333,7 @@ class ExtendedCalibration:
     normalized_features: NormalizedFeatures = field(default_factory=NormalizedFeatures)
 
 
+
 # =============================================================================
 # FEATURE LISTS FOR ML MODEL
 # =============================================================================
@@ -394,10 +432,48 @@ STACKING_TARGETS = [
 QUALITY_TARGET = "scene.output_quality_rating"
 
 
+# =============================================================================
+# MOON PHASE NAMES
+# =============================================================================
+
+# Upper (exclusive) phase_value bound of each named phase on the 0-27.99 cycle
+_PHASE_BOUNDS = [1, 7, 8, 14, 15, 21, 22]
+_PHASE_NAMES = [
+    'new_moon', 'waxing_crescent', 'first_quarter', 'waxing_gibbous',
+    'full_moon', 'waning_gibbous', 'last_quarter', 'waning_crescent',
+]
+
+
+def phase_name_of(phase_value: float) -> str:
+    """MoonContext.phase_name for a single phase_value."""
+    return _PHASE_NAMES[bisect_right(_PHASE_BOUNDS, phase_value)]
+
+
 # =============================================================================
 # MODE CLASSIFICATION RULES (derived from calibration data)
 # =============================================================================
 
+# Shared read-only stand-in for missing sections (no per-call {} allocation)
+_EMPTY = MappingProxyType({})
+
+# (time_period, roof_open) -> mode name
+_MODE_TABLE = {
+    ('day', True): 'day_roof_open',
+    ('day', False): 'day_roof_closed',
+    ('night', True): 'night_roof_open',
+    ('night', False): 'night_roof_closed',
+}
+
+
+def to_bool(value) -> bool:
+    """Convert various representations to boolean (handles string 'True'/'False')."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
 def classify_mode(cal: dict) -> str:
     """
     Classify image mode from calibration data.
@@ -410,9 +486,9 @@ def classify_mode(cal: dict) -> str:
     - "twilight": Dawn/dusk transition
     - "unknown": Cannot determine
     """
-    tc = cal.get('time_context', {})
-    rs = cal.get('roof_state', {})
-    ca = cal.get('corner_analysis', {})
+    tc = cal.get('time_context') or _EMPTY
+    rs = cal.get('roof_state') or _EMPTY
+    ca = cal.get('corner_analysis') or _EMPTY
     
     # Determine day/night
     if tc.get('is_daylight'):
@@ -422,57 +498,64 @@ def classify_mode(cal: dict) -> str:
     elif tc.get('period') == 'twilight':
         return 'twilight'
     else:
-        time_period = 'night' if tc.get('hour', 12) >= 20 or tc.get('hour', 12) < 6 else 'day'
+        hour = tc.get('hour', 12)
+        time_period = 'night' if hour >= 20 or hour < 6 else 'day'
     
     # Determine roof state
     if rs.get('available') and rs.get('source') == 'nina_api':
-        roof_open = rs.get('roof_open', False)
+        roof_open = to_bool(rs.get('roof_open', False))
     else:
         # Infer from corner ratio (ratio ~1.0 = uniform = closed)
         ratio = ca.get('corner_to_center_ratio', 0.95)
         roof_open = ratio < 0.95
     
-    roof_str = 'roof_open' if roof_open else 'roof_closed'
-    return f"{time_period}_{roof_str}"
-
-
-def get_mode_recipe_hints(mode: str) -> dict:
+    return _MODE_TABLE[time_period, roof_open]
+
+
+# Recipe hints per mode (read-only, shared by all callers)
+_MODE_HINTS = MappingProxyType({
+    'day_roof_open': MappingProxyType({
+        'asinh': 20,
+        'gamma': 1.0,
+        'shadow_denoise': 0,
+        'chroma_blur': 0,
+    }),
+    'day_roof_closed': MappingProxyType({
+        'asinh': 50,
+        'gamma': 1.2,
+        'shadow_denoise': 0,
+        'chroma_blur': 0,
+    }),
+    'night_roof_open': MappingProxyType({
+        'asinh': 150,
+        'gamma': 0.75,
+        'shadow_denoise': 0.5,
+        'chroma_blur': 3,
+        'blue_suppress': 0.3,
+    }),
+    'night_roof_closed': MappingProxyType({
+        'asinh': 300,
+        'gamma': 0.6,
+        'shadow_denoise': 0.8,
+        'chroma_blur': 5,
+    }),
+    'twilight': MappingProxyType({
+        'asinh': 80,
+        'gamma': 0.9,
+        'shadow_denoise': 0.2,
+        'chroma_blur': 1,
+    }),
+})
+
+
+_DEFAULT_HINTS = _MODE_HINTS['night_roof_open']
+
+
+def get_mode_recipe_hints(mode: str) -> Mapping:
     """
     Get recipe parameter hints for a given mode.
     
-    These are starting points; the ML model will refine them.
+    These are starting points; the ML model will refine them. The returned
+    mapping is read-only - copy it with dict() before modifying.
     """
-    hints = {
-        'day_roof_open': {
-            'asinh': 20,
-            'gamma': 1.0,
-            'shadow_denoise': 0,
-            'chroma_blur': 0,
-        },
-        'day_roof_closed': {
-            'asinh': 50,
-            'gamma': 1.2,
-            'shadow_denoise': 0,
-            'chroma_blur': 0,
-        },
-        'night_roof_open': {
-            'asinh': 150,
-            'gamma': 0.75,
-            'shadow_denoise': 0.5,
-            'chroma_blur': 3,
-            'blue_suppress': 0.3,
-        },
-        'night_roof_closed': {
-            'asinh': 300,
-            'gamma': 0.6,
-            'shadow_denoise': 0.8,
-            'chroma_blur': 5,
-        },
-        'twilight': {
-            'asinh': 80,
-            'gamma': 0.9,
-            'shadow_denoise': 0.2,
-            'chroma_blur': 1,
-        },
-    }
-    return hints.get(mode, hints['night_roof_open'])
+    return _MODE_HINTS.get(mode, _DEFAULT_HINTS)
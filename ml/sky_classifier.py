@@ -85,10 +85,12 @@ if TORCH_AVAILABLE:
     class SkyClassifierCNN(nn.Module):
         """CNN architecture - must match training."""
         
-        def __init__(self, image_size: int = 256, metadata_features: int = 6):
+        def __init__(self, image_size: int = 256, metadata_features: int = 6,
+                     global_pool: bool = False):
             super().__init__()
             
             self.image_size = image_size
+            self.global_pool = global_pool
             
             self.conv1 = nn.Conv2d(1, 32, 3, padding=1)
             self.bn1 = nn.BatchNorm2d(32)
@@ -104,7 +106,11 @@ if TORCH_AVAILABLE:
             self.pool = nn.MaxPool2d(2, 2)
             self.dropout = nn.Dropout(0.3)
             
-            conv_output_size = (image_size // 32) ** 2 * 256
+            if global_pool:
+                self.gap = nn.AdaptiveAvgPool2d(1)
+                conv_output_size = 256
+            else:
+                conv_output_size = (image_size // 32) ** 2 * 256
             
             self.fc_image = nn.Linear(conv_output_size, 256)
             self.fc_meta = nn.Linear(metadata_features, 32)
@@ -121,6 +127,8 @@ if TORCH_AVAILABLE:
             x = self.pool(F.relu(self.bn3(self.conv3(x))))
             x = self.pool(F.relu(self.bn4(self.conv4(x))))
             x = self.pool(F.relu(self.bn5(self.conv5(x))))
+            if self.global_pool:
+                x = self.gap(x)
             
             x = x.view(x.size(0), -1)
             x = self.dropout(F.relu(self.fc_image(x)))
@@ -173,7 +181,8 @@ class SkyClassifier:
             if not ONNX_AVAILABLE:
                 raise ImportError("ONNX Runtime not installed. Run: pip install onnxruntime")
             
-            self.model = ort.InferenceSession(str(self.model_path))
+            from ml.ort_session import make_ort_session
+            self.model = make_ort_session(self.model_path)
             self.model_type = 'onnx'
             # ONNX models use default image_size=256, metadata_features=6
             print(f"Loaded ONNX sky classifier from: {self.model_path}")
@@ -188,11 +197,13 @@ class SkyClassifier:
             # Get model parameters
             self.image_size = checkpoint.get('image_size', 256)
             metadata_features = checkpoint.get('metadata_features', 6)
+            global_pool = checkpoint.get('global_pool', False)
             
             # Create and load model
             self.model = SkyClassifierCNN(
                 image_size=self.image_size,
-                metadata_features=metadata_features
+                metadata_features=metadata_features,
+                global_pool=global_pool
             )
             self.model.load_state_dict(checkpoint['model_state_dict'])
             self.model.to(self.device)
@@ -253,7 +264,7 @@ class SkyClassifier:
         result = trimmed.reshape(size, block_h, size, block_w).mean(axis=(1, 3))
         return result
     
-    def predict(self, image: np.ndarray, metadata: Optional[dict] = None) -> SkyPrediction:
+    def predict(self, image: np.ndarray, metadata: Union[dict, np.ndarray, None] = None) -> SkyPrediction:
         """
         Predict sky condition and celestial objects.
         
@@ -266,25 +277,13 @@ class SkyClassifier:
                 - hour
                 - moon_illumination
                 - moon_is_up
+                or an already packed (1, 6) float32 array of model inputs
                 
         Returns:
             SkyPrediction with all predictions
         """
-        # Preprocess image
         image_input = self.preprocess_image(image)
-        
-        # Build metadata array
-        if metadata is not None:
-            meta_input = np.array([[
-                metadata.get('corner_to_center_ratio', 1.0),
-                metadata.get('median_lum', 0.0),
-                1.0 if metadata.get('is_astronomical_night') else 0.0,
-                metadata.get('hour', 12) / 24.0,
-                metadata.get('moon_illumination', 0.0) / 100.0,
-                1.0 if metadata.get('moon_is_up') else 0.0,
-            ]], dtype=np.float32)
-        else:
-            meta_input = np.array([[1.0, 0.0, 0.0, 0.5, 0.0, 0.0]], dtype=np.float32)
+        meta_input = self._metadata_input(metadata)
         
         # Run inference based on model type
         if self.model_type == 'onnx':
@@ -292,31 +291,16 @@ class SkyClassifier:
                 'image': image_input.astype(np.float32),
                 'metadata': meta_input.astype(np.float32)
             })
-            sky_logits = outputs[0]
-            stars_logit = outputs[1]
-            density = outputs[2]
-            moon_logit = outputs[3]
+            sky_logits, stars_logit, density, moon_logit = outputs[:4]
             
             # Sky condition (softmax)
             sky_exp = np.exp(sky_logits - np.max(sky_logits, axis=1, keepdims=True))
             sky_probs = (sky_exp / sky_exp.sum(axis=1, keepdims=True))[0]
-            sky_idx = int(np.argmax(sky_probs))
-            sky_condition = IDX_TO_SKY[sky_idx]
-            sky_confidence = float(sky_probs[sky_idx])
-            sky_probabilities = {IDX_TO_SKY[i]: float(p) for i, p in enumerate(sky_probs)}
             
-            # Stars (sigmoid)
+            # Stars and moon (sigmoid); density is already sigmoid in model
             stars_prob = float(1 / (1 + np.exp(-stars_logit[0, 0])))
-            stars_visible = stars_prob > 0.5
-            stars_confidence = stars_prob if stars_visible else (1 - stars_prob)
-            
-            # Star density (already sigmoid in model)
-            star_density = float(density[0, 0])
-            
-            # Moon (sigmoid)
             moon_prob = float(1 / (1 + np.exp(-moon_logit[0, 0])))
-            moon_visible = moon_prob > 0.5
-            moon_confidence = moon_prob if moon_visible else (1 - moon_prob)
+            star_density = float(density[0, 0])
             
         elif self.model_type == 'pytorch':
             with torch.no_grad():
@@ -325,37 +309,43 @@ class SkyClassifier:
                 
                 sky_logits, stars_logit, density, moon_logit = self.model(image_tensor, meta_tensor)
                 
-                # Sky condition
                 sky_probs = F.softmax(sky_logits, dim=1).cpu().numpy()[0]
-                sky_idx = int(np.argmax(sky_probs))
-                sky_condition = IDX_TO_SKY[sky_idx]
-                sky_confidence = float(sky_probs[sky_idx])
-                sky_probabilities = {IDX_TO_SKY[i]: float(p) for i, p in enumerate(sky_probs)}
-                
-                # Stars
                 stars_prob = float(torch.sigmoid(stars_logit).cpu().numpy()[0, 0])
-                stars_visible = stars_prob > 0.5
-                stars_confidence = stars_prob if stars_visible else (1 - stars_prob)
-                
-                # Star density
-                star_density = float(density.cpu().numpy()[0, 0])
-                
-                # Moon
                 moon_prob = float(torch.sigmoid(moon_logit).cpu().numpy()[0, 0])
-                moon_visible = moon_prob > 0.5
-                moon_confidence = moon_prob if moon_visible else (1 - moon_prob)
+                star_density = float(density.cpu().numpy()[0, 0])
+        
+        sky_idx = int(np.argmax(sky_probs))
+        stars_visible = stars_prob > 0.5
+        moon_visible = moon_prob > 0.5
         
         return SkyPrediction(
-            sky_condition=sky_condition,
-            sky_confidence=sky_confidence,
-            sky_probabilities=sky_probabilities,
+            sky_condition=IDX_TO_SKY[sky_idx],
+            sky_confidence=float(sky_probs[sky_idx]),
+            sky_probabilities={IDX_TO_SKY[i]: float(p) for i, p in enumerate(sky_probs)},
             stars_visible=stars_visible,
-            stars_confidence=stars_confidence,
+            stars_confidence=stars_prob if stars_visible else (1 - stars_prob),
             star_density=star_density if stars_visible else 0.0,
             moon_visible=moon_visible,
-            moon_confidence=moon_confidence,
+            moon_confidence=moon_prob if moon_visible else (1 - moon_prob),
         )
     
+    @staticmethod
+    def _metadata_input(metadata: Union[dict, np.ndarray, None]) -> np.ndarray:
+        """Metadata features (1, 6) from a metadata dict, or neutral defaults."""
+        if metadata is None:
+            return np.array([[1.0, 0.0, 0.0, 0.5, 0.0, 0.0]], dtype=np.float32)
+        if isinstance(metadata, np.ndarray):
+            return metadata
+        
+        return np.array([[
+            metadata.get('corner_to_center_ratio', 1.0),
+            metadata.get('median_lum', 0.0),
+            1.0 if metadata.get('is_astronomical_night') else 0.0,
+            metadata.get('hour', 12) / 24.0,
+            metadata.get('moon_illumination', 0.0) / 100.0,
+            1.0 if metadata.get('moon_is_up') else 0.0,
+        ]], dtype=np.float32)
+    
     def predict_from_fits(self, fits_path: Union[str, Path],
                           metadata: Optional[dict] = None) -> SkyPrediction:
         """Predict from FITS file."""
@@ -226,10 +226,12 @@ class SkyClassifierCNN(nn.Module):
     Larger architecture than roof model for better detail detection.
     """
     
-    def __init__(self, image_size: int = 256, metadata_features: int = 6):
+    def __init__(self, image_size: int = 256, metadata_features: int = 6,
+                 global_pool: bool = False):
         super().__init__()
         
         self.image_size = image_size
+        self.global_pool = global_pool
         
         # Deeper CNN backbone for larger images
         self.conv1 = nn.Conv2d(1, 32, 3, padding=1)
@@ -248,7 +250,13 @@ class SkyClassifierCNN(nn.Module):
         
         # Calculate flattened size after conv layers
         # 256 -> 128 -> 64 -> 32 -> 16 -> 8 (5 pooling layers)
-        conv_output_size = (image_size // 32) ** 2 * 256
+        # Global average pooling collapses the 8x8 map to 1x1, shrinking
+        # fc_image from ~4.2M weights to 65K
+        if global_pool:
+            self.gap = nn.AdaptiveAvgPool2d(1)
+            conv_output_size = 256
+        else:
+            conv_output_size = (image_size // 32) ** 2 * 256
         
         # Image feature extraction
         self.fc_image = nn.Linear(conv_output_size, 256)
@@ -272,6 +280,8 @@ class SkyClassifierCNN(nn.Module):
         x = self.pool(F.relu(self.bn3(self.conv3(x))))
         x = self.pool(F.relu(self.bn4(self.conv4(x))))
         x = self.pool(F.relu(self.bn5(self.conv5(x))))
+        if self.global_pool:
+            x = self.gap(x)
         
         # Flatten
         x = x.view(x.size(0), -1)
@@ -400,6 +410,7 @@ def train_model(
     epochs: int = 50,
     learning_rate: float = 0.001,
     val_split: float = 0.15,
+    global_pool: bool = False,
 ):
     """
     Train the sky/celestial classifier with GPU optimization.
@@ -472,7 +483,7 @@ def train_model(
         print(f"GPU: {torch.cuda.get_device_name(0)}")
         print(f"VRAM: {torch.cuda.get_device_properties(0).total_memory / 1e9:.1f} GB")
     
-    model = SkyClassifierCNN(image_size=image_size, metadata_features=6)
+    model = SkyClassifierCNN(image_size=image_size, metadata_features=6, global_pool=global_pool)
     model = model.to(device)
     
     # Note: torch.compile() requires Triton which is not available on Windows
@@ -610,6 +621,7 @@ def train_model(
         'model_state_dict': best_model_state,
         'image_size': image_size,
         'metadata_features': 6,
+        'global_pool': global_pool,
         'sky_conditions': SKY_CONDITIONS,
         'trained_at': datetime.now().isoformat(),
         'train_samples_total': len(train_samples),
@@ -689,6 +701,8 @@ def main():
                         help="Number of epochs")
     parser.add_argument("--lr", type=float, default=0.001,
                         help="Learning rate")
+    parser.add_argument("--global-pool", action="store_true",
+                        help="Use global average pooling before fc_image (smaller, faster model)")
     
     args = parser.parse_args()
     
@@ -699,6 +713,7 @@ def main():
         batch_size=args.batch_size,
         epochs=args.epochs,
         learning_rate=args.lr,
+        global_pool=args.global_pool,
     )
 
 
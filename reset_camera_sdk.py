@@ -23,20 +23,165 @@ Usage:
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+RULE = "=" * 70
+
+# Static console text, each block written with a single print()
+HEADER = f"""
+{RULE}
+EMERGENCY CAMERA SDK RESET
+{RULE}
+
+This will reset ALL connected ZWO cameras to factory defaults.
+
+⚠ WARNING: Close ALL applications using ZWO cameras first!
+   (PFRSentinel, NINA, ASICap, SharpCap, etc.)
+"""
+
+NO_CAMERAS = """
+✗ No cameras detected!
+
+Troubleshooting:
+  1. Check USB connections
+  2. Make sure cameras have power
+  3. Try unplugging and replugging USB cables"""
+
+RESET_BANNER = f"""
+{RULE}
+RESETTING CAMERAS TO FACTORY DEFAULTS
+{RULE}"""
+
+SUMMARY = f"""
+{RULE}
+✓ ALL CAMERAS RESET TO FACTORY DEFAULTS
+{RULE}
+
+What was done:
+  • Reset ROI to full frame for each camera
+  • Reset gain, exposure, white balance to defaults
+  • Reset flip, offset, and auto-exposure settings
+  • Cleared any stuck SDK state
+
+⚠ IMPORTANT NEXT STEPS:
+  1. Unplug USB cables from ALL ZWO cameras
+  2. Wait 5 seconds
+  3. Plug cameras back in (one at a time)
+  4. Wait for Windows to recognize each camera
+  5. Try connecting in NINA/other apps
+
+If problems persist:
+  • Restart computer
+  • Update ZWO drivers from astronomy-imaging-camera.com
+  • Check USB cables and hubs"""
+
+
+def _wait_for_camera(camera, timeout=0.5):
+    """Poll the camera until it answers a property query (replaces a fixed sleep)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return camera.get_camera_property()
+        except Exception:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.02)
+
+
+def _reset_camera(asi, i, camera_name):
+    """Reset one camera to factory defaults, returning its report lines"""
+    lines = []
+    log = lines.append
+    try:
+        log(f"\n--- Camera {i}: {camera_name} ---")
+        
+        # Open camera
+        log("  Opening camera...")
+        camera = asi.Camera(i)
+        
+        # Get camera properties (once the camera responds)
+        camera_info = _wait_for_camera(camera)
+        max_width = camera_info['MaxWidth']
+        max_height = camera_info['MaxHeight']
+        
+        log(f"  Native resolution: {max_width}x{max_height}")
+        
+        # Reset ROI to full frame
+        log("  Resetting ROI to full frame...")
+        camera.set_roi(
+            start_x=0,
+            start_y=0,
+            width=max_width,
+            height=max_height,
+            bins=1,
+            image_type=asi.ASI_IMG_RAW8
+        )
+        camera.set_image_type(asi.ASI_IMG_RAW8)
+        log(f"    ✓ ROI: {max_width}x{max_height}")
+        
+        # Reset controls to factory defaults
+        log("  Resetting camera controls...")
+        controls_reset = []
+        
+        try:
+            camera.set_control_value(asi.ASI_GAIN, 0)
+            controls_reset.append("Gain=0")
+        except: pass
+        
+        try:
+            camera.set_control_value(asi.ASI_EXPOSURE, 100000)  # 100ms
+            controls_reset.append("Exposure=100ms")
+        except: pass
+        
+        try:
+            camera.set_control_value(asi.ASI_WB_R, 52)
+            camera.set_control_value(asi.ASI_WB_B, 95)
+            controls_reset.append("WB=52/95")
+        except: pass
+        
+        try:
+            camera.set_control_value(asi.ASI_BRIGHTNESS, 50)
+            controls_reset.append("Offset=50")
+        except: pass
+        
+        try:
+            camera.set_control_value(asi.ASI_FLIP, 0)
+            controls_reset.append("Flip=None")
+        except: pass
+        
+        try:
+            camera.set_control_value(asi.ASI_AUTO_MAX_GAIN, 0)
+            camera.set_control_value(asi.ASI_AUTO_MAX_EXP, 0)
+            camera.set_control_value(asi.ASI_AUTO_TARGET_BRIGHTNESS, 100)
+            controls_reset.append("Auto=Off")
+        except: pass
+        
+        try:
+            camera.set_control_value(asi.ASI_BANDWIDTHOVERLOAD, 40)
+            controls_reset.append("USB=40")
+        except: pass
+        
+        log(f"    ✓ Reset: {', '.join(controls_reset)}")
+        
+        # Close camera
+        log("  Closing camera...")
+        camera.close()
+        log("  ✓ Camera reset complete")
+        
+    except Exception as e:
+        log(f"  ✗ Error resetting camera {i}: {e}")
+        import traceback
+        log(traceback.format_exc().rstrip())
+    
+    return lines
+
 
 def reset_all_cameras(sdk_path):
     """Reset all connected ZWO cameras to factory defaults"""
-    print("\n" + "=" * 70)
-    print("EMERGENCY CAMERA SDK RESET")
-    print("=" * 70)
-    print("\nThis will reset ALL connected ZWO cameras to factory defaults.")
-    print("\n⚠ WARNING: Close ALL applications using ZWO cameras first!")
-    print("   (PFRSentinel, NINA, ASICap, SharpCap, etc.)")
-    print()
+    print(HEADER)
     
     response = input("Have you closed all camera applications? [y/N]: ").strip().lower()
     if response != 'y':
@@ -66,132 +211,29 @@ def reset_all_cameras(sdk_path):
         print(f"\n✓ Found {num_cameras} camera(s)")
         
         if num_cameras == 0:
-            print("\n✗ No cameras detected!")
-            print("\nTroubleshooting:")
-            print("  1. Check USB connections")
-            print("  2. Make sure cameras have power")
-            print("  3. Try unplugging and replugging USB cables")
+            print(NO_CAMERAS)
             return False
         
-        # List cameras
-        print("\nConnected cameras:")
-        for i in range(num_cameras):
-            try:
-                name = asi.list_cameras()[i]
-                print(f"  [{i}] {name}")
-            except Exception as e:
-                print(f"  [{i}] <Error reading name: {e}>")
-        
-        print("\n" + "=" * 70)
-        print("RESETTING CAMERAS TO FACTORY DEFAULTS")
-        print("=" * 70)
-        
-        # Reset each camera
-        for i in range(num_cameras):
-            try:
-                camera_name = asi.list_cameras()[i]
-                print(f"\n--- Camera {i}: {camera_name} ---")
-                
-                # Open camera
-                print("  Opening camera...")
-                camera = asi.Camera(i)
-                time.sleep(0.3)  # Let camera stabilize
-                
-                # Get camera properties
-                camera_info = camera.get_camera_property()
-                max_width = camera_info['MaxWidth']
-                max_height = camera_info['MaxHeight']
-                
-                print(f"  Native resolution: {max_width}x{max_height}")
-                
-                # Reset ROI to full frame
-                print("  Resetting ROI to full frame...")
-                camera.set_roi(
-                    start_x=0,
-                    start_y=0,
-                    width=max_width,
-                    height=max_height,
-                    bins=1,
-                    image_type=asi.ASI_IMG_RAW8
-                )
-                camera.set_image_type(asi.ASI_IMG_RAW8)
-                print(f"    ✓ ROI: {max_width}x{max_height}")
-                
-                # Reset controls to factory defaults
-                print("  Resetting camera controls...")
-                controls_reset = []
-                
-                try:
-                    camera.set_control_value(asi.ASI_GAIN, 0)
-                    controls_reset.append("Gain=0")
-                except: pass
-                
-                try:
-                    camera.set_control_value(asi.ASI_EXPOSURE, 100000)  # 100ms
-                    controls_reset.append("Exposure=100ms")
-                except: pass
-                
-                try:
-                    camera.set_control_value(asi.ASI_WB_R, 52)
-                    camera.set_control_value(asi.ASI_WB_B, 95)
-                    controls_reset.append("WB=52/95")
-                except: pass
-                
-                try:
-                    camera.set_control_value(asi.ASI_BRIGHTNESS, 50)
-                    controls_reset.append("Offset=50")
-                except: pass
-                
-                try:
-                    camera.set_control_value(asi.ASI_FLIP, 0)
-                    controls_reset.append("Flip=None")
-                except: pass
-                
-                try:
-                    camera.set_control_value(asi.ASI_AUTO_MAX_GAIN, 0)
-                    camera.set_control_value(asi.ASI_AUTO_MAX_EXP, 0)
-                    camera.set_control_value(asi.ASI_AUTO_TARGET_BRIGHTNESS, 100)
-                    controls_reset.append("Auto=Off")
-                except: pass
-                
-                try:
-                    camera.set_control_value(asi.ASI_BANDWIDTHOVERLOAD, 40)
-                    controls_reset.append("USB=40")
-                except: pass
-                
-                print(f"    ✓ Reset: {', '.join(controls_reset)}")
-                
-                # Close camera
-                print("  Closing camera...")
-                camera.close()
-                time.sleep(0.5)  # Let SDK settle
-                print("  ✓ Camera reset complete")
-                
-            except Exception as e:
-                print(f"  ✗ Error resetting camera {i}: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        print("\n" + "=" * 70)
-        print("✓ ALL CAMERAS RESET TO FACTORY DEFAULTS")
-        print("=" * 70)
-        print("\nWhat was done:")
-        print("  • Reset ROI to full frame for each camera")
-        print("  • Reset gain, exposure, white balance to defaults")
-        print("  • Reset flip, offset, and auto-exposure settings")
-        print("  • Cleared any stuck SDK state")
-        
-        print("\n⚠ IMPORTANT NEXT STEPS:")
-        print("  1. Unplug USB cables from ALL ZWO cameras")
-        print("  2. Wait 5 seconds")
-        print("  3. Plug cameras back in (one at a time)")
-        print("  4. Wait for Windows to recognize each camera")
-        print("  5. Try connecting in NINA/other apps")
-        
-        print("\nIf problems persist:")
-        print("  • Restart computer")
-        print("  • Update ZWO drivers from astronomy-imaging-camera.com")
-        print("  • Check USB cables and hubs")
+        # List cameras (enumerate the USB bus once and reuse the names)
+        listing = ["\nConnected cameras:"]
+        try:
+            names = asi.list_cameras()
+        except Exception as e:
+            names = []
+            listing.append(f"  <Error reading names: {e}>")
+        names = [names[i] if i < len(names) else f"Camera {i}" for i in range(num_cameras)]
+        listing.extend(f"  [{i}] {name}" for i, name in enumerate(names))
+        listing.append(RESET_BANNER)
+        print("\n".join(listing))
+        
+        # Reset cameras in parallel - each has its own USB endpoint. Output
+        # is collected per camera and printed in camera order.
+        with ThreadPoolExecutor(max_workers=num_cameras) as executor:
+            futures = [executor.submit(_reset_camera, asi, i, name) for i, name in enumerate(names)]
+            for future in futures:
+                print("\n".join(future.result()))
+        
+        print(SUMMARY)
         
         return True
         
@@ -215,11 +257,15 @@ def main():
     try:
         print("\n⚠ Checking if PFRSentinel is running...")
         import psutil
-        for proc in psutil.process_iter(['name']):
-            if 'PFRSentinel' in proc.info['name']:
-                print("✗ PFRSentinel is still running!")
-                print("\nPlease close PFRSentinel before continuing.")
-                return 1
+        # Only the process name is fetched; any() stops at the first match
+        running = any(
+            'pfrsentinel' in (proc.info['name'] or '').lower()
+            for proc in psutil.process_iter(attrs=['name'])
+        )
+        if running:
+            print("✗ PFRSentinel is still running!")
+            print("\nPlease close PFRSentinel before continuing.")
+            return 1
         print("✓ PFRSentinel not detected")
     except ImportError:
         print("⚠ Cannot check if PFRSentinel is running (psutil not installed)")
@@ -9,28 +9,71 @@ Usage:
     python analyze_calibration_data.py <directory>
 """
 import argparse
-import json
 import sys
 from pathlib import Path
 from collections import defaultdict
 
+import numpy as np
+
+# Add parent for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.calibration_io import read_calibration, load_all
+
+
+def _load_calibration(path):
+    """Load one calibration JSON file."""
+    try:
+        cal = read_calibration(path)
+    except Exception as e:
+        print(f"Warning: Failed to load {path}: {e}")
+        return None
+    cal['_path'] = str(path)
+    cal['_folder'] = path.parent.name
+    return cal
+
 
 def load_calibration_files(directory):
     """Load all calibration JSON files."""
     directory = Path(directory)
     cal_files = list(directory.rglob("calibration_*.json"))
+    return load_all(cal_files, _load_calibration)
+
+
+def extract_folder_metrics(cals):
+    """
+    Gather the per-file metrics of one folder into NumPy arrays.
     
-    data = []
-    for path in cal_files:
-        try:
-            cal = json.loads(path.read_text())
-            cal['_path'] = str(path)
-            cal['_folder'] = path.parent.name
-            data.append(cal)
-        except Exception as e:
-            print(f"Warning: Failed to load {path}: {e}")
+    Each field is pulled out of the calibration dicts once, so both the
+    detailed report and the summary table work on the same arrays.
+    """
+    ratios = []
+    deltas = []
+    hours = []
+    p50s = []
+    p99s = []
     
-    return data
+    for cal in cals:
+        ca = cal.get('corner_analysis', {})
+        tc = cal.get('time_context', {})
+        perc = cal.get('percentiles', {})
+        
+        if ca:
+            ratios.append(ca.get('corner_to_center_ratio', 0))
+            deltas.append(ca.get('center_minus_corner', 0))
+        if tc:
+            hours.append(tc.get('hour', -1))
+        if perc:
+            p50s.append(perc.get('p50', 0))
+            p99s.append(perc.get('p99', 0))
+    
+    return {
+        'ratios': np.asarray(ratios, dtype=np.float64),
+        'deltas': np.asarray(deltas, dtype=np.float64),
+        'hours': np.asarray(hours, dtype=np.int64),
+        'p50s': np.asarray(p50s, dtype=np.float64),
+        'p99s': np.asarray(p99s, dtype=np.float64),
+    }
 
 
 def analyze_data(calibrations):
@@ -41,6 +84,8 @@ def analyze_data(calibrations):
     for cal in calibrations:
         by_folder[cal['_folder']].append(cal)
     
+    metrics = {folder: extract_folder_metrics(cals) for folder, cals in by_folder.items()}
+    
     print(f"\n{'='*70}")
     print(f"CALIBRATION DATA ANALYSIS")
     print(f"{'='*70}")
@@ -53,46 +98,32 @@ def analyze_data(calibrations):
         print(f"📁 {folder} ({len(cals)} files)")
         print(f"{'─'*70}")
         
-        # Extract metrics
-        ratios = []
-        deltas = []
-        hours = []
-        p50s = []
-        p99s = []
+        m = metrics[folder]
+        ratios = m['ratios']
+        deltas = m['deltas']
+        hours = m['hours']
+        p50s = m['p50s']
+        p99s = m['p99s']
         
-        for cal in cals:
-            ca = cal.get('corner_analysis', {})
-            tc = cal.get('time_context', {})
-            perc = cal.get('percentiles', {})
-            
-            if ca:
-                ratios.append(ca.get('corner_to_center_ratio', 0))
-                deltas.append(ca.get('center_minus_corner', 0))
-            if tc:
-                hours.append(tc.get('hour', -1))
-            if perc:
-                p50s.append(perc.get('p50', 0))
-                p99s.append(perc.get('p99', 0))
-        
-        if ratios:
+        if ratios.size:
             print(f"\n  Corner-to-Center Ratio:")
-            print(f"    min: {min(ratios):.4f}  max: {max(ratios):.4f}  avg: {sum(ratios)/len(ratios):.4f}")
+            print(f"    min: {ratios.min():.4f}  max: {ratios.max():.4f}  avg: {ratios.mean():.4f}")
             
-        if deltas:
+        if deltas.size:
             print(f"\n  Center-Minus-Corner Delta:")
-            print(f"    min: {min(deltas):.4f}  max: {max(deltas):.4f}  avg: {sum(deltas)/len(deltas):.4f}")
+            print(f"    min: {deltas.min():.4f}  max: {deltas.max():.4f}  avg: {deltas.mean():.4f}")
         
-        if hours and hours[0] >= 0:
+        if hours.size and hours[0] >= 0:
             print(f"\n  Time of Day:")
-            print(f"    hour range: {min(hours):02d}:00 - {max(hours):02d}:00")
-            day_count = sum(1 for h in hours if 6 <= h < 20)
+            print(f"    hour range: {hours.min():02d}:00 - {hours.max():02d}:00")
+            day_count = int(np.count_nonzero((hours >= 6) & (hours < 20)))
             night_count = len(hours) - day_count
             print(f"    daylight: {day_count}  night: {night_count}")
         
-        if p50s:
+        if p50s.size:
             print(f"\n  Luminance Percentiles:")
-            print(f"    p50 range: {min(p50s):.4f} - {max(p50s):.4f}")
-            print(f"    p99 range: {min(p99s):.4f} - {max(p99s):.4f}")
+            print(f"    p50 range: {p50s.min():.4f} - {p50s.max():.4f}")
+            print(f"    p99 range: {p99s.min():.4f} - {p99s.max():.4f}")
     
     # Summary table for threshold tuning
     print(f"\n{'='*70}")
@@ -101,18 +132,19 @@ def analyze_data(calibrations):
     print(f"\n{'Folder':<30} {'Ratio':<20} {'Delta':<20} {'Period'}")
     print(f"{'-'*30} {'-'*20} {'-'*20} {'-'*10}")
     
-    for folder, cals in sorted(by_folder.items()):
-        ratios = [c.get('corner_analysis', {}).get('corner_to_center_ratio', 0) for c in cals if c.get('corner_analysis')]
-        deltas = [c.get('corner_analysis', {}).get('center_minus_corner', 0) for c in cals if c.get('corner_analysis')]
-        hours = [c.get('time_context', {}).get('hour', -1) for c in cals if c.get('time_context')]
+    for folder in sorted(by_folder):
+        m = metrics[folder]
+        ratios = m['ratios']
+        deltas = m['deltas']
+        hours = m['hours']
         
-        if ratios:
-            ratio_str = f"{min(ratios):.3f} - {max(ratios):.3f}"
-            delta_str = f"{min(deltas):.4f} - {max(deltas):.4f}"
+        if ratios.size:
+            ratio_str = f"{ratios.min():.3f} - {ratios.max():.3f}"
+            delta_str = f"{deltas.min():.4f} - {deltas.max():.4f}"
             
             # Determine period
-            if hours and hours[0] >= 0:
-                avg_hour = sum(hours) / len(hours)
+            if hours.size and hours[0] >= 0:
+                avg_hour = hours.mean()
                 if 6 <= avg_hour < 20:
                     period = "day"
                 else:
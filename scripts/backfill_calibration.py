@@ -3,7 +3,8 @@
 Backfill Calibration JSON Files
 
 Adds missing fields (corner_analysis, percentiles, time_context) to existing
-calibration JSON files by re-analyzing the corresponding raw/lum FITS files.
+calibration JSON files by re-analyzing the corresponding raw/lum FITS files,
+and stores the derived classified_mode so readers don't recompute it.
 
 Usage:
     python backfill_calibration.py <directory> [--dry-run]
@@ -17,7 +18,9 @@ import json
 import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date, timedelta
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -49,6 +52,9 @@ except ImportError:
     if ASTRAL_AVAILABLE:
         print("WARNING: Could not import Config. Will use simple hour-based time classification.")
 
+from ml.calibration_io import find_calibration_files
+from ml.schema import classify_mode
+
 
 def parse_timestamp_from_filename(filename):
     """
@@ -445,7 +451,7 @@ def compute_luminance(rgb_array):
         return rgb_array.mean(axis=-1) if rgb_array.ndim > 2 else rgb_array
 
 
-def backfill_calibration(json_path, dry_run=False, force_time=False):
+def backfill_calibration(json_path, dry_run=False, force_time=False, recompute_mode=False):
     """
     Backfill missing fields in a calibration JSON file.
     
@@ -453,6 +459,7 @@ def backfill_calibration(json_path, dry_run=False, force_time=False):
         json_path: Path to calibration JSON file
         dry_run: If True, don't modify files
         force_time: If True, recalculate time_context even if exists
+        recompute_mode: If True, recalculate classified_mode even if exists
     
     Returns:
         tuple: (success: bool, message: str, fields_added: list)
@@ -480,6 +487,10 @@ def backfill_calibration(json_path, dry_run=False, force_time=False):
         if tc.get('calculation_method') != 'astral':
             fields_to_add.append('time_context')
     
+    # classified_mode is derived from the fields above, so refresh it with them
+    if fields_to_add or recompute_mode or 'classified_mode' not in cal:
+        fields_to_add.append('classified_mode')
+    
     if not fields_to_add:
         return True, "Already complete", []
     
@@ -533,6 +544,8 @@ def backfill_calibration(json_path, dry_run=False, force_time=False):
                 norm_rgb = None
     
     # Compute missing fields
+    previous = {name: cal.get(name) for name in fields_to_add}
+    
     if 'corner_analysis' in fields_to_add:
         cal['corner_analysis'] = compute_corner_analysis(lum, norm_rgb)
     
@@ -542,6 +555,14 @@ def backfill_calibration(json_path, dry_run=False, force_time=False):
     if 'time_context' in fields_to_add:
         cal['time_context'] = compute_time_context(dt)
     
+    if 'classified_mode' in fields_to_add:
+        cal['classified_mode'] = classify_mode(cal)
+    
+    # Recomputed fields (--force-time / --recompute-mode) often come out
+    # identical - skip rewriting the file on (possibly network) storage then
+    if all(cal.get(name) == value for name, value in previous.items()):
+        return True, "Already up to date", []
+    
     # Save updated calibration
     if not dry_run:
         try:
@@ -553,17 +574,6 @@ def backfill_calibration(json_path, dry_run=False, force_time=False):
     return True, "Updated", fields_to_add
 
 
-def find_calibration_files(directory, recursive=True):
-    """Find all calibration_*.json files in directory."""
-    directory = Path(directory)
-    pattern = "calibration_*.json"
-    
-    if recursive:
-        return list(directory.rglob(pattern))
-    else:
-        return list(directory.glob(pattern))
-
-
 def main():
     parser = argparse.ArgumentParser(
         description="Backfill missing fields in calibration JSON files",
@@ -574,6 +584,8 @@ Examples:
     python backfill_calibration.py "H:\\raw_debug\\Roof Closed Day Time"
     python backfill_calibration.py "H:\\raw_debug" --no-recursive
     python backfill_calibration.py "H:\\raw_debug" --force-time
+    python backfill_calibration.py "H:\\raw_debug" --recompute-mode
+    python backfill_calibration.py "H:\\raw_debug" --jobs 1
         """
     )
     parser.add_argument('directory', help='Directory containing calibration files')
@@ -583,6 +595,10 @@ Examples:
                         help='Do not search subdirectories')
     parser.add_argument('--force-time', action='store_true',
                         help='Force recalculation of time_context using astral (even if exists)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of files to process in parallel (default: CPU count)')
+    parser.add_argument('--recompute-mode', action='store_true',
+                        help='Force recalculation of classified_mode (e.g. after rule changes)')
     
     args = parser.parse_args()
     
@@ -615,29 +631,41 @@ Examples:
     if args.dry_run:
         print("=== DRY RUN - No changes will be made ===\n")
     
-    # Process each file
+    # Process each file - files are independent, so spread them over processes
     stats = {'success': 0, 'skipped': 0, 'failed': 0, 'complete': 0}
+    cal_files = sorted(cal_files)
+    process = partial(
+        backfill_calibration,
+        dry_run=args.dry_run,
+        force_time=args.force_time,
+        recompute_mode=args.recompute_mode
+    )
     
-    for cal_path in sorted(cal_files):
-        rel_path = cal_path.relative_to(directory) if cal_path.is_relative_to(directory) else cal_path
-        
-        success, message, fields_added = backfill_calibration(
-            cal_path, 
-            dry_run=args.dry_run,
-            force_time=args.force_time
-        )
-        
-        if success:
-            if fields_added:
-                action = "Would update" if args.dry_run else "Updated"
-                print(f"+ {rel_path}: {action} {', '.join(fields_added)}")
-                stats['success'] += 1
+    executor = None
+    if args.jobs > 1 and len(cal_files) > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+        results = executor.map(process, cal_files, chunksize=4)
+    else:
+        results = map(process, cal_files)
+    
+    try:
+        for cal_path, (success, message, fields_added) in zip(cal_files, results):
+            rel_path = cal_path.relative_to(directory) if cal_path.is_relative_to(directory) else cal_path
+            
+            if success:
+                if fields_added:
+                    action = "Would update" if args.dry_run else "Updated"
+                    print(f"+ {rel_path}: {action} {', '.join(fields_added)}")
+                    stats['success'] += 1
+                else:
+                    print(f"  {rel_path}: {message}")
+                    stats['complete'] += 1
             else:
-                print(f"  {rel_path}: {message}")
-                stats['complete'] += 1
-        else:
-            print(f"X {rel_path}: {message}")
-            stats['failed'] += 1
+                print(f"X {rel_path}: {message}")
+                stats['failed'] += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # Summary
     print(f"\n{'='*50}")
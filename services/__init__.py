@@ -1,13 +1,23 @@
 """
 Services package for PFR Sentinel
 Contains core processing and hardware integration modules
+
+Public names are imported lazily on first access (PEP 562), so importing a
+single submodule such as services.config doesn't pull in the camera SDK or
+the image processing stack.
 """
-from .config import Config
-from .logger import app_logger
-from .processor import process_image, add_overlays
-from .watcher import FileWatcher
-from .zwo_camera import ZWOCamera
-from .cleanup import run_cleanup
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'Config': '.config',
+    'app_logger': '.logger',
+    'process_image': '.processor',
+    'add_overlays': '.processor',
+    'FileWatcher': '.watcher',
+    'ZWOCamera': '.zwo_camera',
+    'run_cleanup': '.cleanup',
+}
 
 __all__ = [
     'Config',
@@ -18,3 +28,16 @@ __all__ = [
     'ZWOCamera',
     'run_cleanup'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,6 +16,8 @@ NINA GenericFile Setup:
     - Unsafe trigger: "CLOSED"
 """
 import os
+import queue
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -27,7 +29,9 @@ class ASCOMSafetyWriter:
     Writes ML predictions to ASCOM-compatible safety monitor file.
     
     Thread-safe: Uses atomic write (temp file + rename) to prevent
-    NINA from reading partial data.
+    NINA from reading partial data. Writes happen on a background thread
+    that only ever holds the newest pending status, so callers (the ML
+    inference path) never block on disk I/O.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -54,6 +58,16 @@ class ASCOMSafetyWriter:
         
         self._last_write_time = None
         self._last_status = None
+        self._last_status_body = None  # Content minus the Updated: line
+        
+        # Last rendered body, keyed on the values it displays (caller thread)
+        self._body_key = None
+        self._body = None
+        
+        # Single-slot latest-value queue drained by _writer_loop
+        self._pending = queue.Queue(maxsize=1)
+        self._pending_lock = threading.Lock()
+        self._writer_thread = None
     
     def is_configured(self) -> bool:
         """Check if file path is configured."""
@@ -71,7 +85,7 @@ class ASCOMSafetyWriter:
                 - sky_confidence: 0.0-1.0 or None
         
         Returns:
-            True if file was written successfully
+            True if the status was queued for writing
         """
         if not self.is_configured():
             return False
@@ -91,6 +105,32 @@ class ASCOMSafetyWriter:
             app_logger.debug(f"ASCOM Safety: Skipping write - confidence {roof_confidence:.1%} < {self.min_confidence:.1%}")
             return False
         
+        # Reuse the rendered body when the displayed values haven't changed
+        key = (
+            roof_status,
+            None if roof_confidence is None else round(roof_confidence * 100),
+            sky_condition,
+            None if sky_confidence is None else round(sky_confidence * 100),
+        )
+        if key == self._body_key:
+            status_body = self._body
+        else:
+            status_body = self._build_status_body(roof_status, roof_confidence,
+                                                  sky_condition, sky_confidence)
+            self._body_key = key
+            self._body = status_body
+        
+        # Formatted from components - avoids strftime's format-string parsing
+        now = datetime.now()
+        updated_line = (f"Updated: {now.year:04d}-{now.month:02d}-{now.day:02d} "
+                        f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}")
+        
+        self._publish((status_body, updated_line))
+        return True
+    
+    def _build_status_body(self, roof_status: str, roof_confidence: Optional[float],
+                           sky_condition: str, sky_confidence: Optional[float]) -> str:
+        """Render the status lines (everything except the Updated: timestamp)."""
         # Build file content
         trigger = self.open_trigger if roof_status == 'Open' else self.closed_trigger
         lines = [f"{self.preamble} {trigger}"]
@@ -104,17 +144,54 @@ class ASCOMSafetyWriter:
                 sky_line += f" ({sky_confidence:.0%})"
             lines.append(sky_line)
         
-        # Add timestamp
-        lines.append(f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        return '\n'.join(lines)
+    
+    def _publish(self, item: Optional[tuple]):
+        """Hand (status_body, updated_line) to the writer thread, replacing any stale one."""
+        with self._pending_lock:
+            try:
+                self._pending.get_nowait()
+            except queue.Empty:
+                pass
+            self._pending.put_nowait(item)
+            
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="ASCOMSafetyWriter", daemon=True)
+                self._writer_thread.start()
+    
+    def _writer_loop(self):
+        """Write pending statuses atomically until close() posts None."""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            try:
+                self._write_if_changed(*item)
+            except Exception as e:
+                app_logger.error(f"ASCOM Safety: Failed to write file: {e}")
+    
+    def _write_if_changed(self, status_body: str, updated_line: str) -> bool:
+        """
+        Rewrite the file only when the status changed.
         
-        content = '\n'.join(lines) + '\n'
+        An unchanged status (roof stable for hours) just bumps the file mtime,
+        so NINA still sees a fresh file without any data being written.
+        """
+        if status_body == self._last_status_body and os.path.exists(self.file_path):
+            os.utime(self.file_path, None)
+            self._last_write_time = datetime.now()
+            return True
         
-        # Write atomically
-        try:
-            return self._atomic_write(content)
-        except Exception as e:
-            app_logger.error(f"ASCOM Safety: Failed to write file: {e}")
-            return False
+        written = self._atomic_write(f"{status_body}\n{updated_line}\n")
+        if written:
+            self._last_status_body = status_body
+        return written
+    
+    def close(self):
+        """Stop the writer thread (a pending status not yet written is dropped)."""
+        if self._writer_thread is not None:
+            self._publish(None)
     
     def _atomic_write(self, content: str) -> bool:
         """
@@ -137,9 +214,12 @@ class ASCOMSafetyWriter:
         try:
             with open(temp_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+                f.flush()
+                os.fsync(f.fileno())  # Data on disk before the rename
             
             # Atomic rename
             os.replace(temp_path, self.file_path)
+            self._fsync_dir(dir_path)
             
             self._last_write_time = datetime.now()
             self._last_status = content.split('\n')[0]  # First line
@@ -156,6 +236,17 @@ class ASCOMSafetyWriter:
                 pass
             raise
     
+    @staticmethod
+    def _fsync_dir(dir_path: str):
+        """Flush the directory entry so the rename survives power loss (POSIX only)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return  # Windows: directories can't be opened/fsynced
+        dir_fd = os.open(dir_path or '.', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
     def get_last_status(self) -> Optional[str]:
         """Get last written status line."""
         return self._last_status
@@ -178,7 +269,7 @@ def write_ascom_safety_file(ml_results: Dict[str, Any], config: Dict[str, Any])
         config: ascom_safety_file config dict
     
     Returns:
-        True if file was written successfully
+        True if the status was queued for writing
     """
     global _writer_instance
     
@@ -187,6 +278,8 @@ def write_ascom_safety_file(ml_results: Dict[str, Any], config: Dict[str, Any])
     
     # Create or update writer instance
     if _writer_instance is None or _writer_instance.file_path != config.get('file_path', ''):
+        if _writer_instance is not None:
+            _writer_instance.close()
         _writer_instance = ASCOMSafetyWriter(config)
     
     return _writer_instance.write_status(ml_results)
@@ -1,10 +1,48 @@
 """
 Cleanup module for managing watch directory size
 """
+import heapq
 import os
 import shutil
+from operator import itemgetter
 from pathlib import Path
 
+from .logger import app_logger
+
+
+def _is_link(entry):
+    """True for symlinks and (on Windows, Python 3.12+) directory junctions."""
+    is_junction = getattr(entry, 'is_junction', None)
+    return entry.is_symlink() or (is_junction is not None and is_junction())
+
+
+def _scan_tree(root):
+    """
+    Recursively yield (filepath, mtime, size) for every file under root.
+    
+    Uses os.scandir so each entry costs a single stat (cached on the DirEntry)
+    instead of separate exists/getsize/getmtime calls. Matches os.walk:
+    symlinked directories are neither descended into nor reported as files,
+    file symlinks report their target's size, and unreadable directories,
+    broken links and files that vanish mid-scan are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                if not _is_link(entry):
+                    yield from _scan_tree(entry.path)
+            else:
+                st = entry.stat()
+                yield entry.path, st.st_mtime, st.st_size
+        except OSError:
+            continue
+
 
 def get_directory_size(directory):
     """
@@ -12,13 +50,10 @@ def get_directory_size(directory):
     """
     total_size = 0
     try:
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total_size += os.path.getsize(filepath)
+        for filepath, mtime, size in _scan_tree(directory):
+            total_size += size
     except Exception as e:
-        print(f"Error calculating directory size: {e}")
+        app_logger.warning(f"Cleanup: error calculating directory size: {e}")
     
     return total_size
 
@@ -30,96 +65,163 @@ def get_all_files_with_mtime(directory):
     """
     files = []
     try:
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    mtime = os.path.getmtime(filepath)
-                    size = os.path.getsize(filepath)
-                    files.append((filepath, mtime, size))
+        files = list(_scan_tree(directory))
     except Exception as e:
-        print(f"Error getting files: {e}")
+        app_logger.warning(f"Cleanup: error getting files: {e}")
     
     return files
 
 
+def walk_and_size(directory):
+    """
+    Get all files (as get_all_files_with_mtime) and their total size in one walk.
+    Returns (files, total_size).
+    """
+    files = get_all_files_with_mtime(directory)
+    return files, sum(size for _, _, size in files)
+
+
 def get_session_folders(directory):
     """
     Get immediate subdirectories (session folders) with their modification times.
-    Returns list of (folder_path, mtime, size) tuples.
+    Returns list of (folder_path, mtime) tuples.
     """
     folders = []
     try:
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            if os.path.isdir(item_path):
-                mtime = os.path.getmtime(item_path)
-                size = get_directory_size(item_path)
-                folders.append((item_path, mtime, size))
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    folders.append((entry.path, entry.stat().st_mtime))
     except Exception as e:
-        print(f"Error getting session folders: {e}")
+        app_logger.warning(f"Cleanup: error getting session folders: {e}")
     
     return folders
 
 
+def _scan_dirs_bottom_up(path, parent=None):
+    """
+    Yield (dirpath, parent, num_children) for every directory below path,
+    children before parents, reading each directory only once with
+    os.scandir. The starting directory itself is not yielded.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            yield from _scan_dirs_bottom_up(entry.path, path)
+    
+    if parent is not None:
+        yield path, parent, len(entries)
+
+
 def remove_empty_directories(directory):
     """
     Remove empty subdirectories, leaving only directories with files.
     Returns number of directories removed.
     """
     deleted_count = 0
+    removed_children = {}  # dirpath -> subdirectories removed so far
     try:
-        for dirpath, dirnames, filenames in os.walk(directory, topdown=False):
-            # Skip the root directory
-            if dirpath == directory:
-                continue
-            
-            # Check if directory is empty
-            if not os.listdir(dirpath):
+        for dirpath, parent, num_children in _scan_dirs_bottom_up(directory):
+            # Children were visited first, so removals already happened
+            if num_children - removed_children.pop(dirpath, 0) == 0:
                 try:
                     os.rmdir(dirpath)
                     deleted_count += 1
-                    print(f"Removed empty directory: {dirpath}")
+                    removed_children[parent] = removed_children.get(parent, 0) + 1
                 except Exception as e:
-                    print(f"Error removing empty directory {dirpath}: {e}")
+                    app_logger.warning(f"Cleanup: error removing empty directory {dirpath}: {e}")
     except Exception as e:
-        print(f"Error scanning for empty directories: {e}")
+        app_logger.warning(f"Cleanup: error scanning for empty directories: {e}")
     
     return deleted_count
 
 
-def delete_oldest_files(directory, max_size_bytes):
+def _oldest_first(files, total_size, bytes_to_free):
+    """
+    Yield (filepath, mtime, size) oldest first, without sorting every file.
+    
+    Picks an estimated k oldest files with heapq.nsmallest (about twice the
+    count needed to free bytes_to_free at the average file size) and only
+    falls back to a heap over the rest if the caller keeps consuming.
+    """
+    if not files:
+        return
+    by_mtime = itemgetter(1)
+    average_size = max(total_size / len(files), 1)
+    k = max(16, int(bytes_to_free / average_size) * 2)
+    if k >= len(files):
+        yield from sorted(files, key=by_mtime)
+        return
+    
+    oldest = heapq.nsmallest(k, files, key=by_mtime)
+    yield from oldest
+    
+    # Estimate fell short (or deletions failed) - continue with the remainder
+    taken = {filepath for filepath, _, _ in oldest}
+    heap = [(mtime, filepath, size) for filepath, mtime, size in files if filepath not in taken]
+    heapq.heapify(heap)
+    while heap:
+        mtime, filepath, size = heapq.heappop(heap)
+        yield filepath, mtime, size
+
+
+def _log_deletions(deleted_count, freed_bytes, failed_count):
+    """Log one summary line per cleanup pass instead of a line per file."""
+    app_logger.info(f"Cleanup: deleted {deleted_count} files ({freed_bytes / (1024 * 1024):.1f} MB freed)")
+    if failed_count:
+        app_logger.warning(f"Cleanup: {failed_count} files could not be deleted")
+
+
+def delete_oldest_files(directory, max_size_bytes, files=None, current_size=None):
     """
     Delete oldest files until directory is under max_size_bytes.
     Does NOT remove folders to avoid interfering with active captures.
+    Pass files/current_size from walk_and_size() to reuse an existing walk.
     Returns number of files deleted.
     """
     deleted_count = 0
-    current_size = get_directory_size(directory)
+    if files is None:
+        files, current_size = walk_and_size(directory)
+    elif current_size is None:
+        current_size = sum(size for _, _, size in files)
     
     if current_size <= max_size_bytes:
         return 0
     
-    # Get all files sorted by modification time (oldest first)
-    files = get_all_files_with_mtime(directory)
-    files.sort(key=lambda x: x[1])  # Sort by mtime
-    
-    for filepath, mtime, size in files:
+    freed = 0
+    failed = 0
+    for filepath, mtime, size in _oldest_first(files, current_size, current_size - max_size_bytes):
         if current_size <= max_size_bytes:
             break
         
         try:
-            os.remove(filepath)
-            current_size -= size
-            deleted_count += 1
-            print(f"Deleted file: {filepath}")
-        except Exception as e:
-            print(f"Error deleting {filepath}: {e}")
+            os.unlink(filepath)
+        except FileNotFoundError:
+            current_size -= size  # Already gone
+            continue
+        except OSError as e:
+            failed += 1
+            if failed == 1:
+                app_logger.warning(f"Cleanup: error deleting {filepath}: {e}")
+            continue
+        current_size -= size
+        freed += size
+        deleted_count += 1
     
+    _log_deletions(deleted_count, freed, failed)
     return deleted_count
 
 
-def delete_oldest_sessions(directory, max_size_bytes):
+def delete_oldest_sessions(directory, max_size_bytes, current_size=None):
     """
     Delete files in oldest session folders until directory is under max_size_bytes.
     Keeps folder structure intact but deletes files within old sessions.
@@ -127,7 +229,8 @@ def delete_oldest_sessions(directory, max_size_bytes):
     Returns number of files deleted.
     """
     deleted_count = 0
-    current_size = get_directory_size(directory)
+    if current_size is None:
+        current_size = get_directory_size(directory)
     
     # Get session folders sorted by modification time (oldest first)
     folders = get_session_folders(directory)
@@ -143,29 +246,36 @@ def delete_oldest_sessions(directory, max_size_bytes):
     # Process all but the latest folder
     folders_to_consider = folders[:-1]  # Exclude the newest folder
     
-    for folder_path, mtime, folder_size in folders_to_consider:
+    freed = 0
+    failed = 0
+    for folder_path, mtime in folders_to_consider:
         if current_size <= max_size_bytes:
             break
         
         # Delete files within this session folder instead of the entire folder
+        # Sizes come from the scan's cached DirEntry.stat - no getsize per file
         try:
-            for root, dirs, files in os.walk(folder_path):
-                for filename in files:
-                    if current_size <= max_size_bytes:
-                        break
-                    
-                    filepath = os.path.join(root, filename)
-                    try:
-                        file_size = os.path.getsize(filepath)
-                        os.remove(filepath)
-                        current_size -= file_size
-                        deleted_count += 1
-                        print(f"Deleted file in old session: {filepath}")
-                    except Exception as e:
-                        print(f"Error deleting {filepath}: {e}")
+            for filepath, _, file_size in _scan_tree(folder_path):
+                if current_size <= max_size_bytes:
+                    break
+                
+                try:
+                    os.unlink(filepath)
+                except FileNotFoundError:
+                    current_size -= file_size  # Already gone
+                    continue
+                except OSError as e:
+                    failed += 1
+                    if failed == 1:
+                        app_logger.warning(f"Cleanup: error deleting {filepath}: {e}")
+                    continue
+                current_size -= file_size
+                freed += file_size
+                deleted_count += 1
         except Exception as e:
-            print(f"Error processing folder {folder_path}: {e}")
+            app_logger.warning(f"Cleanup: error processing folder {folder_path}: {e}")
     
+    _log_deletions(deleted_count, freed, failed)
     return deleted_count
 
 
@@ -188,20 +298,20 @@ def run_cleanup(config):
         
         strategy = config.get('cleanup_strategy', 'Delete oldest files in watch directory')
         
-        current_size = get_directory_size(watch_dir)
+        files, current_size = walk_and_size(watch_dir)
         current_size_gb = current_size / (1024 * 1024 * 1024)
         
         if current_size <= max_size_bytes:
             return True, f"Current size ({current_size_gb:.2f} GB) is under limit ({max_size_gb} GB)"
         
-        print(f"Running cleanup: current size {current_size_gb:.2f} GB exceeds {max_size_gb} GB")
+        app_logger.info(f"Running cleanup: current size {current_size_gb:.2f} GB exceeds {max_size_gb} GB")
         
         if strategy == "Delete oldest files in watch directory":
-            deleted = delete_oldest_files(watch_dir, max_size_bytes)
+            deleted = delete_oldest_files(watch_dir, max_size_bytes, files, current_size)
             return True, f"Deleted {deleted} old files (folders preserved)"
         
         elif strategy == "Delete oldest session folders":
-            deleted = delete_oldest_sessions(watch_dir, max_size_bytes)
+            deleted = delete_oldest_sessions(watch_dir, max_size_bytes, current_size)
             return True, f"Deleted {deleted} files from old sessions (kept latest session intact)"
         
         else:
@@ -4,6 +4,65 @@ Color balance / white balance algorithms
 import cv2
 import numpy as np
 
+# Gains within this distance of 1.0 leave the image unchanged
+IDENTITY_GAIN_TOLERANCE = 0.01
+
+# Gray-world statistics are measured on a copy no larger than this (longest side)
+STATS_MAX_SIZE = 512
+
+
+def _histogram_percentiles(gray: np.ndarray, percentiles) -> np.ndarray:
+    """
+    Percentiles of a uint8 image from its 256-bin histogram.
+    
+    Counting is O(N) with no sort; results are whole intensity levels.
+    """
+    hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+    cdf = np.cumsum(hist)
+    return np.searchsorted(cdf, np.asarray(percentiles) / 100.0 * cdf[-1])
+
+
+_rng = np.random.default_rng()
+
+
+def _triangular_dither(shape) -> np.ndarray:
+    """
+    Triangular-PDF noise in (-1, 1) as float32.
+    
+    Difference of two uniforms - same distribution as the sum of two
+    uniform(-0.5, 0.5) draws, at half the memory of float64 noise.
+    """
+    noise = _rng.random(shape, dtype=np.float32)
+    noise -= _rng.random(shape, dtype=np.float32)
+    return noise
+
+
+# (red_gain, blue_gain) -> 3-channel uint8 LUT; gains rarely change per session
+_GAIN_LUTS = {}
+_GAIN_LUT_CACHE_SIZE = 16
+
+
+def _build_gain_lut(gain_b: float, gain_g: float, gain_r: float) -> np.ndarray:
+    """(256, 1, 3) BGR lookup table applying per-channel gains for cv2.LUT."""
+    levels = np.arange(256, dtype=np.float32)
+    return np.stack([
+        np.clip(levels * gain_b, 0, 255),
+        np.clip(levels * gain_g, 0, 255),
+        np.clip(levels * gain_r, 0, 255),
+    ], axis=-1).astype(np.uint8).reshape(256, 1, 3)
+
+
+def _gain_lut(red_gain: float, blue_gain: float) -> np.ndarray:
+    """Cached _build_gain_lut() for manual red/blue gains."""
+    key = (red_gain, blue_gain)
+    lut = _GAIN_LUTS.get(key)
+    if lut is None:
+        lut = _build_gain_lut(blue_gain, 1.0, red_gain)
+        if len(_GAIN_LUTS) >= _GAIN_LUT_CACHE_SIZE:
+            _GAIN_LUTS.clear()
+        _GAIN_LUTS[key] = lut
+    return lut
+
 
 def apply_gray_world_robust(img_bgr: np.ndarray,
                             low_pct: float = 5,
@@ -21,48 +80,47 @@ def apply_gray_world_robust(img_bgr: np.ndarray,
     Returns:
         White-balanced BGR image (uint8)
     """
-    img = img_bgr.astype(np.float32)
-    b, g, r = cv2.split(img)
-
-    # Compute intensity to find reasonable mid-tone pixels
-    intensity = 0.299 * r + 0.587 * g + 0.114 * b
+    # Gains are scene-level scalars - measure them on a thumbnail
+    h, w = img_bgr.shape[:2]
+    scale = STATS_MAX_SIZE / max(h, w)
+    if scale < 1:
+        small = cv2.resize(img_bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    else:
+        small = img_bgr
+    
+    # Compute intensity (BT.601 luma) to find reasonable mid-tone pixels
+    intensity = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
 
-    low = np.percentile(intensity, low_pct)
-    high = np.percentile(intensity, high_pct)
+    low, high = _histogram_percentiles(intensity, [low_pct, high_pct])
 
-    mask = (intensity >= low) & (intensity <= high)
+    mask = cv2.inRange(intensity, int(low), int(high))
 
-    # Fallback in case mask is too small
-    if np.count_nonzero(mask) < 100:
-        mask = np.ones_like(intensity, dtype=bool)
+    # Fallback in case mask is too small; cv2.mean reduces all channels in one pass
+    if cv2.countNonZero(mask) < 100:
+        means = np.array(cv2.mean(small)[:3], dtype=np.float32)
+    else:
+        means = np.array(cv2.mean(small, mask=mask)[:3], dtype=np.float32)
 
-    avg_r = np.mean(r[mask])
-    avg_g = np.mean(g[mask])
-    avg_b = np.mean(b[mask])
+    target = means.mean()
+    gains = target / (means + 1e-6)
 
-    target = (avg_r + avg_g + avg_b) / 3.0
+    # Already balanced - skip the multiply/dither/clip pass
+    if np.abs(gains - 1.0).max() < IDENTITY_GAIN_TOLERANCE:
+        return img_bgr
 
-    gain_r = target / (avg_r + 1e-6)
-    gain_g = target / (avg_g + 1e-6)
-    gain_b = target / (avg_b + 1e-6)
+    # Without dither the result is a pure per-level mapping - one LUT pass
+    if gains.max() <= 1.05:
+        return cv2.LUT(img_bgr, _build_gain_lut(*gains))
 
-    r *= gain_r
-    g *= gain_g
-    b *= gain_b
+    pixels = img_bgr.astype(np.float32).reshape(-1, 3)
+    pixels *= gains
     
     # Add triangular dither to reduce banding from gain scaling
     # This is especially important when gains differ significantly
-    max_gain = max(gain_r, gain_g, gain_b)
-    if max_gain > 1.05:  # Only dither if significant gain applied
-        dither_r = np.random.uniform(-0.5, 0.5, r.shape) + np.random.uniform(-0.5, 0.5, r.shape)
-        dither_g = np.random.uniform(-0.5, 0.5, g.shape) + np.random.uniform(-0.5, 0.5, g.shape)
-        dither_b = np.random.uniform(-0.5, 0.5, b.shape) + np.random.uniform(-0.5, 0.5, b.shape)
-        r += dither_r
-        g += dither_g
-        b += dither_b
+    pixels += _triangular_dither(pixels.shape)
 
-    balanced = cv2.merge([b, g, r])
-    return np.clip(balanced, 0, 255).astype(np.uint8)
+    np.clip(pixels, 0, 255, out=pixels)
+    return pixels.astype(np.uint8).reshape(h, w, 3)
 
 
 def apply_manual_gains(img_bgr: np.ndarray,
@@ -79,21 +137,25 @@ def apply_manual_gains(img_bgr: np.ndarray,
     Returns:
         White-balanced BGR image (uint8)
     """
-    img = img_bgr.astype(np.float32)
-    b, g, r = cv2.split(img)
+    # Near-identity gains - nothing to do
+    if abs(red_gain - 1.0) < IDENTITY_GAIN_TOLERANCE and abs(blue_gain - 1.0) < IDENTITY_GAIN_TOLERANCE:
+        return img_bgr
+    
+    # Without dither the result is a pure per-level mapping - one LUT pass
+    if red_gain <= 1.0 and blue_gain <= 1.0:
+        return cv2.LUT(img_bgr, _gain_lut(red_gain, blue_gain))
     
-    # Apply gains
-    r *= red_gain
-    b *= blue_gain
+    # Gains broadcast over the interleaved BGR layout - no split/merge copies
+    img = img_bgr.astype(np.float32)
+    img *= np.array([blue_gain, 1.0, red_gain], dtype=np.float32)
     
     # Add small triangular dither noise before rounding to reduce banding
     # This is especially important when gains > 1.0 cause quantization
     if red_gain > 1.0 or blue_gain > 1.0:
         # Triangular PDF dither: sum of two uniform distributions
-        dither_r = np.random.uniform(-0.5, 0.5, r.shape) + np.random.uniform(-0.5, 0.5, r.shape)
-        dither_b = np.random.uniform(-0.5, 0.5, b.shape) + np.random.uniform(-0.5, 0.5, b.shape)
-        r += dither_r
-        b += dither_b
+        shape = img.shape[:2]
+        img[..., 2] += _triangular_dither(shape)
+        img[..., 0] += _triangular_dither(shape)
     
-    balanced = cv2.merge([b, g, r])
-    return np.clip(balanced, 0, 255).astype(np.uint8)
+    np.clip(img, 0, 255, out=img)
+    return img.astype(np.uint8)
@@ -4,6 +4,7 @@ Configuration management for AllSky Overlay App
 import json
 import os
 from utils_paths import resource_path, get_exe_dir
+from services.config_writer import config_writer
 from app_config import APP_DATA_FOLDER, DEFAULT_OUTPUT_SUBFOLDER
 
 DEFAULT_CONFIG = {
@@ -120,6 +121,7 @@ DEFAULT_CONFIG = {
         "enabled": False,  # Enable ML-based image analysis (Beta)
         "roof_classifier": True,  # Predict roof open/closed state
         "sky_classifier": True,   # Predict sky condition (Clear/Cloudy/etc) when roof is open
+        "use_int8": False,  # Load *_int8.onnx models when present (only after checking their accuracy)
         "show_in_preview": True,  # Display predictions in live monitoring metadata
         # ASCOM Safety Monitor file output (for NINA integration)
         "ascom_safety_file": {
@@ -416,6 +418,8 @@ class Config:
     
     def save(self):
         """Save current configuration to JSON file"""
+        # Let queued background writes land first so they can't overwrite this one
+        config_writer.flush()
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(self.data, f, indent=2)
@@ -424,6 +428,15 @@ class Config:
             print(f"Error saving config: {e}")
             return False
     
+    def save_async(self):
+        """Snapshot current configuration and write it on the background writer thread"""
+        try:
+            config_writer.submit(self.config_path, self.data)
+            return True
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            return False
+    
     def get(self, key, default=None):
         """Get configuration value"""
         return self.data.get(key, default)
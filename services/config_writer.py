@@ -0,0 +1,108 @@
+"""
+Background writer for configuration files
+
+Config snapshots are serialized on the calling thread (so later in-memory edits
+cannot leak into a pending write) and written to disk on a daemon thread using
+temp file + rename, so the UI thread never blocks on slow drives or cloud-synced
+folders.
+"""
+import json
+import os
+import queue
+import tempfile
+import threading
+
+
+class ConfigWriter:
+    """Single daemon thread that writes queued config snapshots atomically"""
+    
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        
+        # Snapshots queued but not yet written; flush() waits for zero
+        self._pending = 0
+        self._idle = threading.Condition()
+    
+    def submit(self, path, data):
+        """
+        Queue a config snapshot for writing.
+        
+        Args:
+            path: Destination config file path
+            data: JSON-serializable config dict (serialized immediately)
+        """
+        payload = json.dumps(data, indent=2).encode('utf-8')
+        self._ensure_thread()
+        with self._idle:
+            self._pending += 1
+        self._queue.put((path, payload))
+    
+    def flush(self, timeout=None):
+        """
+        Block until all queued writes have completed.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+    
+    def _ensure_thread(self):
+        """Start the worker thread on first use"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='ConfigWriter', daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        """Worker loop: write the newest snapshot queued for each path"""
+        while True:
+            items = [self._queue.get()]
+            
+            # Coalesce a burst of snapshots - only the latest per path matters
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            latest = {}
+            for path, payload in items:
+                latest[path] = payload
+            
+            for path, payload in latest.items():
+                try:
+                    self._atomic_write(path, payload)
+                except Exception as e:
+                    print(f"Error saving config: {e}")
+            
+            with self._idle:
+                self._pending -= len(items)
+                if self._pending == 0:
+                    self._idle.notify_all()
+    
+    @staticmethod
+    def _atomic_write(path, payload):
+        """Write bytes to path via temp file + os.replace"""
+        dir_path = os.path.dirname(path) or '.'
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=dir_path, prefix='.config_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+
+# Shared writer instance
+config_writer = ConfigWriter()
@@ -0,0 +1,133 @@
+"""
+Colour conversion backend for per-frame hot paths.
+
+Uses OpenCV's SIMD-accelerated conversions when cv2 is importable and falls
+back to plain numpy otherwise. The backend is picked once at import.
+
+Usage:
+    from services.img_backend import rgb_to_gray, rgb_to_yuv420
+    
+    gray = rgb_to_gray(rgb, dst=gray_buf)
+    yuv = rgb_to_yuv420(rgb, dst=yuv_buf)
+"""
+import numpy as np
+
+from .logger import app_logger
+
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+BACKEND = 'opencv' if CV2_AVAILABLE else 'numpy'
+
+# BT.601 luma weights for RGB -> gray
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# BT.601 limited-range RGB -> YUV rows (same coefficients as OpenCV's I420)
+_YUV_MATRIX = np.array([
+    [0.257, 0.504, 0.098],
+    [-0.148, -0.291, 0.439],
+    [0.439, -0.368, -0.071],
+], dtype=np.float32)
+_YUV_OFFSET = np.array([16.0, 128.0, 128.0], dtype=np.float32)
+
+
+def _out(dst, shape):
+    if dst is None:
+        return np.empty(shape, dtype=np.uint8)
+    return dst
+
+
+def read_image(path: str):
+    """
+    Decode an image file to a uint8 (H, W, 3) array.
+    
+    Args:
+        path: Image file path
+    
+    Returns:
+        Tuple of (pixels, bgr) - bgr is True when pixels are in BGR order
+    """
+    if CV2_AVAILABLE:
+        pixels = cv2.imread(path, cv2.IMREAD_COLOR)
+        if pixels is None:
+            raise ValueError(f"Could not read image: {path}")
+        return pixels, True
+    
+    from PIL import Image
+    with Image.open(path) as img:
+        return np.array(img.convert('RGB')), False
+
+
+def rgb_to_bgr(src: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+    """
+    Swap the red and blue channels of a uint8 (H, W, 3) image.
+    
+    Args:
+        src: RGB (or BGR) image
+        dst: Optional preallocated (H, W, 3) uint8 output
+    
+    Returns:
+        Channel-swapped image (dst if given)
+    """
+    if CV2_AVAILABLE:
+        return cv2.cvtColor(src, cv2.COLOR_RGB2BGR, dst=dst)
+    
+    dst = _out(dst, src.shape)
+    dst[...] = src[:, :, ::-1]
+    return dst
+
+
+def rgb_to_gray(src: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+    """
+    BT.601 grayscale of a uint8 (H, W, 3) RGB image.
+    
+    Args:
+        src: RGB image
+        dst: Optional preallocated (H, W) uint8 output
+    
+    Returns:
+        uint8 grayscale image (dst if given)
+    """
+    if CV2_AVAILABLE:
+        return cv2.cvtColor(src, cv2.COLOR_RGB2GRAY, dst=dst)
+    
+    dst = _out(dst, src.shape[:2])
+    np.rint(src @ GRAY_WEIGHTS, out=dst, casting='unsafe')
+    return dst
+
+
+def rgb_to_yuv420(src: np.ndarray, dst: np.ndarray = None, bgr: bool = False) -> np.ndarray:
+    """
+    Convert a uint8 (H, W, 3) image with even dimensions to planar I420.
+    
+    Args:
+        src: RGB image (BGR if bgr=True)
+        dst: Optional preallocated (H * 3 // 2, W) uint8 output
+        bgr: Source channel order is BGR (e.g. from cv2.imread)
+    
+    Returns:
+        I420 frame: Y plane followed by quarter-size U and V planes (dst if given)
+    """
+    if CV2_AVAILABLE:
+        code = cv2.COLOR_BGR2YUV_I420 if bgr else cv2.COLOR_RGB2YUV_I420
+        return cv2.cvtColor(src, code, dst=dst)
+    
+    h, w = src.shape[:2]
+    dst = _out(dst, (h * 3 // 2, w))
+    if bgr:
+        src = src[:, :, ::-1]
+    
+    yuv = src @ _YUV_MATRIX.T + _YUV_OFFSET
+    np.rint(yuv[:, :, 0], out=dst[:h], casting='unsafe')
+    
+    # Average each 2x2 block for the chroma planes
+    chroma = yuv[:, :, 1:].reshape(h // 2, 2, w // 2, 2, 2).mean(axis=(1, 3))
+    planes = dst[h:].reshape(2, h // 2, w // 2)
+    np.rint(chroma.transpose(2, 0, 1), out=planes, casting='unsafe')
+    return dst
+
+
+app_logger.info(f"Image conversion backend: {BACKEND}")
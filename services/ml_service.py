@@ -9,9 +9,9 @@ This service is available independent of Dev Mode and can be enabled via
 the "ML Models (Beta)" setting in Image Processing settings.
 
 Usage:
-    from services.ml_service import MLService
+    from services.ml_service import get_ml_service
     
-    ml = MLService()
+    ml = get_ml_service()
     ml.initialize()
     
     # Get predictions for an image
@@ -26,16 +26,70 @@ Usage:
     # - star_density: 0.0-1.0 | None
 """
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 import numpy as np
 
+from services.img_backend import GRAY_WEIGHTS, rgb_to_gray
 from services.logger import app_logger
 
+# Column of each feature in the packed metadata rows fed to the classifiers
+# (model-ready values; the roof model takes the first 4, the sky model all 6)
+META_LAYOUT = {
+    'corner_to_center_ratio': 0,
+    'median_lum': 1,
+    'is_astronomical_night': 2,
+    'hour': 3,  # hour / 24
+    'moon_illumination': 4,  # percent / 100
+    'moon_is_up': 5,
+}
+ROOF_META_FEATURES = 4
+
+
+def _tile_median(tile: np.ndarray):
+    """Median by O(n) selection (upper middle for even sizes) instead of a full sort."""
+    flat = tile.ravel()
+    k = flat.size // 2
+    return np.partition(flat, k)[k]
+
+
+def _find_model_file(stem: str, use_int8: bool = False) -> Optional[Path]:
+    """
+    Locate a model file, preferring ONNX (lighter runtime) over PyTorch.
+    
+    The FP32 ONNX model is the default. INT8 is opt-in and is skipped when it
+    is older than the FP32 export, so a stale quantized file never shadows a
+    fresh model.
+    
+    Args:
+        stem: Model name without extension (e.g. "roof_classifier_v1")
+        use_int8: Prefer the INT8-quantized ONNX model
+        
+    Returns:
+        Path to the model file, or None if none exists
+    """
+    models_dir = Path(__file__).parent.parent / "ml" / "models"
+    fp32_path = models_dir / f"{stem}.onnx"
+    int8_path = models_dir / f"{stem}_int8.onnx"
+    
+    if use_int8 and int8_path.exists():
+        if not fp32_path.exists() or int8_path.stat().st_mtime >= fp32_path.stat().st_mtime:
+            return int8_path
+        app_logger.warning(f"ML Service: Ignoring {int8_path.name} (older than {fp32_path.name})")
+    
+    for path in (fp32_path, models_dir / f"{stem}.pth"):
+        if path.exists():
+            return path
+    return None
+
 
 class MLService:
     """
-    Singleton service for ML-based image analysis.
+    Service for ML-based image analysis (use get_ml_service() for the shared instance).
     
     Provides roof state and sky condition predictions for use in:
     - Overlay tokens ({ROOF_STATUS}, {SKY_CONDITION}, etc.)
@@ -43,37 +97,45 @@ class MLService:
     - Discord notifications
     """
     
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
-            return
-        
         self._roof_classifier = None
         self._sky_classifier = None
         self._roof_error = None
         self._sky_error = None
-        self._initialized = True
         self._models_loaded = False
+        self._use_int8 = False
+        
+        # Cache last prediction results for quick access (read-only view)
+        self._last_results = MappingProxyType({})
+        
+        # Reused grayscale buffer for corner analysis (uint8 frames)
+        self._gray_buf = None
         
-        # Cache last prediction results for quick access
-        self._last_results = {}
+        # Time context only changes by the minute
+        self._tc_key = None
+        self._tc_value = None
+        
+        # Reused (1, 6) metadata row, packed by META_LAYOUT
+        self._meta_buf = None
     
-    def initialize(self) -> bool:
+    def initialize(self, use_int8: bool = False) -> bool:
         """
         Initialize ML models.
         
+        The roof and sky models load concurrently (file I/O and ONNX Runtime
+        session setup release the GIL).
+        
+        Args:
+            use_int8: Prefer *_int8.onnx models (convert_to_onnx.py --int8) when present
+        
         Returns:
             True if at least one model loaded successfully
         """
-        roof_ok = self._init_roof_classifier()
-        sky_ok = self._init_sky_classifier()
+        self._use_int8 = use_int8
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='ml-load') as executor:
+            roof_future = executor.submit(self._init_roof_classifier)
+            sky_future = executor.submit(self._init_sky_classifier)
+            roof_ok, sky_ok = roof_future.result(), sky_future.result()
         
         self._models_loaded = roof_ok or sky_ok
         return self._models_loaded
@@ -89,17 +151,7 @@ class MLService:
         try:
             from ml.roof_classifier import RoofClassifier
             
-            # Look for model file - prefer ONNX for production (lighter runtime)
-            model_paths = [
-                Path(__file__).parent.parent / "ml" / "models" / "roof_classifier_v1.onnx",
-                Path(__file__).parent.parent / "ml" / "models" / "roof_classifier_v1.pth",
-            ]
-            
-            model_path = None
-            for p in model_paths:
-                if p.exists():
-                    model_path = p
-                    break
+            model_path = _find_model_file("roof_classifier_v1", self._use_int8)
             
             if model_path is None:
                 self._roof_error = "Roof model file not found"
@@ -130,17 +182,7 @@ class MLService:
         try:
             from ml.sky_classifier import SkyClassifier
             
-            # Look for model file - prefer ONNX for production (lighter runtime)
-            model_paths = [
-                Path(__file__).parent.parent / "ml" / "models" / "sky_classifier_v1.onnx",
-                Path(__file__).parent.parent / "ml" / "models" / "sky_classifier_v1.pth",
-            ]
-            
-            model_path = None
-            for p in model_paths:
-                if p.exists():
-                    model_path = p
-                    break
+            model_path = _find_model_file("sky_classifier_v1", self._use_int8)
             
             if model_path is None:
                 self._sky_error = "Sky model file not found"
@@ -211,7 +253,6 @@ class MLService:
             }
         """
         config = config or {}
-        metadata = metadata or {}
         
         results = {
             'roof_status': 'N/A',
@@ -223,22 +264,22 @@ class MLService:
             'moon_visible': None,
         }
         
-        # Build analysis context from image
-        corner_analysis = self._compute_corner_analysis(image_array)
-        time_context = self._compute_time_context()
+        roof_enabled = config.get('roof_classifier', True)
+        sky_enabled = config.get('sky_classifier', True)
+        roof_will_run = roof_enabled and self._roof_classifier is not None
+        sky_maybe = sky_enabled and self._sky_classifier is not None
+        
+        # Nothing to predict - skip the full-frame analysis entirely
+        # (sky only runs after the roof model reports Open)
+        if not (roof_will_run or sky_maybe):
+            self._last_results = MappingProxyType(results)
+            return results
         
         # Roof prediction
-        roof_enabled = config.get('roof_classifier', True)
-        if roof_enabled and self._roof_classifier is not None:
+        if roof_will_run:
             try:
-                roof_meta = {
-                    'corner_to_center_ratio': corner_analysis.get('corner_to_center_ratio', 1.0),
-                    'median_lum': corner_analysis.get('center_med', 0.0),
-                    'is_astronomical_night': time_context.get('is_astronomical_night', False),
-                    'hour': time_context.get('hour', 12),
-                }
-                
-                roof_result = self._roof_classifier.predict(image_array, roof_meta)
+                meta = self._pack_metadata(image_array)
+                roof_result = self._roof_classifier.predict(image_array, meta[:, :ROOF_META_FEATURES])
                 results['roof_status'] = 'Open' if roof_result.roof_open else 'Closed'
                 results['roof_confidence'] = round(float(roof_result.confidence), 3)
                 
@@ -246,21 +287,12 @@ class MLService:
                 app_logger.debug(f"ML Service: Roof prediction failed: {e}")
         
         # Sky prediction (only when roof is open)
-        sky_enabled = config.get('sky_classifier', True)
         roof_is_open = results['roof_status'] == 'Open'
         
-        if sky_enabled and roof_is_open and self._sky_classifier is not None:
+        if sky_maybe and roof_is_open:
             try:
-                sky_meta = {
-                    'corner_to_center_ratio': corner_analysis.get('corner_to_center_ratio', 1.0),
-                    'median_lum': corner_analysis.get('center_med', 0.0),
-                    'is_astronomical_night': time_context.get('is_astronomical_night', False),
-                    'hour': time_context.get('hour', 12),
-                    'moon_illumination': 0.0,  # Could fetch from moon service
-                    'moon_is_up': False,
-                }
-                
-                sky_result = self._sky_classifier.predict(image_array, sky_meta)
+                # Sky reuses the row packed for the roof model
+                sky_result = self._sky_classifier.predict(image_array, meta)
                 results['sky_condition'] = sky_result.sky_condition
                 results['sky_confidence'] = round(float(sky_result.sky_confidence), 3)
                 results['stars_visible'] = sky_result.stars_visible
@@ -271,27 +303,54 @@ class MLService:
                 app_logger.debug(f"ML Service: Sky prediction failed: {e}")
         
         # Cache results
-        self._last_results = results
+        self._last_results = MappingProxyType(results)
         
         return results
     
-    def get_last_results(self) -> Dict[str, Any]:
-        """Get cached results from last analysis."""
-        return self._last_results.copy()
+    def _pack_metadata(self, image_array: np.ndarray) -> np.ndarray:
+        """Fill the reused (1, 6) metadata buffer in META_LAYOUT order."""
+        if self._meta_buf is None:
+            self._meta_buf = np.zeros((1, len(META_LAYOUT)), dtype=np.float32)
+        row = self._meta_buf[0]
+        
+        corner_analysis = self._compute_corner_analysis(image_array)
+        time_context = self._compute_time_context()
+        row[META_LAYOUT['corner_to_center_ratio']] = corner_analysis.get('corner_to_center_ratio', 1.0)
+        row[META_LAYOUT['median_lum']] = corner_analysis.get('center_med', 0.0)
+        row[META_LAYOUT['is_astronomical_night']] = bool(time_context.get('is_astronomical_night', False))
+        row[META_LAYOUT['hour']] = time_context.get('hour', 12) / 24.0
+        row[META_LAYOUT['moon_illumination']] = 0.0  # Could fetch from moon service
+        row[META_LAYOUT['moon_is_up']] = 0.0
+        
+        return self._meta_buf
+    
+    def get_last_results(self) -> Mapping[str, Any]:
+        """
+        Get cached results from last analysis.
+        
+        Returns a read-only view; use dict(...) on it if you need to modify it.
+        """
+        return self._last_results
+    
+    def _to_gray(self, image_array: np.ndarray) -> np.ndarray:
+        """Single-pass BT.601 grayscale; uint8 RGB goes through img_backend into a reused buffer."""
+        if image_array.ndim != 3:
+            return image_array
+        if image_array.shape[2] == 1:
+            return image_array[:, :, 0]
+        
+        if image_array.dtype == np.uint8 and image_array.shape[2] == 3:
+            h, w = image_array.shape[:2]
+            if self._gray_buf is None or self._gray_buf.shape != (h, w):
+                self._gray_buf = np.empty((h, w), dtype=np.uint8)
+            return rgb_to_gray(image_array, dst=self._gray_buf)
+        
+        return image_array[:, :, :3] @ GRAY_WEIGHTS
     
     def _compute_corner_analysis(self, image_array: np.ndarray) -> Dict[str, float]:
         """Compute corner-to-center analysis for ML features."""
         try:
-            # Convert to grayscale if needed
-            if len(image_array.shape) == 3:
-                # RGB to grayscale
-                gray = np.mean(image_array, axis=2)
-            else:
-                gray = image_array.astype(np.float32)
-            
-            # Normalize to 0-1
-            if gray.max() > 1.0:
-                gray = gray / 255.0
+            gray = self._to_gray(image_array)
             
             h, w = gray.shape
             
@@ -310,14 +369,19 @@ class MLService:
             ch, cw = h // 4, w // 4
             center = gray[ch:h-ch, cw:w-cw]
             
-            corner_med = np.median([np.median(c) for c in corners])
-            center_med = np.median(center)
+            corner_med = float(np.median([_tile_median(c) for c in corners]))
+            center_med = float(_tile_median(center))
+            
+            # Normalize to 0-1 (only the two scalars, not the whole frame)
+            if gray.dtype == np.uint8 or gray.max() > 1.0:
+                corner_med /= 255.0
+                center_med /= 255.0
             
             ratio = corner_med / max(center_med, 0.001)
             
             return {
-                'corner_med': float(corner_med),
-                'center_med': float(center_med),
+                'corner_med': corner_med,
+                'center_med': center_med,
                 'corner_to_center_ratio': float(ratio),
             }
             
@@ -326,8 +390,10 @@ class MLService:
             return {'corner_med': 0.0, 'center_med': 0.0, 'corner_to_center_ratio': 1.0}
     
     def _compute_time_context(self) -> Dict[str, Any]:
-        """Compute time context for ML features."""
-        from datetime import datetime
+        """Compute time context for ML features (cached per wall-clock minute)."""
+        key = int(time.time() // 60)
+        if key == self._tc_key:
+            return self._tc_value
         
         try:
             now = datetime.now()
@@ -336,13 +402,17 @@ class MLService:
             # Simple night detection (could be improved with astropy)
             is_night = hour < 6 or hour >= 20
             
-            return {
+            value = {
                 'hour': hour,
                 'is_astronomical_night': is_night,
             }
             
         except Exception:
             return {'hour': 12, 'is_astronomical_night': False}
+        
+        self._tc_key = key
+        self._tc_value = value
+        return value
 
 
 # Global singleton instance
@@ -5,6 +5,7 @@ import os
 import re
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from services.logger import app_logger
@@ -151,6 +152,24 @@ def derive_metadata(metadata, image_filename, session_name):
     return derived
 
 
+_TOKEN_PATTERN = re.compile(r'\{([^}]+)\}')
+
+
+@lru_cache(maxsize=128)
+def _compile_template(text):
+    """
+    Split overlay text into alternating literal and token pieces.
+    
+    Overlay templates are fixed per config but rendered every frame, so the
+    parse is cached. Even indices are literals, odd indices are upper-cased
+    token names.
+    """
+    pieces = _TOKEN_PATTERN.split(text)
+    for i in range(1, len(pieces), 2):
+        pieces[i] = pieces[i].upper()
+    return tuple(pieces)
+
+
 def replace_tokens(text, metadata):
     """
     Replace tokens like {EXPOSURE}, {GAIN} with actual values.
@@ -168,17 +187,16 @@ def replace_tokens(text, metadata):
             except ValueError:
                 pass
     
-    result = text
+    pieces = _compile_template(text)
+    if len(pieces) == 1:
+        return text
     
-    # Find all tokens in the format {TOKEN}
-    tokens = re.findall(r'\{([^}]+)\}', text)
+    # Substitute tokens in the format {TOKEN}
+    parts = list(pieces)
+    for i in range(1, len(parts), 2):
+        parts[i] = str(formatted_metadata.get(parts[i], '?'))
     
-    for token in tokens:
-        token_upper = token.upper()
-        value = formatted_metadata.get(token_upper, '?')
-        result = result.replace(f'{{{token}}}', str(value))
-    
-    return result
+    return ''.join(parts)
 
 
 def get_text_bbox(draw, text, font):
@@ -4,17 +4,36 @@ Receives frames via stdin pipe and streams via RTSP for viewers like VLC or NINA
 """
 
 import os
+import shutil
 import subprocess
 import threading
 import time
+import zlib
 import numpy as np
-from PIL import Image
+from .img_backend import read_image, rgb_to_yuv420
 from .logger import app_logger
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+def _frame_hash(frame):
+    """64-bit content hash of a frame buffer (CRC32 if xxhash isn't installed)."""
+    data = memoryview(frame).cast('B')
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(data)
+    return zlib.crc32(data)
+
 
 class RTSPStreamServer:
     """Manages RTSP streaming via ffmpeg subprocess."""
     
+    # Resolved ffmpeg executable, shared by all instances once found
+    _ffmpeg_path = None
+    
     def __init__(self, host='0.0.0.0', port=8554, stream_name='asiwatchdog', fps=1.0):
         """
         Initialize RTSP server.
@@ -34,7 +53,17 @@ class RTSPStreamServer:
         self.last_frame = None
         self.frame_size = None  # (width, height)
         self.frame_thread = None
-        self.frame_lock = threading.Lock()
+        self.frame_cv = threading.Condition()  # Guards last_frame, signals new frames
+        self._frame_seq = 0
+        
+        # Three preallocated YUV420 frame buffers: update_image fills one that is
+        # neither the published frame nor the one the sender is still writing,
+        # so ffmpeg never receives a half-overwritten frame
+        self._frame_bufs = None
+        self._in_flight = None
+        
+        # Hash of the last frame handed to the sender (identical frames are skipped)
+        self._last_hash = None
     
     def start(self):
         """Start the RTSP server via ffmpeg."""
@@ -52,18 +81,13 @@ class RTSPStreamServer:
             
             # Start with a placeholder frame size (will be updated on first frame)
             self.frame_size = (1920, 1080)
+            self._last_hash = None
             
             # Build ffmpeg command
             cmd = self._build_ffmpeg_command()
             
             # Start ffmpeg process
-            self.process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                bufsize=10**8
-            )
+            self._spawn_ffmpeg(cmd)
             
             self.running = True
             
@@ -84,30 +108,45 @@ class RTSPStreamServer:
             app_logger.error(f"Failed to start RTSP server: {e}")
             return False
     
-    def _check_ffmpeg(self):
-        """Check if ffmpeg is available."""
+    def _spawn_ffmpeg(self, cmd):
+        """Launch ffmpeg and a daemon thread that keeps its stderr pipe drained."""
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,  # Nothing reads it - don't let it fill
+            stderr=subprocess.PIPE,
+            bufsize=10**8
+        )
+        threading.Thread(target=self._drain_stderr, args=(self.process,), daemon=True).start()
+    
+    def _drain_stderr(self, process):
+        """Forward ffmpeg's stderr to the log so a full pipe can never stall it."""
         try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
-            return False
+            for line in iter(process.stderr.readline, b''):
+                app_logger.debug(f"ffmpeg: {line.decode(errors='replace').rstrip()}")
+        except (OSError, ValueError):
+            pass  # Pipe closed while stopping
+    
+    def _check_ffmpeg(self):
+        """Check if ffmpeg is available (PATH lookup, cached on success)."""
+        if RTSPStreamServer._ffmpeg_path is None:
+            RTSPStreamServer._ffmpeg_path = shutil.which('ffmpeg')
+        return RTSPStreamServer._ffmpeg_path is not None
     
     def _build_ffmpeg_command(self):
         """Build the ffmpeg command for RTSP streaming."""
         width, height = self.frame_size
         
         # ffmpeg command:
-        # - Read raw BGR24 frames from stdin
+        # - Read raw planar YUV 4:2:0 frames from stdin (half the bytes of
+        #   BGR24, and already the encoder's input format)
         # - Encode to H.264
         # - Stream via RTSP
         cmd = [
-            'ffmpeg',
+            self._ffmpeg_path or 'ffmpeg',
+            '-loglevel', 'warning',  # Keep stderr to problems only
             '-f', 'rawvideo',
-            '-pixel_format', 'bgr24',
+            '-pixel_format', 'yuv420p',
             '-video_size', f'{width}x{height}',
             '-framerate', str(self.fps),
             '-i', 'pipe:0',  # Read from stdin
@@ -123,26 +162,57 @@ class RTSPStreamServer:
         return cmd
     
     def _frame_sender_loop(self):
-        """Background thread that sends frames to ffmpeg at regular intervals."""
+        """
+        Background thread that feeds frames to ffmpeg.
+        
+        New frames are sent as soon as update_image signals them (capped at
+        the stream fps); without a new frame the last one is repeated once per
+        frame interval so RTSP clients keep receiving a continuous stream.
+        """
         frame_interval = 1.0 / self.fps
+        last_send = 0.0
+        
+        # Only frames published after startup count as new
+        with self.frame_cv:
+            sent_seq = self._frame_seq
         
         try:
             while self.running and self.process and self.process.poll() is None:
-                if self.last_frame is not None:
+                with self.frame_cv:
+                    self.frame_cv.wait_for(
+                        lambda: not self.running or self._frame_seq != sent_seq,
+                        timeout=frame_interval)
+                
+                # Cap the rate when frames arrive faster than the stream fps
+                delay = last_send + frame_interval - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                
+                with self.frame_cv:
+                    frame = self.last_frame
+                    seq = self._frame_seq
+                    self._in_flight = frame
+                
+                if not self.running:
+                    break
+                
+                if frame is not None:
                     try:
-                        with self.frame_lock:
-                            frame_bytes = self.last_frame
-                        
-                        self.process.stdin.write(frame_bytes)
+                        # Buffer-protocol write - no tobytes() copy
+                        self.process.stdin.write(memoryview(frame).cast('B'))
                         self.process.stdin.flush()
-                        app_logger.debug(f"Sent frame to RTSP ({len(frame_bytes)} bytes)")
                     except BrokenPipeError:
                         app_logger.error("RTSP ffmpeg pipe broken")
                         break
                     except Exception as e:
                         app_logger.error(f"Error sending frame to RTSP: {e}")
-                
-                time.sleep(frame_interval)
+                    
+                    with self.frame_cv:
+                        self._in_flight = None
+                    
+                    # Count failed writes too so an error can't spin the loop
+                    sent_seq = seq
+                    last_send = time.monotonic()
         except Exception as e:
             app_logger.error(f"RTSP frame sender error: {e}")
         finally:
@@ -155,7 +225,9 @@ class RTSPStreamServer:
         
         try:
             app_logger.info("Stopping RTSP server...")
-            self.running = False
+            with self.frame_cv:
+                self.running = False
+                self.frame_cv.notify_all()
             
             # Wait for frame thread
             if self.frame_thread:
@@ -183,39 +255,58 @@ class RTSPStreamServer:
         Update the stream with a new frame.
         
         Args:
-            image_input: PIL Image object or path to image file
+            image_input: PIL Image, RGB uint8 numpy array, or path to image file
             metadata: Optional dict with image metadata (unused for RTSP)
         """
         if not self.running:
             return
         
         try:
-            # Load image if path provided
+            # Decode straight to a numpy array - files skip PIL when OpenCV is available
+            bgr = False
             if isinstance(image_input, str):
-                img = Image.open(image_input)
+                pixels, bgr = read_image(image_input)
+            elif isinstance(image_input, np.ndarray):
+                pixels = image_input
             else:
-                img = image_input
+                img = image_input if image_input.mode == 'RGB' else image_input.convert('RGB')
+                pixels = np.asarray(img)  # Shares the PIL raster, no copy
             
-            # Convert to RGB if needed
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+            # 4:2:0 chroma needs even dimensions - drop an odd last row/column
+            height, width = pixels.shape[0] & ~1, pixels.shape[1] & ~1
+            pixels = pixels[:height, :width]
             
             # Check if frame size changed (restart ffmpeg if needed)
-            new_size = (img.width, img.height)
+            new_size = (width, height)
             if new_size != self.frame_size:
                 app_logger.info(f"RTSP frame size changed: {self.frame_size} -> {new_size}")
                 self.frame_size = new_size
                 self._restart_ffmpeg()
             
-            # Convert PIL Image to numpy array (RGB -> BGR for ffmpeg)
-            img_np = np.array(img)
-            img_bgr = img_np[:, :, ::-1]  # RGB to BGR
+            # (Re)allocate frame buffers for this size (I420: Y plane + U/V quarter planes)
+            shape = (height * 3 // 2, width)
+            if self._frame_bufs is None or self._frame_bufs[0].shape != shape:
+                self._frame_bufs = [np.empty(shape, dtype=np.uint8) for _ in range(3)]
+            
+            # Pick a buffer the sender can't be reading
+            with self.frame_cv:
+                frame = next(buf for buf in self._frame_bufs
+                             if buf is not self.last_frame and buf is not self._in_flight)
+            
+            # RGB -> YUV420 for ffmpeg in one pass, straight into the free buffer
+            rgb_to_yuv420(pixels, dst=frame, bgr=bgr)
             
-            # Store frame bytes for sender thread
-            with self.frame_lock:
-                self.last_frame = img_bgr.tobytes()
+            # Unchanged frame - the sender's keep-alive already repeats it
+            frame_hash = _frame_hash(frame)
+            if frame_hash == self._last_hash:
+                return
+            self._last_hash = frame_hash
             
-            app_logger.debug(f"RTSP frame updated: {new_size}")
+            # Swap it in for the sender thread
+            with self.frame_cv:
+                self.last_frame = frame
+                self._frame_seq += 1
+                self.frame_cv.notify()
             
         except Exception as e:
             app_logger.error(f"Error updating RTSP frame: {e}")
@@ -232,13 +323,7 @@ class RTSPStreamServer:
             # Start new process with updated frame size
             if was_running:
                 cmd = self._build_ffmpeg_command()
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    bufsize=10**8
-                )
+                self._spawn_ffmpeg(cmd)
                 app_logger.info("RTSP ffmpeg restarted with new frame size")
         except Exception as e:
             app_logger.error(f"Error restarting RTSP ffmpeg: {e}")
@@ -0,0 +1,186 @@
+"""
+Test watch directory cleanup
+"""
+import pytest
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from services.cleanup import (
+    walk_and_size, delete_oldest_files, delete_oldest_sessions, run_cleanup
+)
+
+
+def make_file(path, size, age_hours):
+    """Create a file of size bytes whose mtime is age_hours in the past"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'\0' * size)
+    mtime = time.time() - age_hours * 3600
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def set_dir_age(path, age_hours):
+    """Backdate a directory's mtime (after its files were created)"""
+    mtime = time.time() - age_hours * 3600
+    os.utime(path, (mtime, mtime))
+
+
+class TestWalkAndSize:
+    """Test directory scanning"""
+    
+    def test_lists_nested_files_with_total(self, temp_dir):
+        """Test every nested file is listed and sizes add up"""
+        a = make_file(os.path.join(temp_dir, 'a.jpg'), 100, 1)
+        b = make_file(os.path.join(temp_dir, 'night1', 'b.jpg'), 200, 2)
+        c = make_file(os.path.join(temp_dir, 'night1', 'raw', 'c.fits'), 300, 3)
+        
+        files, total = walk_and_size(temp_dir)
+        
+        assert sorted(path for path, _, _ in files) == sorted([a, b, c])
+        assert total == 600
+        sizes = {path: size for path, _, size in files}
+        assert sizes[c] == 300
+    
+    def test_empty_and_missing_directory(self, temp_dir):
+        """Test empty and missing directories report nothing"""
+        assert walk_and_size(temp_dir) == ([], 0)
+        assert walk_and_size(os.path.join(temp_dir, 'missing')) == ([], 0)
+    
+    def test_symlinked_directory_not_listed(self, temp_dir):
+        """Test symlinked directories are neither followed nor listed as files"""
+        target = os.path.join(temp_dir, 'elsewhere')
+        make_file(os.path.join(target, 'keep.jpg'), 100, 1)
+        watch = os.path.join(temp_dir, 'watch')
+        make_file(os.path.join(watch, 'a.jpg'), 100, 1)
+        try:
+            os.symlink(target, os.path.join(watch, 'link'), target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not permitted on this system")
+        
+        files, total = walk_and_size(watch)
+        
+        assert [os.path.basename(path) for path, _, _ in files] == ['a.jpg']
+        assert total == 100
+
+
+class TestDeleteOldestFiles:
+    """Test the oldest-files cleanup strategy"""
+    
+    def test_deletes_oldest_until_under_limit(self, temp_dir):
+        """Test files are removed oldest first, stopping once under the limit"""
+        paths = [
+            make_file(os.path.join(temp_dir, 'session', f'img_{age}.jpg'), 100, age)
+            for age in range(10)  # age 0 = newest
+        ]
+        
+        deleted = delete_oldest_files(temp_dir, 650)
+        
+        assert deleted == 4
+        remaining = {path for path, _, _ in walk_and_size(temp_dir)[0]}
+        assert remaining == set(paths[:6])
+        assert os.path.isdir(os.path.join(temp_dir, 'session'))
+    
+    def test_no_deletion_under_limit(self, temp_dir):
+        """Test nothing is deleted when already under the limit"""
+        make_file(os.path.join(temp_dir, 'a.jpg'), 100, 1)
+        
+        assert delete_oldest_files(temp_dir, 1000) == 0
+        assert os.path.exists(os.path.join(temp_dir, 'a.jpg'))
+    
+    def test_reuses_precomputed_walk(self, temp_dir):
+        """Test a walk_and_size result can be passed in"""
+        old = make_file(os.path.join(temp_dir, 'old.jpg'), 500, 5)
+        new = make_file(os.path.join(temp_dir, 'new.jpg'), 500, 1)
+        files, total = walk_and_size(temp_dir)
+        
+        assert delete_oldest_files(temp_dir, 600, files, total) == 1
+        assert not os.path.exists(old)
+        assert os.path.exists(new)
+    
+    def test_skips_files_already_gone(self, temp_dir):
+        """Test a file deleted between walk and cleanup still counts as freed"""
+        gone = make_file(os.path.join(temp_dir, 'gone.jpg'), 500, 5)
+        keep = make_file(os.path.join(temp_dir, 'keep.jpg'), 500, 1)
+        files, total = walk_and_size(temp_dir)
+        os.remove(gone)
+        
+        assert delete_oldest_files(temp_dir, 600, files, total) == 0
+        assert os.path.exists(keep)
+
+
+class TestDeleteOldestSessions:
+    """Test the oldest-sessions cleanup strategy"""
+    
+    def test_oldest_session_emptied_first(self, temp_dir):
+        """Test files are deleted from the oldest session before newer ones"""
+        oldest = [make_file(os.path.join(temp_dir, 'night1', f'{i}.jpg'), 100, 30) for i in range(3)]
+        middle = [make_file(os.path.join(temp_dir, 'night2', f'{i}.jpg'), 100, 20) for i in range(3)]
+        latest = [make_file(os.path.join(temp_dir, 'night3', f'{i}.jpg'), 100, 10) for i in range(3)]
+        set_dir_age(os.path.join(temp_dir, 'night1'), 30)
+        set_dir_age(os.path.join(temp_dir, 'night2'), 20)
+        set_dir_age(os.path.join(temp_dir, 'night3'), 10)
+        
+        deleted = delete_oldest_sessions(temp_dir, 500)
+        
+        assert deleted == 4
+        assert not any(os.path.exists(path) for path in oldest)
+        assert sum(os.path.exists(path) for path in middle) == 2
+        assert all(os.path.exists(path) for path in latest)
+        assert os.path.isdir(os.path.join(temp_dir, 'night1'))
+    
+    def test_latest_session_never_touched(self, temp_dir):
+        """Test the newest session survives even if still over the limit"""
+        make_file(os.path.join(temp_dir, 'night1', 'a.jpg'), 100, 20)
+        latest = make_file(os.path.join(temp_dir, 'night2', 'b.jpg'), 1000, 10)
+        set_dir_age(os.path.join(temp_dir, 'night1'), 20)
+        set_dir_age(os.path.join(temp_dir, 'night2'), 10)
+        
+        assert delete_oldest_sessions(temp_dir, 500) == 1
+        assert os.path.exists(latest)
+    
+    def test_single_session_kept(self, temp_dir):
+        """Test a lone session folder is never cleaned"""
+        only = make_file(os.path.join(temp_dir, 'night1', 'a.jpg'), 1000, 10)
+        
+        assert delete_oldest_sessions(temp_dir, 100) == 0
+        assert os.path.exists(only)
+
+
+class TestRunCleanup:
+    """Test cleanup entry point"""
+    
+    def test_disabled(self, temp_dir):
+        """Test nothing happens when cleanup is disabled"""
+        success, message = run_cleanup({'cleanup_enabled': False, 'watch_directory': temp_dir})
+        
+        assert success
+        assert 'not enabled' in message
+    
+    def test_under_limit(self, temp_dir):
+        """Test directories under the limit are left alone"""
+        path = make_file(os.path.join(temp_dir, 'a.jpg'), 100, 1)
+        config = {
+            'cleanup_enabled': True,
+            'watch_directory': temp_dir,
+            'cleanup_max_size_gb': 1,
+        }
+        
+        success, message = run_cleanup(config)
+        
+        assert success
+        assert 'under limit' in message
+        assert os.path.exists(path)
+    
+    def test_invalid_watch_directory(self, temp_dir):
+        """Test a missing watch directory is reported"""
+        config = {'cleanup_enabled': True, 'watch_directory': os.path.join(temp_dir, 'missing')}
+        
+        success, message = run_cleanup(config)
+        
+        assert not success
@@ -0,0 +1,124 @@
+"""
+Test colour conversion backend
+"""
+import pytest
+import numpy as np
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from services import img_backend
+
+
+@pytest.fixture
+def rgb_image():
+    """Random RGB image made of flat 2x2 blocks, so chroma subsampling is exact"""
+    rng = np.random.default_rng(42)
+    blocks = rng.integers(0, 256, size=(24, 32, 3), dtype=np.uint8)
+    return np.ascontiguousarray(blocks.repeat(2, axis=0).repeat(2, axis=1))
+
+
+@pytest.fixture
+def numpy_backend(monkeypatch):
+    """Force the numpy fallback regardless of cv2 availability"""
+    monkeypatch.setattr(img_backend, 'CV2_AVAILABLE', False)
+
+
+class TestNumpyFallback:
+    """Test the numpy conversions without OpenCV"""
+    
+    def test_yuv420_shape_and_dtype(self, rgb_image, numpy_backend):
+        """Test I420 output layout"""
+        h, w = rgb_image.shape[:2]
+        yuv = img_backend.rgb_to_yuv420(rgb_image)
+        
+        assert yuv.shape == (h * 3 // 2, w)
+        assert yuv.dtype == np.uint8
+    
+    def test_yuv420_reuses_dst(self, rgb_image, numpy_backend):
+        """Test the preallocated buffer is written in place"""
+        h, w = rgb_image.shape[:2]
+        dst = np.zeros((h * 3 // 2, w), dtype=np.uint8)
+        
+        result = img_backend.rgb_to_yuv420(rgb_image, dst=dst)
+        
+        assert result is dst
+        assert np.array_equal(dst, img_backend.rgb_to_yuv420(rgb_image))
+    
+    def test_yuv420_bgr_flag(self, rgb_image, numpy_backend):
+        """Test BGR input with bgr=True matches the RGB conversion"""
+        bgr = np.ascontiguousarray(rgb_image[:, :, ::-1])
+        
+        assert np.array_equal(
+            img_backend.rgb_to_yuv420(bgr, bgr=True),
+            img_backend.rgb_to_yuv420(rgb_image),
+        )
+    
+    def test_yuv420_known_colours(self, numpy_backend):
+        """Test limited-range values for black, white and grey"""
+        for value, expected_y in ((0, 16), (255, 235), (128, 126)):
+            image = np.full((4, 4, 3), value, dtype=np.uint8)
+            yuv = img_backend.rgb_to_yuv420(image).astype(int)
+            
+            assert np.all(np.abs(yuv[:4] - expected_y) <= 1)
+            assert np.all(np.abs(yuv[4:] - 128) <= 1)
+    
+    def test_rgb_to_bgr(self, rgb_image, numpy_backend):
+        """Test channel swap"""
+        assert np.array_equal(img_backend.rgb_to_bgr(rgb_image), rgb_image[:, :, ::-1])
+    
+    def test_rgb_to_gray_reuses_dst(self, rgb_image, numpy_backend):
+        """Test grayscale written into a preallocated buffer"""
+        dst = np.zeros(rgb_image.shape[:2], dtype=np.uint8)
+        
+        assert img_backend.rgb_to_gray(rgb_image, dst=dst) is dst
+
+
+class TestFallbackMatchesOpenCV:
+    """Test the numpy fallback agrees with the OpenCV path"""
+    
+    @pytest.fixture(autouse=True)
+    def require_cv2(self):
+        pytest.importorskip('cv2')
+        if not img_backend.CV2_AVAILABLE:
+            pytest.skip("OpenCV backend not active")
+    
+    def _both(self, monkeypatch, func, *args, **kwargs):
+        expected = func(*args, **kwargs)
+        monkeypatch.setattr(img_backend, 'CV2_AVAILABLE', False)
+        actual = func(*args, **kwargs)
+        monkeypatch.undo()
+        return expected.astype(int), actual.astype(int)
+    
+    def test_yuv420(self, rgb_image, monkeypatch):
+        """Test Y within 1 and chroma within 2 of OpenCV's I420"""
+        h = rgb_image.shape[0]
+        expected, actual = self._both(monkeypatch, img_backend.rgb_to_yuv420, rgb_image)
+        
+        assert actual.shape == expected.shape
+        assert np.abs(actual[:h] - expected[:h]).max() <= 1
+        assert np.abs(actual[h:] - expected[h:]).max() <= 2
+    
+    def test_yuv420_bgr(self, rgb_image, monkeypatch):
+        """Test the BGR path against OpenCV's BGR conversion"""
+        h = rgb_image.shape[0]
+        bgr = np.ascontiguousarray(rgb_image[:, :, ::-1])
+        expected, actual = self._both(monkeypatch, img_backend.rgb_to_yuv420, bgr, bgr=True)
+        
+        assert np.abs(actual[:h] - expected[:h]).max() <= 1
+        assert np.abs(actual[h:] - expected[h:]).max() <= 2
+    
+    def test_gray(self, rgb_image, monkeypatch):
+        """Test grayscale within 1 of OpenCV"""
+        expected, actual = self._both(monkeypatch, img_backend.rgb_to_gray, rgb_image)
+        
+        assert np.abs(actual - expected).max() <= 1
+    
+    def test_bgr(self, rgb_image, monkeypatch):
+        """Test channel swap matches OpenCV exactly"""
+        expected, actual = self._both(monkeypatch, img_backend.rgb_to_bgr, rgb_image)
+        
+        assert np.array_equal(actual, expected)
@@ -16,6 +16,15 @@ from services.web_output import WebOutputServer, ImageHTTPHandler
 from PIL import Image
 
 
+@pytest.fixture(scope='module')
+def sample_jpeg():
+    """Sample image pre-encoded as JPEG once, so tests measure serving rather than encoding"""
+    img = Image.new('RGB', (640, 480), color=(100, 100, 100))
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='JPEG', quality=85)
+    return img_bytes.getvalue()
+
+
 class TestWebServerBasic:
     """Test basic web server functionality"""
     
@@ -64,19 +73,14 @@ class TestWebServerBasic:
 class TestWebServerImage:
     """Test image serving functionality"""
     
-    def test_serve_image(self, sample_image):
+    def test_serve_image(self, sample_jpeg):
         """Test that server serves image correctly"""
         server = WebOutputServer(host='127.0.0.1', port=18083, image_path='/image')
         server.start()
         
         try:
-            # Convert image to bytes
-            img_bytes = io.BytesIO()
-            sample_image.save(img_bytes, format='JPEG')
-            img_data = img_bytes.getvalue()
-            
             # Update server with image
-            server.update_image("test.jpg", img_data, content_type='image/jpeg')
+            server.update_image("test.jpg", sample_jpeg, content_type='image/jpeg')
             
             # Give server time to process
             time.sleep(0.2)
@@ -129,15 +133,13 @@ class TestWebServerImage:
         finally:
             server.stop()
     
-    def test_etag_caching(self, sample_image):
+    def test_etag_caching(self, sample_jpeg):
         """Test ETag-based caching works"""
         server = WebOutputServer(host='127.0.0.1', port=18086)
         server.start()
         
         try:
-            img_bytes = io.BytesIO()
-            sample_image.save(img_bytes, format='JPEG')
-            server.update_image("test.jpg", img_bytes.getvalue())
+            server.update_image("test.jpg", sample_jpeg)
             time.sleep(0.2)
             
             # First request - should get image
@@ -181,18 +183,15 @@ class TestWebServerStatus:
         finally:
             server.stop()
     
-    def test_status_tracks_image_count(self, sample_image):
+    def test_status_tracks_image_count(self, sample_jpeg):
         """Test status endpoint tracks served images"""
         server = WebOutputServer(host='127.0.0.1', port=18088, status_path='/status')
         server.start()
         
         try:
-            img_bytes = io.BytesIO()
-            sample_image.save(img_bytes, format='JPEG')
-            
-            # Update image multiple times
+            # Update image multiple times, reusing the same encoded bytes
             for i in range(3):
-                server.update_image(f"test_{i}.jpg", img_bytes.getvalue())
+                server.update_image(f"test_{i}.jpg", sample_jpeg)
             
             time.sleep(0.2)
             response = requests.get(server.get_status_url(), timeout=5)
@@ -76,22 +76,8 @@ def compute_moon_context():
         illumination = (1 - abs(phase_value - 14) / 14) * 100
         
         # Determine phase name
-        if phase_value < 1:
-            phase_name = 'new_moon'
-        elif phase_value < 7:
-            phase_name = 'waxing_crescent'
-        elif phase_value < 8:
-            phase_name = 'first_quarter'
-        elif phase_value < 14:
-            phase_name = 'waxing_gibbous'
-        elif phase_value < 15:
-            phase_name = 'full_moon'
-        elif phase_value < 21:
-            phase_name = 'waning_gibbous'
-        elif phase_value < 22:
-            phase_name = 'last_quarter'
-        else:
-            phase_name = 'waning_crescent'
+        from ml.schema import phase_name_of
+        phase_name = phase_name_of(phase_value)
         
         result = {
             'available': True,
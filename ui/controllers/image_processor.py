@@ -225,7 +225,7 @@ class ImageProcessorWorker(QThread):
                 try:
                     ml_service = get_ml_service()
                     if not ml_service.is_available():
-                        ml_service.initialize()
+                        ml_service.initialize(use_int8=ml_config.get('use_int8', False))
                     
                     if ml_service.is_available():
                         # Get ML predictions formatted for overlay tokens
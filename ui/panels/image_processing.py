@@ -495,7 +495,8 @@ class ImageProcessingPanel(QScrollArea):
         try:
             from services.ml_service import get_ml_service
             ml = get_ml_service()
-            ml.initialize()
+            ml_config = self.main_window.config.get('ml_models', {})
+            ml.initialize(use_int8=ml_config.get('use_int8', False))
             
             status = ml.get_status()
             roof_ok = status['roof_classifier']['available']
@@ -4,6 +4,7 @@ Resolves paths correctly whether running from source or as bundled EXE
 """
 import os
 import sys
+from functools import lru_cache
 
 # Import app configuration for centralized naming
 try:
@@ -12,6 +13,10 @@ except ImportError:
     APP_DATA_FOLDER = "PFRSentinel"  # Fallback
 
 
+# The resolved paths are fixed for the life of the process, so the getters
+# below are memoized (directories are created on the first call only).
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller
@@ -32,6 +37,7 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+@lru_cache(maxsize=None)
 def get_app_data_dir():
     r"""
     Get application data directory (for logs, user config, etc.)
@@ -56,6 +62,7 @@ def get_app_data_dir():
     return app_dir
 
 
+@lru_cache(maxsize=None)
 def get_log_dir():
     r"""
     Get log directory path